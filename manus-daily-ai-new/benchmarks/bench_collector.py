@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+수집기 오프라인 벤치마크
+합성 데이터를 서빙하는 로컬 리플레이 서버에 대해 스토리 수집 처리량을 동시 요청 수별로 측정합니다.
+--pipeline을 지정하면 수집한 스토리로 저장, 처리, 리포트 생성까지 실행해 단계별 소요 시간도 측정합니다.
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# scripts 디렉토리의 모듈 사용
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+import hn_api
+from hn_client import configure_client
+from hn_replay_server import ReplayServer, ReplayConfig, generate_synthetic_data, DEFAULT_PORT
+from rate_limiter import AdaptiveRateLimiter
+
+def run_collection(concurrency, args):
+    """
+    새 HTTP 클라이언트로 한 번 수집하고 소요 시간과 클라이언트 통계를 반환합니다.
+    
+    Args:
+        concurrency (int): 아이템 동시 요청 수
+        args (argparse.Namespace): 벤치마크 설정
+    
+    Returns:
+        tuple: (소요 시간(초), 채택한 스토리 수, 클라이언트 통계)
+    """
+    limiter = AdaptiveRateLimiter(rate=args.rate, burst=args.rate, max_rate=args.rate)
+    client = configure_client(pool_size=max(concurrency, 1), rate_limiter=limiter, backoff_factor=0.05)
+    
+    start = time.perf_counter()
+    stories = hn_api.fetch_ai_startup_stories(
+        story_types=['top', 'new', 'show'],
+        limit_per_type=args.limit,
+        max_stories=args.limit * 3,
+        concurrency=concurrency,
+        use_cache=False
+    )
+    elapsed = time.perf_counter() - start
+    
+    return elapsed, len(stories), client.get_stats(), stories
+
+def run_pipeline(stories):
+    """
+    수집한 스토리를 저장소에 넣고 처리와 리포트 생성을 실행해 단계별 소요 시간을 반환합니다.
+    저장소, 유사 중복 인덱스, 처리 결과, 리포트는 모두 리플레이 서버별 경로를 사용하므로 실제 데이터와 섞이지 않습니다.
+    
+    Args:
+        stories (list): 수집한 스토리
+    
+    Returns:
+        list: (단계 이름, 소요 시간(초)) 목록
+    """
+    # 처리 결과 경로는 모듈을 불러올 때 HN_API_BASE로 정해지므로 set_api_base() 뒤에 불러옴
+    import data_processor
+    import report_generator
+    from story_store import StoryStore
+    
+    timings = []
+    
+    start = time.perf_counter()
+    with StoryStore() as store:
+        store.upsert(stories)
+    timings.append(('store', time.perf_counter() - start))
+    
+    start = time.perf_counter()
+    data_processor.process_latest_data()
+    timings.append(('process', time.perf_counter() - start))
+    
+    start = time.perf_counter()
+    report_generator.create_report()
+    timings.append(('report', time.perf_counter() - start))
+    
+    return timings
+
+def main():
+    parser = argparse.ArgumentParser(description="수집기 오프라인 벤치마크")
+    parser.add_argument("--stories", type=int, default=1000, help="합성 스토리 수")
+    parser.add_argument("--limit", type=int, default=200, help="목록별로 가져올 스토리 수")
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="응답 지연 평균(밀리초)")
+    parser.add_argument("--jitter-ms", type=float, default=10.0, help="응답 지연 편차(밀리초)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="500 응답 비율")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="429 응답 비율")
+    parser.add_argument("--rate", type=float, default=1000.0, help="속도 제한기 속도 (초당 요청 수)")
+    parser.add_argument("--concurrency", type=int, nargs='+', default=[1, 4, 16, 32],
+                        help="측정할 동시 요청 수 목록 (1이 직렬 기준)")
+    parser.add_argument("--seed", type=int, default=42, help="난수 시드")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT,
+                        help="리플레이 서버 포트 (서버별 저장소/처리 결과 경로가 포트에 따라 정해짐)")
+    parser.add_argument("--pipeline", action="store_true",
+                        help="마지막 수집 결과로 저장, 처리, 리포트 생성까지 실행해 단계별 시간 측정")
+    args = parser.parse_args()
+    
+    data = generate_synthetic_data(num_stories=args.stories, comments_per_story=0, seed=args.seed)
+    config = ReplayConfig(args.latency_ms, args.jitter_ms, args.error_rate, args.throttle_rate,
+                          retry_after=0.1, seed=args.seed)
+    
+    with ReplayServer(data, config, port=args.port) as server:
+        hn_api.set_api_base(server.base_url)
+        print(f"Replay server: {server.base_url} ({len(data['items'])} items, "
+              f"latency {args.latency_ms}±{args.jitter_ms}ms, errors {args.error_rate:.0%}, "
+              f"throttles {args.throttle_rate:.0%})")
+        
+        results = []
+        for concurrency in args.concurrency:
+            elapsed, accepted, stats, stories = run_collection(concurrency, args)
+            results.append((concurrency, elapsed, accepted, stats))
+        
+        pipeline_timings = run_pipeline(stories) if args.pipeline else []
+        
+        print(f"Server responses by status: {dict(sorted(server.stats.items()))}")
+    
+    baseline = results[0][1]
+    print()
+    print(f"{'concurrency':>11} {'seconds':>8} {'req/s':>8} {'speedup':>8} {'accepted':>8} "
+          f"{'conns':>6} {'retries':>7} {'failures':>8}")
+    for concurrency, elapsed, accepted, stats in results:
+        print(f"{concurrency:>11} {elapsed:>8.2f} {stats['requests'] / elapsed:>8.1f} "
+              f"{baseline / elapsed:>7.2f}x {accepted:>8} {stats['connections_opened']:>6} "
+              f"{stats['retries']:>7} {stats['failures']:>8}")
+    
+    if pipeline_timings:
+        print()
+        collect_seconds = results[-1][1]
+        for stage, seconds in [('collect', collect_seconds)] + pipeline_timings:
+            print(f"{stage:>11} {seconds:>8.2f}")
+        print(f"{'total':>11} {collect_seconds + sum(seconds for _, seconds in pipeline_timings):>8.2f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+DataFrame 변환 벤치마크
+행마다 딕셔너리를 만들던 기존 convert_to_dataframe과 컬럼 단위 변환을 합성 스토리에서 비교합니다.
+"""
+
+import argparse
+import datetime
+import random
+import sys
+import time
+from pathlib import Path
+
+import pandas as pd
+
+# scripts 디렉토리의 모듈 사용
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from data_processor import convert_to_dataframe
+
+# 합성 스토리에 사용할 값
+TITLE_WORDS = ['ai', 'startup', 'launch', 'open', 'source', 'model', 'agent', 'database', 'rust', 'funding',
+               'series', 'seed', 'gpu', 'inference', 'tool', 'release', 'show', 'hn', 'ask', 'why']
+DOMAINS = ['github.com', 'techcrunch.com', 'arxiv.org', 'openai.com', 'example.com', 'medium.com']
+TYPES = ['story', 'story', 'story', 'job', 'poll']
+
+def legacy_convert_to_dataframe(stories):
+    """
+    기존 구현: 스토리마다 딕셔너리를 만들고 시간을 행마다 변환하며 kids 목록을 그대로 둡니다.
+    """
+    processed_stories = []
+    
+    for story in stories:
+        processed_stories.append({
+            'id': story.get('id'),
+            'title': story.get('title', ''),
+            'url': story.get('url', ''),
+            'text': story.get('text', ''),
+            'score': story.get('score', 0),
+            'by': story.get('by', ''),
+            'time': datetime.datetime.fromtimestamp(story.get('time', 0)),
+            'descendants': story.get('descendants', 0),
+            'type': story.get('type', ''),
+            'kids': story.get('kids', []),
+            'collected_at': story.get('collected_at', '')
+        })
+    
+    df = pd.DataFrame(processed_stories)
+    df['date'] = df['time'].dt.date
+    df['hour'] = df['time'].dt.hour
+    df['day_of_week'] = df['time'].dt.day_name()
+    return df
+
+def generate_stories(size, seed):
+    """
+    합성 스토리 목록을 생성합니다.
+    
+    Args:
+        size (int): 생성할 스토리 수
+        seed (int): 난수 시드
+    
+    Returns:
+        list: 스토리 목록
+    """
+    rng = random.Random(seed)
+    authors = [f"user{index}" for index in range(max(1, size // 20))]
+    start = int(time.time()) - 365 * 24 * 3600
+    stories = []
+    
+    for index in range(size):
+        kids_count = rng.randint(0, 60)
+        stories.append({
+            'id': 40000000 + index,
+            'title': ' '.join(rng.choices(TITLE_WORDS, k=rng.randint(4, 10))).capitalize(),
+            'url': f"https://{rng.choice(DOMAINS)}/{index}",
+            'score': rng.randint(1, 800),
+            'by': rng.choice(authors),
+            'time': start + rng.randrange(365 * 24 * 3600),
+            'descendants': kids_count * 3,
+            'type': rng.choice(TYPES),
+            'kids': [50000000 + index * 100 + kid for kid in range(kids_count)],
+            'collected_at': datetime.datetime.now().isoformat()
+        })
+    
+    return stories
+
+def run_benchmark(name, func, stories, repeat):
+    """
+    변환 함수를 repeat번 실행하고 최소 소요 시간과 결과 DataFrame의 메모리 사용량을 출력합니다.
+    
+    Returns:
+        tuple: (최소 소요 시간, 마지막 결과 DataFrame)
+    """
+    best = float('inf')
+    df = None
+    
+    for _ in range(repeat):
+        start = time.perf_counter()
+        df = func(stories)
+        best = min(best, time.perf_counter() - start)
+    
+    memory = df.memory_usage(deep=True).sum() / 1_000_000
+    print(f"{name:<10} {best:8.3f}s  {len(stories) / best:12,.0f} stories/s  {memory:9.1f} MB")
+    return best, df
+
+def main():
+    parser = argparse.ArgumentParser(description="DataFrame 변환 벤치마크")
+    parser.add_argument("--sizes", type=int, nargs='+', default=[100000, 1000000], help="합성 스토리 수 목록")
+    parser.add_argument("--repeat", type=int, default=3, help="반복 횟수")
+    parser.add_argument("--seed", type=int, default=42, help="난수 시드")
+    args = parser.parse_args()
+    
+    for size in args.sizes:
+        stories = generate_stories(size, args.seed)
+        print(f"{size:,} stories")
+        
+        legacy_time, legacy_df = run_benchmark("legacy", legacy_convert_to_dataframe, stories, args.repeat)
+        columnar_time, columnar_df = run_benchmark("columnar", convert_to_dataframe, stories, args.repeat)
+        
+        # 두 구현이 같은 시간/개수를 만드는지 확인
+        assert (legacy_df['time'].values == columnar_df['time'].values).all()
+        assert (legacy_df['kids'].str.len().values == columnar_df['kids_count'].values).all()
+        
+        print(f"Speedup: {legacy_time / columnar_time:.2f}x")
+
+if __name__ == "__main__":
+    main()
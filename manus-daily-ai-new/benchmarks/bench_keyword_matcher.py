@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+키워드 매칭 마이크로 벤치마크
+기존의 키워드별 부분 문자열 검사와 단어 트라이 매처를 합성 코퍼스에서 비교합니다.
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+# scripts 디렉토리의 모듈 사용
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from hn_api import AI_KEYWORDS, STARTUP_KEYWORDS, KEYWORD_MATCHER
+
+# 합성 제목에 사용할 일반 단어 (키워드를 부분 문자열로 포함하는 단어 포함)
+FILLER_WORDS = [
+    'rust', 'database', 'email', 'mail', 'html', 'xml', 'browser', 'kernel', 'linux', 'design',
+    'paint', 'training', 'detail', 'domain', 'explain', 'chain', 'storage', 'compiler', 'small',
+    'html5', 'url', 'world', 'curl', 'fragment', 'garage', 'drag', 'email', 'again', 'certain',
+    'history', 'physics', 'open', 'source', 'release', 'version', 'tool', 'guide', 'why', 'how'
+]
+
+def legacy_is_related(text):
+    """
+    기존 구현: 키워드마다 부분 문자열 검사를 수행합니다.
+    """
+    text = text.lower()
+    return any(keyword in text for keyword in AI_KEYWORDS) or \
+        any(keyword in text for keyword in STARTUP_KEYWORDS)
+
+def legacy_matched(text):
+    """
+    기존 방식으로 매칭된 키워드 목록까지 구할 때 (키워드 수만큼 검사)
+    """
+    text = text.lower()
+    return [keyword for keyword in AI_KEYWORDS + STARTUP_KEYWORDS if keyword in text]
+
+def matcher_is_related(text):
+    """
+    새 구현: 컴파일된 단어 트라이로 한 번만 검사합니다.
+    """
+    return KEYWORD_MATCHER.matches(text)
+
+def matcher_matched(text):
+    """
+    새 구현으로 매칭된 키워드 목록 구하기
+    """
+    return KEYWORD_MATCHER.find(text)
+
+def generate_corpus(size, keyword_rate, seed):
+    """
+    합성 스토리 텍스트(제목 + URL)를 생성합니다.
+    
+    Args:
+        size (int): 생성할 텍스트 수
+        keyword_rate (float): 텍스트에 실제 키워드가 들어갈 확률
+        seed (int): 난수 시드
+    
+    Returns:
+        list: 텍스트 목록
+    """
+    rng = random.Random(seed)
+    keywords = AI_KEYWORDS + STARTUP_KEYWORDS
+    corpus = []
+    
+    for _ in range(size):
+        words = rng.choices(FILLER_WORDS, k=rng.randint(5, 12))
+        if rng.random() < keyword_rate:
+            words.insert(rng.randrange(len(words)), rng.choice(keywords))
+        title = ' '.join(words).capitalize()
+        url = f"https://{rng.choice(FILLER_WORDS)}.com/{'-'.join(rng.sample(FILLER_WORDS, 3))}"
+        corpus.append(f"{title}  {url}")
+    
+    return corpus
+
+def run_benchmark(name, func, corpus, repeat):
+    """
+    함수를 코퍼스 전체에 repeat번 실행하고 최소 소요 시간을 측정합니다.
+    
+    Returns:
+        tuple: (최소 소요 시간, 마지막 실행 결과 목록)
+    """
+    best = float('inf')
+    results = None
+    
+    for _ in range(repeat):
+        start = time.perf_counter()
+        results = [func(text) for text in corpus]
+        best = min(best, time.perf_counter() - start)
+    
+    print(f"{name:<28} {best:8.3f}s  {len(corpus) / best:12,.0f} texts/s")
+    return best, results
+
+def main():
+    parser = argparse.ArgumentParser(description="키워드 매칭 마이크로 벤치마크")
+    parser.add_argument("--size", type=int, default=200000, help="합성 텍스트 수")
+    parser.add_argument("--keyword-rate", type=float, default=0.1, help="키워드가 포함될 확률")
+    parser.add_argument("--repeat", type=int, default=3, help="반복 횟수")
+    parser.add_argument("--seed", type=int, default=42, help="난수 시드")
+    args = parser.parse_args()
+    
+    corpus = generate_corpus(args.size, args.keyword_rate, args.seed)
+    print(f"Corpus: {len(corpus):,} texts, {len(AI_KEYWORDS) + len(STARTUP_KEYWORDS)} keywords")
+    
+    legacy_time, legacy_results = run_benchmark("substring (bool)", legacy_is_related, corpus, args.repeat)
+    matcher_time, matcher_results = run_benchmark("token automaton (bool)", matcher_is_related, corpus, args.repeat)
+    run_benchmark("substring (matched list)", legacy_matched, corpus, args.repeat)
+    run_benchmark("token automaton (matched)", matcher_matched, corpus, args.repeat)
+    
+    print(f"Speedup (bool): {legacy_time / matcher_time:.2f}x")
+    print(f"Accepted by substring scan: {sum(legacy_results):,} "
+          f"({sum(legacy_results) / len(corpus):.1%})")
+    print(f"Accepted by word-boundary matcher: {sum(matcher_results):,} "
+          f"({sum(matcher_results) / len(corpus):.1%}, expected ~{args.keyword_rate:.0%})")
+
+if __name__ == "__main__":
+    main()
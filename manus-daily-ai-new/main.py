@@ -41,7 +41,7 @@ def check_dependencies():
         bool: 모든 의존성이 설치되어 있는지 여부
     """
     required_packages = [
-        "requests", "beautifulsoup4", "pandas", "schedule", "jinja2"
+        "requests", "beautifulsoup4", "pandas", "scipy", "schedule", "jinja2"
     ]
     
     missing_packages = []
@@ -68,13 +68,14 @@ def check_dependencies():
     
     return True
 
-def run_script(script_name, timeout=600):
+def run_script(script_name, timeout=600, args=None):
     """
     지정된 스크립트를 실행합니다.
     
     Args:
         script_name (str): 실행할 스크립트 파일 이름
-        timeout (int): 스크립트 실행 제한 시간(초)
+        timeout (int): 스크립트 실행 제한 시간(초), None이면 제한 없음
+        args (list, optional): 스크립트에 전달할 명령행 인수
         
     Returns:
         bool: 성공 여부
@@ -87,10 +88,11 @@ def run_script(script_name, timeout=600):
     
     try:
         logger.info(f"Running script: {script_path}")
-        logger.info(f"This may take several minutes for API requests to complete. Timeout set to {timeout} seconds.")
+        if timeout is not None:
+            logger.info(f"This may take several minutes for API requests to complete. Timeout set to {timeout} seconds.")
         
         result = subprocess.run(
-            [sys.executable, str(script_path)],
+            [sys.executable, str(script_path)] + (args or []),
             capture_output=True,
             text=True,
             check=True,
@@ -173,6 +175,57 @@ def test_full_pipeline():
     logger.info("Full pipeline test completed successfully")
     return True
 
+def run_backfill(start, end=None, shard_size=None, workers=None):
+    """
+    아이템 ID 구간의 과거 데이터를 백필합니다. 오래 걸릴 수 있으므로 제한 시간 없이 실행합니다.
+    
+    Args:
+        start (int): 시작 아이템 ID
+        end (int, optional): 끝 아이템 ID (기본값: 현재 maxitem)
+        shard_size (int, optional): 샤드당 아이템 수
+        workers (int, optional): 동시에 처리할 샤드 수
+    
+    Returns:
+        bool: 성공 여부
+    """
+    logger.info(f"Backfilling items from {start} to {end or 'maxitem'}...")
+    
+    args = ["--start", str(start)]
+    if end is not None:
+        args += ["--end", str(end)]
+    if shard_size is not None:
+        args += ["--shard-size", str(shard_size)]
+    if workers is not None:
+        args += ["--workers", str(workers)]
+    
+    return run_script("backfill.py", timeout=None, args=args)
+
+def run_reprocess(start_date, end_date, workers=None, recluster=False, measure_serial=False):
+    """
+    기간 안의 수집일을 프로세스 풀에서 병렬로 다시 처리합니다. 오래 걸릴 수 있으므로 제한 시간 없이 실행합니다.
+    
+    Args:
+        start_date (str): 시작 수집일 (YYYY-MM-DD)
+        end_date (str): 끝 수집일 (YYYY-MM-DD)
+        workers (int, optional): 작업자 프로세스 수
+        recluster (bool): 기간 안의 스토리 유사 중복 묶음을 다시 부여할지 여부
+        measure_serial (bool): 순차 처리 시간을 재서 속도 향상을 계산할지 여부
+    
+    Returns:
+        bool: 성공 여부
+    """
+    logger.info(f"Reprocessing days from {start_date} to {end_date}...")
+    
+    args = ["--from", start_date, "--to", end_date]
+    if workers is not None:
+        args += ["--workers", str(workers)]
+    if recluster:
+        args.append("--recluster")
+    if measure_serial:
+        args.append("--measure-serial")
+    
+    return run_script("reprocess.py", timeout=None, args=args)
+
 def start_scheduler():
     """
     스케줄러를 시작합니다.
@@ -215,8 +268,17 @@ def main():
     메인 함수: 명령행 인수에 따라 다양한 작업을 실행합니다.
     """
     parser = argparse.ArgumentParser(description="AI 스타트업 동향 트래커")
-    parser.add_argument("command", nargs="?", default="test", choices=["test", "run", "collect", "process", "report", "schedule"],
-                        help="실행할 명령 (test, run, collect, process, report, schedule)")
+    parser.add_argument("command", nargs="?", default="test",
+                        choices=["test", "run", "collect", "process", "report", "schedule", "backfill", "reprocess"],
+                        help="실행할 명령 (test, run, collect, process, report, schedule, backfill, reprocess)")
+    parser.add_argument("--start", type=int, help="backfill: 시작 아이템 ID")
+    parser.add_argument("--end", type=int, help="backfill: 끝 아이템 ID (기본값: 현재 maxitem)")
+    parser.add_argument("--shard-size", type=int, help="backfill: 샤드당 아이템 수")
+    parser.add_argument("--workers", type=int, help="backfill: 동시에 처리할 샤드 수, reprocess: 작업자 프로세스 수")
+    parser.add_argument("--from", dest="from_date", help="reprocess: 시작 수집일 (YYYY-MM-DD)")
+    parser.add_argument("--to", dest="to_date", help="reprocess: 끝 수집일 (YYYY-MM-DD, 기본값: 오늘)")
+    parser.add_argument("--recluster", action="store_true", help="reprocess: 기간 안의 스토리 유사 중복 묶음을 다시 부여")
+    parser.add_argument("--measure-serial", action="store_true", help="reprocess: 순차 처리 시간을 재서 속도 향상을 계산")
     
     args = parser.parse_args()
     
@@ -288,6 +350,31 @@ def main():
             logger.error("Report generation failed")
             return 1
     
+    elif args.command == "backfill":
+        # 과거 데이터 백필
+        if args.start is None:
+            parser.error("backfill requires --start")
+        
+        if run_backfill(args.start, args.end, args.shard_size, args.workers):
+            logger.info("Backfill completed successfully")
+            return 0
+        else:
+            logger.error("Backfill failed")
+            return 1
+    
+    elif args.command == "reprocess":
+        # 기간 안의 수집일 병렬 재처리
+        if args.from_date is None:
+            parser.error("reprocess requires --from")
+        
+        to_date = args.to_date or time.strftime('%Y-%m-%d')
+        if run_reprocess(args.from_date, to_date, args.workers, args.recluster, args.measure_serial):
+            logger.info("Reprocessing completed successfully")
+            return 0
+        else:
+            logger.error("Reprocessing failed")
+            return 1
+    
     elif args.command == "schedule":
         # 스케줄러 시작
         process = start_scheduler()
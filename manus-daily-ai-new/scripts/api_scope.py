@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""
+API 서버별 경로 모듈
+공식 Hacker News API가 아닌 서버(로컬 리플레이 서버 등)에서 수집한 데이터가 실제 데이터와 섞이지 않도록
+저장소, 인덱스, 처리 결과 경로에 서버별 접미사를 붙입니다.
+서버는 HN_API_BASE 환경 변수로 정하므로, 수집기에서 처리/리포트까지 하위 프로세스도 같은 경로를 사용합니다.
+"""
+
+import hashlib
+import os
+from pathlib import Path
+
+# 공식 Hacker News API 기본 URL
+DEFAULT_HN_API_BASE = "https://hacker-news.firebaseio.com/v0"
+
+def current_api_base():
+    """
+    현재 API 기본 URL을 반환합니다. (HN_API_BASE 환경 변수, 없으면 공식 API)
+    """
+    return os.environ.get("HN_API_BASE", DEFAULT_HN_API_BASE).rstrip('/')
+
+def scoped_path(path, api_base=None):
+    """
+    API 서버별 경로를 만듭니다. 공식 API이면 경로를 그대로 반환합니다.
+    
+    Args:
+        path (Path): 공식 API에서 사용하는 파일 또는 디렉토리 경로
+        api_base (str, optional): API 기본 URL (기본값: current_api_base())
+    
+    Returns:
+        Path: 서버별 경로 (예: stories.sqlite3 -> stories_1a2b3c4d.sqlite3)
+    """
+    path = Path(path)
+    api_base = (api_base or current_api_base()).rstrip('/')
+    if api_base == DEFAULT_HN_API_BASE:
+        return path
+    
+    digest = hashlib.sha1(api_base.encode('utf-8')).hexdigest()[:8]
+    return path.with_name(f"{path.stem}_{digest}{path.suffix}")
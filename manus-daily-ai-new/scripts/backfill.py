@@ -0,0 +1,295 @@
+#!/usr/bin/env python3
+"""
+과거 데이터 백필 모듈
+Hacker News 아이템 ID 구간을 샤드로 나눠 여러 작업자가 병렬로 훑으며 AI 스타트업 관련 스토리를 수집합니다.
+샤드마다 진행 위치를 체크포인트로 저장하므로, 중단된 백필은 다시 실행하면 멈춘 곳부터 이어서 진행합니다.
+"""
+
+import argparse
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+
+from hn_api import (
+    DATA_DIR, accept_ai_startup_story, api_scoped_path, fetch_items_concurrently, get_item_details,
+    get_current_cursor, set_api_base
+)
+from collector_metrics import get_metrics, reset_metrics, METRICS_DIR
+from hn_client import configure_client
+from rate_limiter import AdaptiveRateLimiter
+from story_sink import StorySink, iter_ndjson
+from story_store import StoryStore, DEFAULT_STORE_PATH
+
+# 백필 결과와 샤드 체크포인트 저장 위치 (공식 API가 아닌 서버는 backfill_dir()의 서버별 디렉토리 사용)
+BACKFILL_DIR = DATA_DIR / "backfill"
+
+# 기본 백필 설정
+DEFAULT_SHARD_SIZE = 10000
+DEFAULT_WORKERS = 4
+DEFAULT_SHARD_CONCURRENCY = 8
+
+# 이 개수만큼 아이템을 처리할 때마다 샤드 체크포인트 저장
+CHECKPOINT_EVERY = 500
+
+def make_shards(start_id, end_id, shard_size):
+    """
+    아이템 ID 구간을 샤드로 나눕니다.
+    
+    Args:
+        start_id (int): 시작 아이템 ID (포함)
+        end_id (int): 끝 아이템 ID (포함)
+        shard_size (int): 샤드당 아이템 수
+    
+    Returns:
+        list: (샤드 시작 ID, 샤드 끝 ID) 목록 (끝 ID 포함)
+    """
+    return [
+        (shard_start, min(shard_start + shard_size - 1, end_id))
+        for shard_start in range(start_id, end_id + 1, shard_size)
+    ]
+
+def backfill_dir():
+    """
+    현재 API 서버의 백필 디렉토리를 반환합니다. 리플레이 서버에서 끝낸 샤드를 실제 백필이 건너뛰거나
+    리플레이 스토리를 실제 저장소에 넣지 않도록 서버마다 따로 둡니다.
+    
+    Returns:
+        Path: 백필 디렉토리
+    """
+    return api_scoped_path(BACKFILL_DIR)
+
+def shard_paths(shard_start, shard_end):
+    """
+    샤드의 체크포인트 파일과 결과 파일 경로를 반환합니다.
+    
+    Args:
+        shard_start (int): 샤드 시작 ID
+        shard_end (int): 샤드 끝 ID
+    
+    Returns:
+        tuple: (체크포인트 경로, NDJSON 결과 경로)
+    """
+    name = f"shard_{shard_start}_{shard_end}"
+    return backfill_dir() / f"{name}.checkpoint.json", backfill_dir() / f"{name}.ndjson"
+
+def load_shard_checkpoint(shard_start, shard_end):
+    """
+    샤드 체크포인트를 로드합니다. 없으면 처음부터 시작하는 체크포인트를 반환합니다.
+    
+    Args:
+        shard_start (int): 샤드 시작 ID
+        shard_end (int): 샤드 끝 ID
+    
+    Returns:
+        dict: 체크포인트 (next_id, scanned, matched, done)
+    """
+    checkpoint_path, _ = shard_paths(shard_start, shard_end)
+    
+    try:
+        with open(checkpoint_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        pass
+    except (OSError, ValueError) as e:
+        print(f"Error loading shard checkpoint {checkpoint_path}, restarting shard: {e}")
+    
+    return {'start': shard_start, 'end': shard_end, 'next_id': shard_start, 'scanned': 0, 'matched': 0, 'done': False}
+
+def save_shard_checkpoint(checkpoint):
+    """
+    샤드 체크포인트를 원자적으로 저장합니다.
+    
+    Args:
+        checkpoint (dict): 저장할 체크포인트
+    """
+    checkpoint_path, _ = shard_paths(checkpoint['start'], checkpoint['end'])
+    tmp_path = Path(f"{checkpoint_path}.tmp")
+    
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(checkpoint, f)
+    os.replace(tmp_path, checkpoint_path)
+
+def process_shard(shard_start, shard_end, concurrency=DEFAULT_SHARD_CONCURRENCY, checkpoint_every=CHECKPOINT_EVERY):
+    """
+    샤드 하나를 체크포인트 위치부터 끝까지 훑으며 AI 스타트업 관련 스토리를 기록합니다.
+    결과 파일을 디스크에 동기화한 뒤에 체크포인트를 저장하므로, 중단되어도 채택한 스토리를 잃지 않습니다.
+    
+    Args:
+        shard_start (int): 샤드 시작 ID
+        shard_end (int): 샤드 끝 ID
+        concurrency (int): 샤드 안의 아이템 동시 요청 수
+        checkpoint_every (int): 체크포인트 저장 간격 (아이템 수)
+    
+    Returns:
+        dict: 이번 실행에서 처리한 아이템 수, 채택한 스토리 수, 소요 시간
+    """
+    checkpoint = load_shard_checkpoint(shard_start, shard_end)
+    result = {'shard': (shard_start, shard_end), 'scanned': 0, 'matched': 0, 'seconds': 0.0}
+    
+    if checkpoint['done']:
+        return result
+    
+    _, output_path = shard_paths(shard_start, shard_end)
+    start_time = time.monotonic()
+    
+    with StorySink(output_path) as sink:
+        while checkpoint['next_id'] <= shard_end:
+            batch_end = min(checkpoint['next_id'] + checkpoint_every - 1, shard_end)
+            batch = list(range(checkpoint['next_id'], batch_end + 1))
+            matched = 0
+            
+            def on_item(index, item):
+                nonlocal matched
+                # 백필은 댓글/구인 글 등이 대부분이므로 스토리만 채택
+                if accept_ai_startup_story(item, stories_only=True) and sink.write(item):
+                    matched += 1
+            
+            fetch_items_concurrently(batch, concurrency, get_item_details, on_item, show_progress=False)
+            sink.sync()
+            
+            checkpoint['next_id'] = batch_end + 1
+            checkpoint['scanned'] += len(batch)
+            checkpoint['matched'] += matched
+            checkpoint['done'] = checkpoint['next_id'] > shard_end
+            save_shard_checkpoint(checkpoint)
+            
+            result['scanned'] += len(batch)
+            result['matched'] += matched
+    
+    result['seconds'] = time.monotonic() - start_time
+    print(f"Shard {shard_start}-{shard_end} done: {checkpoint['scanned']} items scanned, "
+          f"{checkpoint['matched']} stories matched")
+    return result
+
+def run_backfill(start_id, end_id, shard_size=DEFAULT_SHARD_SIZE, workers=DEFAULT_WORKERS,
+                 concurrency=DEFAULT_SHARD_CONCURRENCY):
+    """
+    아이템 ID 구간을 샤드로 나눠 작업자 풀에서 병렬로 백필하고 작업자별 처리 속도를 출력합니다.
+    
+    Args:
+        start_id (int): 시작 아이템 ID (포함)
+        end_id (int): 끝 아이템 ID (포함)
+        shard_size (int): 샤드당 아이템 수
+        workers (int): 동시에 처리할 샤드 수
+        concurrency (int): 샤드 안의 아이템 동시 요청 수
+    
+    Returns:
+        dict: 작업자 이름 -> {'shards', 'scanned', 'matched', 'seconds'}
+    """
+    backfill_dir().mkdir(parents=True, exist_ok=True)
+    shards = make_shards(start_id, end_id, shard_size)
+    pending = [shard for shard in shards if not load_shard_checkpoint(*shard)['done']]
+    
+    print(f"Backfilling items {start_id}-{end_id}: {len(shards)} shards, {len(pending)} remaining "
+          f"({workers} workers x {concurrency} concurrent requests)")
+    
+    worker_stats = {}
+    stats_lock = threading.Lock()
+    
+    def run_shard(shard):
+        result = process_shard(*shard, concurrency=concurrency)
+        with stats_lock:
+            stats = worker_stats.setdefault(
+                threading.current_thread().name, {'shards': 0, 'scanned': 0, 'matched': 0, 'seconds': 0.0}
+            )
+            stats['shards'] += 1
+            stats['scanned'] += result['scanned']
+            stats['matched'] += result['matched']
+            stats['seconds'] += result['seconds']
+        return result
+    
+    start_time = time.monotonic()
+    
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="backfill") as executor:
+        futures = [executor.submit(run_shard, shard) for shard in pending]
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except Exception as e:
+                # 실패한 샤드는 체크포인트가 남아 있으므로 다음 실행에서 이어서 진행
+                print(f"Shard failed, will resume on next run: {e}")
+    
+    elapsed = time.monotonic() - start_time
+    
+    # 작업자별 처리 속도 출력
+    for name, stats in sorted(worker_stats.items()):
+        rate = stats['scanned'] / stats['seconds'] if stats['seconds'] else 0.0
+        print(f"{name}: {stats['shards']} shards, {stats['scanned']} items, {stats['matched']} matched, "
+              f"{rate:.1f} items/s")
+    
+    total_scanned = sum(stats['scanned'] for stats in worker_stats.values())
+    total_matched = sum(stats['matched'] for stats in worker_stats.values())
+    print(f"Backfill finished in {elapsed:.1f}s: {total_scanned} items scanned, {total_matched} stories matched "
+          f"({total_scanned / elapsed if elapsed else 0.0:.1f} items/s overall)")
+    
+    return worker_stats
+
+def iter_backfill_stories(start_id=None, end_id=None):
+    """
+    백필로 수집한 스토리를 읽어 반환합니다.
+    
+    Args:
+        start_id (int, optional): 이 ID 이상만 반환
+        end_id (int, optional): 이 ID 이하만 반환
+    
+    Yields:
+        dict: 스토리
+    """
+    for path in sorted(backfill_dir().glob("shard_*.ndjson")):
+        for story in iter_ndjson(path):
+            story_id = story.get('id', 0)
+            if (start_id is None or story_id >= start_id) and (end_id is None or story_id <= end_id):
+                yield story
+
+def main():
+    """
+    메인 함수: 지정한 아이템 ID 구간을 백필합니다.
+    """
+    parser = argparse.ArgumentParser(description="Hacker News 아이템 ID 구간 백필")
+    parser.add_argument("--start", type=int, required=True, help="시작 아이템 ID (포함)")
+    parser.add_argument("--end", type=int, default=None, help="끝 아이템 ID (포함, 기본값: 현재 maxitem)")
+    parser.add_argument("--shard-size", type=int, default=DEFAULT_SHARD_SIZE, help="샤드당 아이템 수")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="동시에 처리할 샤드 수")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_SHARD_CONCURRENCY,
+                        help="샤드 안의 아이템 동시 요청 수")
+    parser.add_argument("--rate", type=float, default=None,
+                        help="초당 최대 요청 수 (기본값: 수집기와 같은 적응형 속도 제한)")
+    parser.add_argument("--api-base", default=None, help="Hacker News API 기본 URL")
+    args = parser.parse_args()
+    
+    if args.api_base:
+        set_api_base(args.api_base)
+    
+    # 모든 작업자의 요청이 연결을 재사용할 수 있도록 커넥션 풀 크기 조정
+    rate_limiter = AdaptiveRateLimiter(rate=args.rate, max_rate=args.rate) if args.rate else None
+    client = configure_client(pool_size=args.workers * args.concurrency, rate_limiter=rate_limiter)
+    reset_metrics('backfill')
+    
+    end_id = args.end
+    if end_id is None:
+        cursor = get_current_cursor()
+        if cursor is None:
+            print("Could not read maxitem, pass --end explicitly")
+            return 1
+        end_id = cursor['max_item']
+    
+    if end_id < args.start:
+        print(f"Invalid range: {args.start}-{end_id}")
+        return 1
+    
+    run_backfill(args.start, end_id, args.shard_size, args.workers, args.concurrency)
+    
+    # 백필한 스토리를 저장소에 추가 (작성일을 수집일로 기록해 기간 분석과 키워드 급상승 기준선에 포함)
+    with StoryStore(api_scoped_path(DEFAULT_STORE_PATH)) as store:
+        count = store.upsert(iter_backfill_stories(args.start, end_id), date_from_time=True)
+        print(f"Saved {count} backfilled stories to {store.path}")
+    
+    summary_path = get_metrics().save(api_scoped_path(METRICS_DIR), extra={'http_client': client.get_stats()})
+    print(f"Saved collector metrics to {summary_path}")
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
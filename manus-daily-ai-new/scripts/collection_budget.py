@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+수집 예산 모듈
+시간 예산과 요청 예산 안에서 수집을 진행하고, 기대 수확량이 높은 후보부터 가져오도록 우선순위를 정합니다.
+"""
+
+import json
+import os
+import time
+from pathlib import Path
+
+# 기본 경로 설정
+BASE_DIR = Path(__file__).parent.parent
+DATA_DIR = BASE_DIR / "data"
+SOURCE_YIELD_FILE = DATA_DIR / "source_yield.json"
+
+# 목록별 적중률의 사전값 (기록이 적은 목록도 0이나 1로 치우치지 않도록 보정)
+PRIOR_FETCHED = 10
+PRIOR_ACCEPTED = 2
+
+# 우선순위 가중치가 절반이 되는 목록 순위 (가중치는 30 / (30 + 순위)로 쌍곡선 감소: 순위 30에서 1/2, 60에서 1/3, 90에서 1/4)
+RANK_HALF_WEIGHT = 30
+
+# 캐시에 있는 아이템의 상대 요청 비용 (변하는 필드만 갱신하거나 요청 없이 처리)
+CACHED_REQUEST_COST = 0.2
+
+class CollectionBudget:
+    """
+    수집에 쓸 시간과 요청 수의 상한입니다.
+    수집 엔진은 요청을 보내기 전에 should_continue()로 예산이 남았는지 확인합니다.
+    예산이 끝난 시점에 이미 진행 중인 요청은 마치므로, 최대 동시 요청 수만큼 초과할 수 있습니다.
+    
+    Args:
+        time_budget (float, optional): 시간 예산(초), None이면 제한 없음
+        request_budget (int, optional): HTTP 요청 예산, None이면 제한 없음
+        request_counter (callable, optional): 지금까지 보낸 요청 수를 반환하는 함수
+    """
+    
+    def __init__(self, time_budget=None, request_budget=None, request_counter=None):
+        self.time_budget = time_budget
+        self.request_budget = request_budget
+        self._request_counter = request_counter or (lambda: 0)
+        
+        self._started_at = time.monotonic()
+        self._requests_at_start = self._request_counter()
+        self.stopped_by = None
+    
+    def elapsed(self):
+        """
+        예산 시작 후 지난 시간(초)을 반환합니다.
+        """
+        return time.monotonic() - self._started_at
+    
+    def requests_used(self):
+        """
+        예산 시작 후 보낸 요청 수를 반환합니다.
+        """
+        return self._request_counter() - self._requests_at_start
+    
+    def should_continue(self):
+        """
+        다음 요청을 보낼 예산이 남았는지 확인합니다. 예산이 끝나면 끝난 이유를 기록합니다.
+        
+        Returns:
+            bool: 계속 진행할 수 있는지 여부
+        """
+        if self.time_budget is not None and self.elapsed() >= self.time_budget:
+            self.stopped_by = self.stopped_by or 'time'
+            return False
+        if self.request_budget is not None and self.requests_used() >= self.request_budget:
+            self.stopped_by = self.stopped_by or 'requests'
+            return False
+        return True
+    
+    def get_report(self):
+        """
+        예산 사용 현황을 반환합니다.
+        
+        Returns:
+            dict: 사용한/남은 시간과 요청 수, 예산이 끝난 이유 (끝나지 않았으면 None)
+        """
+        elapsed = self.elapsed()
+        requests_used = self.requests_used()
+        
+        return {
+            'time_used': round(elapsed, 2),
+            'time_unused': round(max(0.0, self.time_budget - elapsed), 2) if self.time_budget is not None else None,
+            'requests_used': requests_used,
+            'requests_unused': max(0, self.request_budget - requests_used) if self.request_budget is not None else None,
+            'stopped_by': self.stopped_by
+        }
+
+class SourceYieldStats:
+    """
+    스토리 목록(top/new/show 등)별로 가져온 아이템 수와 채택된 스토리 수를 기록해,
+    목록별 키워드 적중률을 실행 간에 유지합니다.
+    
+    Args:
+        path (str | Path): 통계 파일 경로
+    """
+    
+    def __init__(self, path=SOURCE_YIELD_FILE):
+        self.path = Path(path)
+        self.stats = {}
+        
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self.stats = json.load(f)
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            print(f"Error loading source yield stats from {self.path}: {e}")
+    
+    def hit_rate(self, source):
+        """
+        목록의 보정된 키워드 적중률을 반환합니다.
+        
+        Args:
+            source (str): 스토리 목록 유형
+        
+        Returns:
+            float: 적중률 (0~1)
+        """
+        entry = self.stats.get(source, {})
+        return (entry.get('accepted', 0) + PRIOR_ACCEPTED) / (entry.get('fetched', 0) + PRIOR_FETCHED)
+    
+    def record(self, sources, accepted):
+        """
+        가져온 아이템 하나의 결과를 기록합니다.
+        
+        Args:
+            sources (list): 아이템이 나온 목록 유형들
+            accepted (bool): 채택 여부
+        """
+        for source in sources:
+            entry = self.stats.setdefault(source, {'fetched': 0, 'accepted': 0})
+            entry['fetched'] += 1
+            entry['accepted'] += int(accepted)
+    
+    def save(self):
+        """
+        통계를 원자적으로 저장합니다.
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = Path(f"{self.path}.tmp")
+        
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.stats, f, indent=2)
+        os.replace(tmp_path, self.path)
+
+def expected_yield(entry, yield_stats, cached_ids=frozenset()):
+    """
+    후보 하나의 요청 비용 대비 기대 수확량을 계산합니다.
+    
+    Args:
+        entry (dict): plan_fetch 후보 ({'id', 'sources', 'rank'})
+        yield_stats (SourceYieldStats): 목록별 적중률 통계
+        cached_ids (set): 캐시에 있는 아이템 ID 집합
+    
+    Returns:
+        float: 우선순위 점수 (클수록 먼저 가져옴)
+    """
+    hit_rate = max(yield_stats.hit_rate(source) for source in entry['sources'])
+    rank_weight = RANK_HALF_WEIGHT / (RANK_HALF_WEIGHT + entry['rank'])
+    cost = CACHED_REQUEST_COST if entry['id'] in cached_ids else 1.0
+    
+    return hit_rate * rank_weight / cost
+
+def prioritize_plan(plan, yield_stats, cached_ids=frozenset()):
+    """
+    후보를 기대 수확량이 높은 순서로 정렬합니다. 점수가 같으면 기존 순서를 유지합니다.
+    
+    Args:
+        plan (list): plan_fetch 후보 목록
+        yield_stats (SourceYieldStats): 목록별 적중률 통계
+        cached_ids (set): 캐시에 있는 아이템 ID 집합
+    
+    Returns:
+        list: 정렬된 후보 목록
+    """
+    return sorted(plan, key=lambda entry: -expected_yield(entry, yield_stats, cached_ids))
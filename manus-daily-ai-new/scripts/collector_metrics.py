@@ -0,0 +1,491 @@
+#!/usr/bin/env python3
+"""
+수집기 계측 모듈
+요청 지연 시간 히스토그램, 엔드포인트/상태 코드별 요청 수, 전송 바이트, 키워드 필터 채택/거부 수를 집계하고
+실행마다 Prometheus 텍스트 파일과 JSON 요약으로 저장합니다.
+"""
+
+import argparse
+import datetime
+import json
+import os
+import re
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+
+# 기본 경로 설정
+BASE_DIR = Path(__file__).parent.parent
+DATA_DIR = BASE_DIR / "data"
+METRICS_DIR = DATA_DIR / "metrics"
+
+# Prometheus textfile collector가 읽는 파일 이름 (실행 모드마다 마지막 실행의 값)
+PROMETHEUS_FILE_NAME = "hn_collector_{mode}.prom"
+
+# 히스토그램 정밀도: 2의 거듭제곱 구간마다 나누는 하위 구간 수 (상대 오차 약 1/2^SUB_BUCKET_BITS)
+SUB_BUCKET_BITS = 5
+SUB_BUCKET_COUNT = 1 << SUB_BUCKET_BITS
+
+# Prometheus 히스토그램으로 내보낼 지연 시간 경계(초)
+PROMETHEUS_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# JSON 요약에 기록할 백분위수
+SUMMARY_PERCENTILES = (50, 90, 99, 99.9)
+
+# 엔드포인트 이름을 구하기 위한 URL 경로 패턴 (/v0/item/123.json, /v0/item/123/score.json, /v0/topstories.json)
+ITEM_FIELD_PATTERN = re.compile(r'/item/\d+/\w+\.json$')
+ITEM_PATTERN = re.compile(r'/item/\d+\.json$')
+LIST_PATTERN = re.compile(r'/(\w+)\.json$')
+
+def endpoint_name(url):
+    """
+    요청 URL을 계측용 엔드포인트 이름으로 바꿉니다. 아이템 ID는 이름에 넣지 않습니다.
+    
+    Args:
+        url (str): 요청 URL
+    
+    Returns:
+        str: 엔드포인트 이름 ('item', 'item_field', 'topstories', 'maxitem' 등)
+    """
+    path = url.split('?', 1)[0]
+    
+    if ITEM_FIELD_PATTERN.search(path):
+        return 'item_field'
+    if ITEM_PATTERN.search(path):
+        return 'item'
+    
+    match = LIST_PATTERN.search(path)
+    return match.group(1) if match else 'other'
+
+class LatencyHistogram:
+    """
+    HDR 방식의 로그-선형 지연 시간 히스토그램입니다.
+    마이크로초 값을 2의 거듭제곱 구간마다 SUB_BUCKET_COUNT개 하위 구간으로 나눠 세므로,
+    메모리는 값의 범위에 대해 로그로만 늘어나면서 모든 백분위수를 약 3% 상대 오차로 계산할 수 있습니다.
+    """
+    
+    def __init__(self):
+        self.counts = Counter()
+        self.total = 0
+        self.sum_us = 0
+        self.max_us = 0
+    
+    @staticmethod
+    def bucket_index(value_us):
+        """
+        마이크로초 값이 속하는 구간 번호를 계산합니다.
+        
+        Args:
+            value_us (int): 마이크로초 값
+        
+        Returns:
+            int: 구간 번호
+        """
+        if value_us < SUB_BUCKET_COUNT:
+            return value_us
+        
+        # 상위 SUB_BUCKET_BITS + 1비트만 남기고 나머지는 버림
+        shift = value_us.bit_length() - SUB_BUCKET_BITS - 1
+        return (shift + 1) * SUB_BUCKET_COUNT + (value_us >> shift) - SUB_BUCKET_COUNT
+    
+    @staticmethod
+    def bucket_upper_bound(index):
+        """
+        구간에 들어가는 가장 큰 마이크로초 값을 반환합니다.
+        
+        Args:
+            index (int): 구간 번호
+        
+        Returns:
+            int: 구간 상한 (포함)
+        """
+        if index < SUB_BUCKET_COUNT:
+            return index
+        
+        shift = index // SUB_BUCKET_COUNT - 1
+        top = index % SUB_BUCKET_COUNT + SUB_BUCKET_COUNT
+        return ((top + 1) << shift) - 1
+    
+    def record(self, seconds):
+        """
+        지연 시간 하나를 기록합니다.
+        
+        Args:
+            seconds (float): 지연 시간(초)
+        """
+        value_us = max(0, int(seconds * 1_000_000))
+        self.counts[self.bucket_index(value_us)] += 1
+        self.total += 1
+        self.sum_us += value_us
+        self.max_us = max(self.max_us, value_us)
+    
+    def merge(self, other):
+        """
+        다른 히스토그램의 기록을 더합니다.
+        
+        Args:
+            other (LatencyHistogram): 더할 히스토그램
+        """
+        self.counts.update(other.counts)
+        self.total += other.total
+        self.sum_us += other.sum_us
+        self.max_us = max(self.max_us, other.max_us)
+    
+    def percentile(self, percent):
+        """
+        백분위수 지연 시간을 계산합니다.
+        
+        Args:
+            percent (float): 백분위 (0~100)
+        
+        Returns:
+            float: 지연 시간(초), 기록이 없으면 0.0
+        """
+        if not self.total:
+            return 0.0
+        
+        target = max(1, int(round(percent / 100 * self.total)))
+        seen = 0
+        
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= target:
+                return min(self.bucket_upper_bound(index), self.max_us) / 1_000_000
+        
+        return self.max_us / 1_000_000
+    
+    def count_at_or_below(self, seconds):
+        """
+        주어진 지연 시간 이하로 기록된 수를 셉니다. (Prometheus 누적 구간용)
+        
+        Args:
+            seconds (float): 경계 지연 시간(초)
+        
+        Returns:
+            int: 경계 이하 기록 수
+        """
+        limit_us = int(seconds * 1_000_000)
+        return sum(count for index, count in self.counts.items() if self.bucket_upper_bound(index) <= limit_us)
+    
+    def summary(self):
+        """
+        히스토그램 요약을 반환합니다.
+        
+        Returns:
+            dict: 기록 수, 평균/최대 지연 시간과 백분위수 (초)
+        """
+        summary = {
+            'count': self.total,
+            'mean': round(self.sum_us / self.total / 1_000_000, 6) if self.total else 0.0,
+            'max': round(self.max_us / 1_000_000, 6)
+        }
+        for percent in SUMMARY_PERCENTILES:
+            summary[f'p{percent:g}'] = round(self.percentile(percent), 6)
+        return summary
+
+class CollectorMetrics:
+    """
+    수집기 한 번 실행 동안의 계측 값을 모읍니다. 여러 스레드에서 함께 기록할 수 있습니다.
+    
+    Args:
+        mode (str): 실행 모드 이름 ('full', 'incremental', 'refresh', 'backfill' 등)
+    """
+    
+    def __init__(self, mode='full'):
+        self.mode = mode
+        self.started_at = time.time()
+        self._started_monotonic = time.monotonic()
+        self._lock = threading.Lock()
+        
+        self.latency = {}
+        self.requests = Counter()
+        self.bytes_received = Counter()
+        self.items = Counter()
+        self.filter_results = Counter()
+        self.keyword_accepted = Counter()
+        self.keyword_rejected = Counter()
+    
+    def record_request(self, url, status, seconds, num_bytes=0):
+        """
+        HTTP 요청 하나(재시도 포함 각 시도)의 결과를 기록합니다.
+        
+        Args:
+            url (str): 요청 URL
+            status (int | str): 응답 상태 코드, 응답을 받지 못했으면 오류 종류 ('timeout', 'connection_error')
+            seconds (float): 요청 지연 시간(초)
+            num_bytes (int): 받은 응답 본문 크기
+        """
+        endpoint = endpoint_name(url)
+        
+        with self._lock:
+            histogram = self.latency.get(endpoint)
+            if histogram is None:
+                histogram = self.latency[endpoint] = LatencyHistogram()
+            histogram.record(seconds)
+            self.requests[(endpoint, str(status))] += 1
+            self.bytes_received[endpoint] += num_bytes
+    
+    def record_item(self, item):
+        """
+        아이템 하나를 가져온 결과를 기록합니다.
+        
+        Args:
+            item (dict): 가져온 아이템 (실패한 항목은 None)
+        """
+        with self._lock:
+            self.items['fetched' if item else 'failed'] += 1
+    
+    def record_filter(self, matched, accepted, reason=None):
+        """
+        키워드 필터 결과를 기록합니다.
+        
+        Args:
+            matched (dict): 분류 -> 매칭된 키워드 목록 (매칭하지 않았으면 None)
+            accepted (bool): 채택 여부
+            reason (str, optional): 거부 이유 ('missing', 'not_story', 'no_keyword')
+        """
+        with self._lock:
+            self.filter_results[('accepted', '') if accepted else ('rejected', reason or 'no_keyword')] += 1
+            
+            keywords = self.keyword_accepted if accepted else self.keyword_rejected
+            for category, found in (matched or {}).items():
+                for keyword in found:
+                    keywords[(category, keyword)] += 1
+    
+    def elapsed(self):
+        """
+        실행 시작 후 지난 시간(초)을 반환합니다.
+        """
+        return time.monotonic() - self._started_monotonic
+    
+    def to_dict(self, extra=None):
+        """
+        실행 요약을 JSON으로 저장할 수 있는 형태로 반환합니다.
+        
+        Args:
+            extra (dict, optional): 요약에 함께 넣을 값 (HTTP 클라이언트/캐시 통계 등)
+        
+        Returns:
+            dict: 실행 요약
+        """
+        elapsed = self.elapsed()
+        
+        with self._lock:
+            total_requests = sum(self.requests.values())
+            error_requests = sum(
+                count for (_, status), count in self.requests.items() if not status.startswith('2')
+            )
+            overall = LatencyHistogram()
+            for histogram in self.latency.values():
+                overall.merge(histogram)
+            
+            endpoints = {}
+            for endpoint, histogram in sorted(self.latency.items()):
+                endpoints[endpoint] = {
+                    'latency': histogram.summary(),
+                    'statuses': {
+                        status: count for (name, status), count in sorted(self.requests.items()) if name == endpoint
+                    },
+                    'bytes': self.bytes_received[endpoint]
+                }
+            
+            accepted = self.filter_results[('accepted', '')]
+            filtered = sum(self.filter_results.values())
+            
+            summary = {
+                'mode': self.mode,
+                'started_at': datetime.datetime.fromtimestamp(self.started_at).isoformat(),
+                'duration': round(elapsed, 3),
+                'requests': total_requests,
+                'error_rate': round(error_requests / total_requests, 4) if total_requests else 0.0,
+                'requests_per_second': round(total_requests / elapsed, 2) if elapsed else 0.0,
+                'bytes': sum(self.bytes_received.values()),
+                'items': dict(self.items),
+                'items_per_second': round(self.items['fetched'] / elapsed, 2) if elapsed else 0.0,
+                'latency': overall.summary(),
+                'endpoints': endpoints,
+                'filter': {
+                    'accepted': accepted,
+                    'rejected': {
+                        reason: count for (result, reason), count in sorted(self.filter_results.items())
+                        if result == 'rejected'
+                    },
+                    'selectivity': round(accepted / filtered, 4) if filtered else 0.0
+                },
+                'keywords': {
+                    f'{category}:{keyword}': {
+                        'accepted': self.keyword_accepted[(category, keyword)],
+                        'rejected': self.keyword_rejected[(category, keyword)]
+                    }
+                    for category, keyword in sorted(set(self.keyword_accepted) | set(self.keyword_rejected))
+                }
+            }
+        
+        if extra:
+            summary.update(extra)
+        return summary
+    
+    def to_prometheus(self):
+        """
+        계측 값을 Prometheus 텍스트 노출 형식으로 반환합니다.
+        
+        Returns:
+            str: Prometheus 텍스트
+        """
+        lines = []
+        
+        def metric(name, metric_type, help_text):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {metric_type}")
+        
+        with self._lock:
+            metric('hn_collector_last_run_timestamp_seconds', 'gauge', 'Start time of the last collector run.')
+            lines.append(f'hn_collector_last_run_timestamp_seconds{{mode="{self.mode}"}} {self.started_at:.3f}')
+            
+            metric('hn_collector_run_duration_seconds', 'gauge', 'Duration of the last collector run.')
+            lines.append(f'hn_collector_run_duration_seconds{{mode="{self.mode}"}} {self.elapsed():.3f}')
+            
+            metric('hn_collector_requests_total', 'counter', 'HTTP requests by endpoint and status.')
+            for (endpoint, status), count in sorted(self.requests.items()):
+                lines.append(f'hn_collector_requests_total{{endpoint="{endpoint}",status="{status}"}} {count}')
+            
+            metric('hn_collector_response_bytes_total', 'counter', 'Response body bytes received by endpoint.')
+            for endpoint, num_bytes in sorted(self.bytes_received.items()):
+                lines.append(f'hn_collector_response_bytes_total{{endpoint="{endpoint}"}} {num_bytes}')
+            
+            metric('hn_collector_request_duration_seconds', 'histogram', 'HTTP request latency by endpoint.')
+            for endpoint, histogram in sorted(self.latency.items()):
+                for bound in PROMETHEUS_LATENCY_BUCKETS:
+                    lines.append(f'hn_collector_request_duration_seconds_bucket{{endpoint="{endpoint}",le="{bound:g}"}} '
+                                 f'{histogram.count_at_or_below(bound)}')
+                lines.append(f'hn_collector_request_duration_seconds_bucket{{endpoint="{endpoint}",le="+Inf"}} '
+                             f'{histogram.total}')
+                lines.append(f'hn_collector_request_duration_seconds_sum{{endpoint="{endpoint}"}} '
+                             f'{histogram.sum_us / 1_000_000:.6f}')
+                lines.append(f'hn_collector_request_duration_seconds_count{{endpoint="{endpoint}"}} {histogram.total}')
+            
+            metric('hn_collector_items_total', 'counter', 'Items fetched or failed.')
+            for result, count in sorted(self.items.items()):
+                lines.append(f'hn_collector_items_total{{result="{result}"}} {count}')
+            
+            metric('hn_collector_filter_total', 'counter', 'Keyword filter results by reason.')
+            for (result, reason), count in sorted(self.filter_results.items()):
+                lines.append(f'hn_collector_filter_total{{result="{result}",reason="{reason}"}} {count}')
+            
+            metric('hn_collector_keyword_matches_total', 'counter', 'Items matching each keyword by filter result.')
+            for result, keywords in (('accepted', self.keyword_accepted), ('rejected', self.keyword_rejected)):
+                for (category, keyword), count in sorted(keywords.items()):
+                    lines.append(f'hn_collector_keyword_matches_total{{category="{category}",'
+                                 f'keyword="{keyword}",result="{result}"}} {count}')
+        
+        return '\n'.join(lines) + '\n'
+    
+    def save(self, metrics_dir=METRICS_DIR, prometheus_path=None, extra=None):
+        """
+        Prometheus 텍스트 파일을 원자적으로 덮어쓰고, 실행별 JSON 요약을 새 파일로 저장합니다.
+        
+        Args:
+            metrics_dir (Path): JSON 요약 저장 디렉토리
+            prometheus_path (Path, optional): Prometheus 텍스트 파일 경로 (기본값: metrics_dir/hn_collector_<모드>.prom)
+            extra (dict, optional): JSON 요약에 함께 넣을 값
+        
+        Returns:
+            Path: 저장한 JSON 요약 경로
+        """
+        metrics_dir = Path(metrics_dir)
+        metrics_dir.mkdir(parents=True, exist_ok=True)
+        prometheus_path = Path(prometheus_path or metrics_dir / PROMETHEUS_FILE_NAME.format(mode=self.mode))
+        
+        # textfile collector가 쓰다 만 파일을 읽지 않도록 임시 파일에 쓴 뒤 교체
+        tmp_path = Path(f"{prometheus_path}.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(self.to_prometheus())
+        os.replace(tmp_path, prometheus_path)
+        
+        stamp = datetime.datetime.fromtimestamp(self.started_at).strftime('%Y%m%d_%H%M%S')
+        summary_path = metrics_dir / f"collector_run_{stamp}_{self.mode}.json"
+        with open(summary_path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(extra), f, ensure_ascii=False, indent=2)
+        
+        return summary_path
+
+# 모듈 전체에서 공유하는 계측 값
+_metrics = CollectorMetrics()
+_metrics_lock = threading.Lock()
+
+def get_metrics():
+    """
+    현재 실행의 공유 계측 값을 반환합니다.
+    
+    Returns:
+        CollectorMetrics: 공유 계측 값
+    """
+    with _metrics_lock:
+        return _metrics
+
+def reset_metrics(mode='full'):
+    """
+    새 실행을 위해 공유 계측 값을 초기화합니다.
+    
+    Args:
+        mode (str): 실행 모드 이름
+    
+    Returns:
+        CollectorMetrics: 새 공유 계측 값
+    """
+    global _metrics
+    
+    with _metrics_lock:
+        _metrics = CollectorMetrics(mode)
+        return _metrics
+
+def load_run_summaries(metrics_dir=METRICS_DIR, limit=20):
+    """
+    최근 실행 요약을 오래된 순서로 로드합니다.
+    
+    Args:
+        metrics_dir (Path): JSON 요약 디렉토리
+        limit (int): 로드할 최대 실행 수
+    
+    Returns:
+        list: 실행 요약 목록
+    """
+    summaries = []
+    
+    for path in sorted(Path(metrics_dir).glob("collector_run_*.json"))[-limit:]:
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                summaries.append(json.load(f))
+        except (OSError, ValueError) as e:
+            print(f"Error loading run summary {path}: {e}")
+    
+    return summaries
+
+def main():
+    """
+    메인 함수: 최근 수집기 실행의 지연 시간과 처리량을 표로 출력해 실행 간 변화를 비교합니다.
+    """
+    parser = argparse.ArgumentParser(description="수집기 실행 계측 요약")
+    parser.add_argument("--limit", type=int, default=20, help="출력할 최근 실행 수")
+    parser.add_argument("--metrics-dir", default=str(METRICS_DIR), help="실행별 JSON 요약 디렉토리")
+    args = parser.parse_args()
+    
+    summaries = load_run_summaries(args.metrics_dir, args.limit)
+    if not summaries:
+        print(f"No collector run summaries found in {args.metrics_dir}")
+        return
+    
+    print(f"{'started_at':<20} {'mode':<12} {'requests':>8} {'req/s':>7} {'errors':>7} "
+          f"{'p50 ms':>8} {'p99 ms':>8} {'MB':>7} {'accepted':>8} {'select':>7}")
+    
+    for summary in summaries:
+        latency = summary['latency']
+        print(f"{summary['started_at'][:19]:<20} {summary['mode']:<12} {summary['requests']:>8} "
+              f"{summary['requests_per_second']:>7.1f} {summary['error_rate']:>7.2%} "
+              f"{latency['p50'] * 1000:>8.1f} {latency['p99'] * 1000:>8.1f} "
+              f"{summary['bytes'] / 1_000_000:>7.2f} {summary['filter']['accepted']:>8} "
+              f"{summary['filter']['selectivity']:>7.2%}")
+
+if __name__ == "__main__":
+    main()
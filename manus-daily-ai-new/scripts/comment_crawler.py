@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+댓글 트리 수집 모듈
+스토리의 댓글 트리를 너비 우선으로 병렬 탐색하여 토론 요약 통계를 만듭니다.
+"""
+
+import html
+import re
+from collections import Counter
+
+# 탐색 제한 기본값
+DEFAULT_MAX_DEPTH = 3
+DEFAULT_MAX_NODES = 300
+
+# 요약에 남길 댓글 키워드 수
+TOP_COMMENT_KEYWORDS = 10
+
+# 댓글 본문의 HTML 태그
+HTML_TAG_PATTERN = re.compile(r'<[^>]+>')
+
+def comment_text(item):
+    """
+    댓글 본문에서 HTML 태그와 엔티티를 제거합니다.
+    
+    Args:
+        item (dict): 댓글 아이템
+    
+    Returns:
+        str: 일반 텍스트
+    """
+    return html.unescape(HTML_TAG_PATTERN.sub(' ', item.get('text', '')))
+
+def crawl_discussions(stories, fetch_items, matcher, max_depth=DEFAULT_MAX_DEPTH, max_nodes=DEFAULT_MAX_NODES,
+                      should_continue=None):
+    """
+    여러 스토리의 댓글 트리를 깊이별로 한 번에 탐색하여 스토리별 토론 통계를 계산합니다.
+    각 깊이의 댓글은 모든 스토리에 걸쳐 한 번의 병렬 요청 묶음으로 가져옵니다.
+    
+    Args:
+        stories (list): 스토리 목록 ('kids' 필드 사용)
+        fetch_items (callable): 아이템 ID 목록을 받아 같은 순서의 아이템 목록을 반환하는 함수 (건너뛴 항목은 None)
+        matcher (KeywordMatcher): 댓글 키워드 매처
+        max_depth (int): 탐색할 최대 깊이 (최상위 댓글이 1)
+        max_nodes (int): 스토리당 가져올 최대 댓글 수
+        should_continue (callable, optional): 깊이마다 호출해 False이면 탐색을 멈추는 함수 (수집 예산)
+    
+    Returns:
+        dict: 스토리 ID -> 토론 통계
+    """
+    seen = set()
+    stats = {}
+    frontier = []
+    
+    for story in stories:
+        story_id = story.get('id')
+        stats[story_id] = {
+            'depth_counts': Counter(),
+            'commenters': set(),
+            'keyword_hits': Counter(),
+            'fetched': 0,
+            'truncated': False
+        }
+        frontier.extend((story_id, kid) for kid in story.get('kids', []))
+    
+    depth = 1
+    
+    while frontier and depth <= max_depth:
+        if should_continue is not None and not should_continue():
+            break
+        
+        # 이미 본 ID와 스토리별 노드 제한을 넘는 ID 제외
+        batch = []
+        for story_id, item_id in frontier:
+            story_stats = stats[story_id]
+            if item_id in seen:
+                continue
+            if story_stats['fetched'] >= max_nodes:
+                story_stats['truncated'] = True
+                continue
+            seen.add(item_id)
+            story_stats['fetched'] += 1
+            batch.append((story_id, item_id))
+        
+        items = fetch_items([item_id for _, item_id in batch])
+        frontier = []
+        
+        for (story_id, _), item in zip(batch, items):
+            if item is None and should_continue is not None and not should_continue():
+                # 예산이 끝나 가져오지 않은 댓글
+                stats[story_id]['truncated'] = True
+                continue
+            if not item or item.get('deleted') or item.get('dead'):
+                continue
+            
+            story_stats = stats[story_id]
+            story_stats['depth_counts'][depth] += 1
+            if item.get('by'):
+                story_stats['commenters'].add(item['by'])
+            story_stats['keyword_hits'].update(matcher.count(comment_text(item)))
+            
+            frontier.extend((story_id, kid) for kid in item.get('kids', []))
+        
+        depth += 1
+    
+    # 최대 깊이나 예산에 도달해 남은 댓글이 있으면 잘린 것으로 표시
+    for story_id, _ in frontier:
+        stats[story_id]['truncated'] = True
+    
+    return {story_id: summarize_discussion(story_stats) for story_id, story_stats in stats.items()}
+
+def summarize_discussion(story_stats):
+    """
+    탐색 중 누적한 통계를 저장 가능한 요약 형식으로 변환합니다.
+    
+    Args:
+        story_stats (dict): crawl_discussions 내부 누적 통계
+    
+    Returns:
+        dict: 토론 요약 (댓글 수, 깊이별 댓글 수, 참여자 수, 댓글 키워드 등)
+    """
+    depth_counts = story_stats['depth_counts']
+    
+    return {
+        'comments_crawled': sum(depth_counts.values()),
+        'depth_counts': {str(depth): count for depth, count in sorted(depth_counts.items())},
+        'max_depth': max(depth_counts) if depth_counts else 0,
+        'unique_commenters': len(story_stats['commenters']),
+        'keyword_hits': dict(story_stats['keyword_hits'].most_common(TOP_COMMENT_KEYWORDS)),
+        'truncated': story_stats['truncated']
+    }
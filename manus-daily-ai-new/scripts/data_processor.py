@@ -4,46 +4,198 @@
 수집된 Hacker News 데이터를 처리하고 분석합니다.
 """
 
+import argparse
 import json
+import numpy as np
 import pandas as pd
 import datetime
-import os
+import tempfile
+import time
+from itertools import islice
 from pathlib import Path
-import re
-import sys
-from collections import Counter
+
+from api_scope import scoped_path
+from domain_normalizer import netloc_host, registered_domain, url_netloc
+from keyword_trends import BURST_WINDOW_DAYS, detect_bursts
+from near_duplicates import ClusterStats, NearDuplicateIndex
+from processed_data import ProcessedWriter, save_processed
+from story_aggregates import StoryAggregates, DAY_ORDER
+from story_sink import iter_ndjson
+from story_store import StoryStore
+from story_velocity import compute_velocity
+from term_matrix import TermMatrix
 
 # 기본 경로 설정
 BASE_DIR = Path(__file__).parent.parent
 DATA_DIR = BASE_DIR / "data"
 REPORTS_DIR = BASE_DIR / "reports"
-PROCESSED_DIR = DATA_DIR / "processed"
+PROCESSED_DIR = scoped_path(DATA_DIR / "processed")
+# 입력 파일(--input) 처리 결과 디렉토리 (수집일 결과와 섞이지 않도록 분리)
+INPUTS_DIR = DATA_DIR / "inputs"
 
 # 디렉토리가 없으면 생성
-PROCESSED_DIR.mkdir(exist_ok=True)
+PROCESSED_DIR.mkdir(parents=True, exist_ok=True)
+
+# 분석 결과에 남길 급상승 스토리 수
+RISING_STORIES_COUNT = 10
+
+# DataFrame으로 가져올 스토리 필드, 기본값, 숫자 컬럼 자료형 (None이면 문자열)
+STORY_COLUMNS = [
+    ('id', 0, 'int64'),
+    ('title', '', None),
+    ('url', '', None),
+    ('text', '', None),
+    ('score', 0, 'int64'),
+    ('by', '', None),
+    ('time', 0, 'int64'),
+    ('descendants', 0, 'int64'),
+    ('type', '', None),
+    ('collected_at', '', None)
+]
+
+# 값 종류가 적어 범주형으로 저장할 컬럼
+CATEGORICAL_COLUMNS = ['by', 'type']
+
+# 스트리밍 처리 시 한 번에 메모리에 올릴 스토리 수 기본값
+DEFAULT_CHUNK_SIZE = 5000
+
+# JSON 배열 파일을 점진적으로 읽을 때 한 번에 읽을 문자 수
+JSON_READ_SIZE = 1 << 16
+
+def iter_stories(file_path):
+    """
+    저장된 스토리를 하나씩 읽어 반환합니다.
+    NDJSON 파일(.ndjson)은 한 줄씩, JSON 배열 파일은 원소 하나씩 점진적으로 읽으므로 파일 전체를 메모리에 올리지 않습니다.
+    
+    Args:
+        file_path (str): 로드할 파일 경로
+    
+    Yields:
+        dict: 스토리
+    """
+    if str(file_path).endswith('.ndjson'):
+        yield from iter_ndjson(file_path)
+    else:
+        yield from iter_json_array(file_path)
+
+def iter_json_array(file_path, read_size=JSON_READ_SIZE):
+    """
+    JSON 배열 파일의 원소를 하나씩 파싱해 반환합니다.
+    파일을 read_size 문자씩 읽으며 버퍼에서 원소를 하나씩 디코딩하므로, 메모리는 원소 하나와 버퍼 크기만큼만 사용합니다.
+    
+    Args:
+        file_path (str): JSON 배열 파일 경로
+        read_size (int): 한 번에 읽을 문자 수
+    
+    Yields:
+        원소 (스토리 dict)
+    
+    Raises:
+        ValueError: 파일이 JSON 배열이 아니거나 형식이 잘못된 경우
+    """
+    decoder = json.JSONDecoder()
+    
+    with open(file_path, 'r', encoding='utf-8') as f:
+        buffer = ''
+        position = 0
+        started = False
+        eof = False
+        
+        while True:
+            # 공백과 구분자 건너뛰기
+            while position < len(buffer) and buffer[position] in ' \t\r\n,':
+                position += 1
+            
+            if position >= len(buffer):
+                if eof:
+                    raise ValueError(f"Unexpected end of JSON array in {file_path}")
+                buffer = f.read(read_size)
+                position = 0
+                eof = not buffer
+                continue
+            
+            if not started:
+                if buffer[position] != '[':
+                    raise ValueError(f"{file_path} is not a JSON array")
+                started = True
+                position += 1
+                continue
+            
+            if buffer[position] == ']':
+                return
+            
+            try:
+                item, end = decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                # 원소가 버퍼 경계에 걸쳐 있으면 남은 부분에 다음 내용을 이어 붙여 다시 시도
+                more = f.read(read_size)
+                eof = not more
+                buffer = buffer[position:] + more
+                position = 0
+                continue
+            
+            yield item
+            position = end
+
+def iter_chunks(items, chunk_size):
+    """
+    반복 가능한 객체를 chunk_size개씩 묶어 반환합니다.
+    
+    Args:
+        items (iterable): 나눌 항목
+        chunk_size (int): 묶음 크기
+    
+    Yields:
+        list: 항목 묶음
+    """
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
 
 def load_stories(file_path):
     """
     저장된 스토리 데이터를 로드합니다.
     
     Args:
-        file_path (str): 로드할 파일 경로
+        file_path (str): 로드할 파일 경로 (.json 또는 .ndjson)
         
     Returns:
         list: 스토리 목록
     """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            stories = json.load(f)
+        stories = list(iter_stories(file_path))
         print(f"Loaded {len(stories)} stories from {file_path}")
         return stories
     except Exception as e:
         print(f"Error loading stories from {file_path}: {e}")
         return []
 
+def to_local_datetime(timestamps):
+    """
+    유닉스 타임스탬프 배열을 로컬 시간대의 datetime64 배열로 변환합니다.
+    UTC 오프셋은 서로 다른 시(hour)마다 한 번만 계산하므로 행마다 시간대를 변환하지 않습니다.
+    
+    Args:
+        timestamps (numpy.ndarray): 유닉스 타임스탬프(초) 배열
+    
+    Returns:
+        pandas.DatetimeIndex: 로컬 시간 (시간대 정보 없음)
+    """
+    timestamps = np.asarray(timestamps, dtype='int64')
+    hours, inverse = np.unique(timestamps // 3600, return_inverse=True)
+    offsets = np.array([time.localtime(int(hour) * 3600).tm_gmtoff for hour in hours], dtype='int64')
+    return pd.to_datetime(timestamps + offsets[inverse], unit='s')
+
 def convert_to_dataframe(stories):
     """
     스토리 목록을 pandas DataFrame으로 변환합니다.
+    행마다 딕셔너리를 만들지 않고 필드별로 컬럼을 바로 추출하며,
+    시간은 벡터 연산으로 변환하고 작성자/유형은 범주형, 댓글 ID 목록(kids)은 개수(kids_count)로 저장합니다.
     
     Args:
         stories (list): 스토리 목록
@@ -51,115 +203,165 @@ def convert_to_dataframe(stories):
     Returns:
         pandas.DataFrame: 변환된 DataFrame
     """
-    # 필요한 필드만 추출
-    processed_stories = []
-    
-    for story in stories:
-        processed_story = {
-            'id': story.get('id'),
-            'title': story.get('title', ''),
-            'url': story.get('url', ''),
-            'text': story.get('text', ''),
-            'score': story.get('score', 0),
-            'by': story.get('by', ''),
-            'time': datetime.datetime.fromtimestamp(story.get('time', 0)),
-            'descendants': story.get('descendants', 0),
-            'type': story.get('type', ''),
-            'kids': story.get('kids', []),
-            'collected_at': story.get('collected_at', '')
-        }
-        processed_stories.append(processed_story)
+    if not isinstance(stories, list):
+        stories = list(stories)
+    
+    # 필요한 필드만 컬럼 단위로 추출 (숫자 컬럼은 자료형 추론 없이 바로 배열로 만듦)
+    columns = {}
+    for field, default, dtype in STORY_COLUMNS:
+        if dtype is None:
+            columns[field] = [story.get(field, default) for story in stories]
+        else:
+            columns[field] = np.fromiter((story.get(field) or default for story in stories),
+                                         dtype=dtype, count=len(stories))
+    columns['time'] = to_local_datetime(columns['time'])
+    columns['kids_count'] = np.fromiter((len(story.get('kids') or ()) for story in stories),
+                                        dtype='int32', count=len(stories))
     
     # DataFrame 생성
-    df = pd.DataFrame(processed_stories)
+    df = pd.DataFrame(columns)
+    for column in CATEGORICAL_COLUMNS:
+        df[column] = df[column].astype('category')
     
     # 시간 관련 필드 추가
-    if 'time' in df.columns:
-        df['date'] = df['time'].dt.date
-        df['hour'] = df['time'].dt.hour
-        df['day_of_week'] = df['time'].dt.day_name()
+    df['date'] = df['time'].dt.normalize()
+    df['hour'] = df['time'].dt.hour.astype('int8')
+    df['day_of_week'] = pd.Categorical.from_codes(df['time'].dt.dayofweek, DAY_ORDER)
     
     return df
 
 def extract_domains(df):
     """
-    URL에서 도메인을 추출하여 DataFrame에 추가합니다.
+    URL에서 호스트와 등록 도메인을 추출하여 DataFrame에 추가합니다.
+    URL마다 네트워크 위치만 잘라낸 뒤 중복을 제거하고, 호스트 파싱과 등록 도메인 정규화(blog.openai.com -> openai.com)는
+    서로 다른 네트워크 위치마다 한 번만 수행해 결과를 배열 인덱싱으로 펼칩니다.
     
     Args:
         df (pandas.DataFrame): 처리할 DataFrame
         
     Returns:
-        pandas.DataFrame: 도메인이 추가된 DataFrame
+        pandas.DataFrame: host, domain 컬럼이 추가된 DataFrame
     """
-    def extract_domain(url):
-        if not url or not isinstance(url, str):
-            return ''
-        
-        # URL에서 도메인 추출
-        domain_match = re.search(r'https?://(?:www\.)?([^/]+)', url)
-        if domain_match:
-            return domain_match.group(1)
-        return ''
-    
     if 'url' in df.columns:
-        df['domain'] = df['url'].apply(extract_domain)
+        codes, netlocs = pd.factorize(np.array([url_netloc(url) for url in df['url'].tolist()], dtype=object))
+        hosts = np.array([netloc_host(netloc) for netloc in netlocs], dtype=object)
+        domains = np.array([registered_domain(host) for host in hosts], dtype=object)
+        df['host'] = hosts[codes]
+        df['domain'] = domains[codes]
+    
+    return df
+
+def add_velocity(df, stories, snapshots):
+    """
+    DataFrame에 스토리별 점수/댓글 증가 속도와 가속도 컬럼을 추가합니다.
+    
+    Args:
+        df (pandas.DataFrame): 처리할 DataFrame
+        stories (list): 스토리 목록
+        snapshots (list): (스토리 ID, 시각, 점수, 댓글 수) 튜플 목록
+    
+    Returns:
+        pandas.DataFrame: 속도 컬럼이 추가된 DataFrame
+    """
+    if df.empty:
+        return df
     
+    velocity = compute_velocity(snapshots, stories)
+    df = df.merge(velocity, left_on='id', right_index=True, how='left')
+    df[velocity.columns] = df[velocity.columns].fillna(0.0)
     return df
 
-def analyze_stories(df):
+def add_clusters(df, index):
+    """
+    DataFrame에 유사 중복 묶음 ID 컬럼(cluster_id)을 추가합니다.
+    
+    Args:
+        df (pandas.DataFrame): 처리할 DataFrame
+        index (NearDuplicateIndex): 날짜를 넘어 유지되는 유사 중복 인덱스
+    
+    Returns:
+        pandas.DataFrame: cluster_id 컬럼이 추가된 DataFrame
+    """
+    if df.empty:
+        df['cluster_id'] = pd.Series(dtype='int64')
+        return df
+    
+    clusters = index.assign(df['id'].tolist(), df['title'].tolist(), df['url'].tolist())
+    df['cluster_id'] = np.fromiter((clusters[int(story_id)] for story_id in df['id']), dtype=np.int64, count=len(df))
+    return df
+
+def extract_discussion_stats(stories):
+    """
+    수집 단계에서 댓글 트리를 탐색한 스토리의 토론 통계를 모읍니다.
+    
+    Args:
+        stories (list): 스토리 목록
+    
+    Returns:
+        dict: 스토리 ID(문자열) -> 토론 통계
+    """
+    return {
+        str(story['id']): story['discussion']
+        for story in stories
+        if story.get('discussion') and story.get('id') is not None
+    }
+
+def analyze_stories(df, aggregates=None):
     """
     스토리 데이터를 분석합니다.
+    기본 통계, 인기 도메인/작성자/키워드, 시간대/요일 분포는 합칠 수 있는 부분 집계로 계산합니다.
     
     Args:
         df (pandas.DataFrame): 분석할 DataFrame
+        aggregates (StoryAggregates, optional): 이미 계산한 df의 부분 집계
         
     Returns:
         dict: 분석 결과
     """
-    analysis = {}
-    
-    # 기본 통계
-    analysis['total_stories'] = len(df)
-    analysis['avg_score'] = df['score'].mean() if 'score' in df.columns else 0
-    analysis['max_score'] = df['score'].max() if 'score' in df.columns else 0
-    
-    # 인기 도메인
-    if 'domain' in df.columns:
-        domain_counts = df['domain'].value_counts().head(10).to_dict()
-        analysis['top_domains'] = domain_counts
-    
-    # 인기 작성자
-    if 'by' in df.columns:
-        author_counts = df['by'].value_counts().head(10).to_dict()
-        analysis['top_authors'] = author_counts
-    
-    # 시간대별 분포
-    if 'hour' in df.columns:
-        hour_counts = df['hour'].value_counts().sort_index().to_dict()
-        analysis['hour_distribution'] = hour_counts
-    
-    # 요일별 분포
-    if 'day_of_week' in df.columns:
-        day_order = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-        day_counts = df['day_of_week'].value_counts().reindex(day_order).to_dict()
-        analysis['day_distribution'] = day_counts
-    
-    # 키워드 분석
-    if 'title' in df.columns:
-        # 제목에서 단어 추출
-        all_words = ' '.join(df['title'].fillna('')).lower()
-        words = re.findall(r'\b[a-z][a-z0-9]{2,}\b', all_words)
-        
-        # 불용어 제거 (간단한 영어 불용어 목록)
-        stopwords = {'the', 'and', 'to', 'of', 'a', 'in', 'for', 'is', 'on', 'that', 'by', 'this', 'with', 'you', 'it'}
-        filtered_words = [word for word in words if word not in stopwords]
-        
-        # 상위 키워드 추출
-        word_counts = Counter(filtered_words).most_common(20)
-        analysis['top_keywords'] = dict(word_counts)
+    if aggregates is None:
+        aggregates = StoryAggregates.from_dataframe(df)
+    analysis = aggregates.to_analysis()
+    
+    # 점수가 빠르게 오르는 스토리
+    if 'score_velocity' in df.columns:
+        analysis['rising_stories'] = summarize_rising_stories(top_rising_stories(df))
     
     return analysis
 
+def top_rising_stories(df):
+    """
+    점수 증가 속도(같으면 가속도) 순으로 상위 스토리를 고릅니다.
+    
+    Args:
+        df (pandas.DataFrame): 속도 컬럼이 있는 DataFrame
+    
+    Returns:
+        pandas.DataFrame: 상위 RISING_STORIES_COUNT개 스토리의 속도 관련 컬럼
+    """
+    columns = ['id', 'title', 'score_velocity', 'comment_velocity', 'score_acceleration']
+    return df.sort_values(['score_velocity', 'score_acceleration'], ascending=False).head(RISING_STORIES_COUNT)[columns]
+
+def summarize_rising_stories(rising):
+    """
+    급상승 스토리를 분석 결과 형식으로 바꿉니다.
+    
+    Args:
+        rising (pandas.DataFrame): top_rising_stories 결과
+    
+    Returns:
+        list: 스토리별 속도 요약
+    """
+    return [
+        {
+            'id': row['id'],
+            'title': row['title'],
+            'score_velocity': round(row['score_velocity'], 2),
+            'comment_velocity': round(row['comment_velocity'], 2),
+            'score_acceleration': round(row['score_acceleration'], 2)
+        }
+        for _, row in rising.iterrows()
+    ]
+
 def save_processed_data(df, analysis, date_str=None):
     """
     처리된 데이터와 분석 결과를 저장합니다.
@@ -175,10 +377,26 @@ def save_processed_data(df, analysis, date_str=None):
     if not date_str:
         date_str = datetime.datetime.now().strftime('%Y-%m-%d')
     
-    # DataFrame을 CSV로 저장
-    df_file = PROCESSED_DIR / f"processed_stories_{date_str}.csv"
-    df.to_csv(df_file, index=False, encoding='utf-8')
+    # DataFrame 저장 (pyarrow가 있으면 Parquet, 없으면 CSV)
+    df_file = save_processed(df, date_str, PROCESSED_DIR)
+    
+    analysis_file = save_analysis(analysis, date_str)
+    print(f"Saved processed data to {df_file}")
+    
+    return str(df_file), analysis_file
+
+def save_analysis(analysis, label, output_dir=PROCESSED_DIR):
+    """
+    분석 결과를 JSON으로 저장합니다.
+    
+    Args:
+        analysis (dict): 저장할 분석 결과
+        label (str): 파일 이름에 넣을 날짜 또는 이름
+        output_dir (Path): 저장할 디렉토리
     
+    Returns:
+        str: 분석 결과 파일 경로
+    """
     # NumPy 타입을 Python 기본 타입으로 변환
     def convert_numpy_types(obj):
         if isinstance(obj, dict):
@@ -194,56 +412,321 @@ def save_processed_data(df, analysis, date_str=None):
     analysis_converted = convert_numpy_types(analysis)
     
     # 분석 결과를 JSON으로 저장
-    analysis_file = PROCESSED_DIR / f"analysis_{date_str}.json"
+    analysis_file = output_dir / f"analysis_{label}.json"
     with open(analysis_file, 'w', encoding='utf-8') as f:
         json.dump(analysis_converted, f, ensure_ascii=False, indent=2)
     
-    print(f"Saved processed data to {df_file}")
     print(f"Saved analysis results to {analysis_file}")
+    return str(analysis_file)
+
+def aggregates_path(date_str, output_dir=PROCESSED_DIR):
+    """
+    날짜별 부분 집계 파일 경로를 반환합니다.
     
-    return str(df_file), str(analysis_file)
+    Args:
+        date_str (str): 수집일 (YYYY-MM-DD)
+        output_dir (Path): 집계 파일 디렉토리
+    
+    Returns:
+        Path: 집계 파일 경로
+    """
+    return output_dir / f"aggregates_{date_str}.json"
 
-def process_latest_data():
+def terms_path(date_str):
     """
-    최신 데이터를 처리하고 분석합니다.
+    날짜별 제목 용어 행렬 파일 경로를 반환합니다.
+    
+    Args:
+        date_str (str): 수집일 (YYYY-MM-DD)
     
     Returns:
-        tuple: (DataFrame, 분석 결과, 저장된 파일 경로들)
+        Path: 용어 행렬 파일 경로
     """
-    # 최신 데이터 파일 찾기
-    data_files = list(DATA_DIR.glob('hn_ai_startup_stories_*.json'))
-    if not data_files:
-        print("No data files found")
-        return None, None, []
+    return PROCESSED_DIR / f"terms_{date_str}.npz"
+
+def load_day_aggregates(store, date_str):
+    """
+    날짜의 부분 집계를 로드합니다. 저장된 집계가 없거나 아직 수집 중인 오늘 날짜이면 저장소의 스토리로 계산해 저장합니다.
+    집계를 저장한 뒤 백필 등으로 그 날짜의 스토리가 늘었으면 저장된 집계를 쓰지 않고 다시 계산합니다.
+    
+    Args:
+        store (StoryStore): 스토리 저장소
+        date_str (str): 수집일 (YYYY-MM-DD)
+    
+    Returns:
+        StoryAggregates: 부분 집계
+    """
+    if date_str < datetime.datetime.now().strftime('%Y-%m-%d'):
+        aggregates = StoryAggregates.load(aggregates_path(date_str))
+        if aggregates is not None and aggregates.total_stories == store.count(date=date_str):
+            return aggregates
+    
+    df = extract_domains(convert_to_dataframe(store.get_stories(date=date_str)))
+    aggregates = StoryAggregates.from_dataframe(df, date_str)
+    aggregates.save(aggregates_path(date_str))
+    print(f"Computed aggregates for {date_str} ({aggregates.total_stories} stories)")
+    return aggregates
+
+def load_history_aggregates(store, date_str, days=BURST_WINDOW_DAYS):
+    """
+    날짜 이전 days일 동안의 수집일별 부분 집계를 로드합니다. (키워드 급상승 기준선 계산용)
+    
+    Args:
+        store (StoryStore): 스토리 저장소
+        date_str (str): 기준 수집일 (YYYY-MM-DD, 포함하지 않음)
+        days (int): 이전 기간 (일)
+    
+    Returns:
+        list: 수집일 순서의 부분 집계
+    """
+    start_date = (datetime.datetime.strptime(date_str, '%Y-%m-%d') - datetime.timedelta(days=days)).strftime('%Y-%m-%d')
+    return [load_day_aggregates(store, date) for date in store.dates() if start_date <= date < date_str]
+
+def analyze_date_range(start_date, end_date):
+    """
+    기간 안의 수집일별 부분 집계를 합쳐 기간 분석 결과를 만들고 저장합니다.
+    스토리를 다시 처리하지 않으므로 비용은 기간의 날짜 수에 비례합니다.
+    
+    Args:
+        start_date (str): 시작 수집일 (YYYY-MM-DD, 포함)
+        end_date (str): 끝 수집일 (YYYY-MM-DD, 포함)
+    
+    Returns:
+        tuple: (분석 결과, 저장된 파일 경로), 기간에 수집일이 없으면 (None, None)
+    """
+    with StoryStore() as store:
+        dates = [date for date in store.dates() if start_date <= date <= end_date]
+        if not dates:
+            print(f"No stories collected between {start_date} and {end_date}")
+            return None, None
+        
+        merged = StoryAggregates()
+        for date_str in dates:
+            merged.merge(load_day_aggregates(store, date_str))
+    
+    analysis = merged.to_analysis()
+    analysis['date_range'] = {'from': start_date, 'to': end_date, 'days': len(dates)}
+    
+    analysis_file = PROCESSED_DIR / f"analysis_{start_date}_{end_date}.json"
+    with open(analysis_file, 'w', encoding='utf-8') as f:
+        json.dump(analysis, f, ensure_ascii=False, indent=2)
+    
+    print(f"Analyzed {merged.total_stories} stories collected on {len(dates)} days ({start_date} ~ {end_date})")
+    print(f"Saved analysis results to {analysis_file}")
+    return analysis, str(analysis_file)
+
+def process_latest_data(date_str=None):
+    """
+    최신(또는 지정한 날짜의) 데이터를 처리하고 분석합니다.
     
-    # 가장 최근 파일 선택
-    latest_file = max(data_files, key=os.path.getmtime)
-    date_str = latest_file.stem.split('_')[-1]  # 파일 이름에서 날짜 추출
+    Args:
+        date_str (str, optional): 수집일 (YYYY-MM-DD, 기본값: 저장소의 가장 최근 수집일)
+    
+    Returns:
+        tuple: (DataFrame, 분석 결과, 저장된 파일 경로들)
+    """
+    # 저장소에서 해당 날짜에 수집된 스토리 조회
+    with StoryStore() as store:
+        date_str = date_str or store.latest_date()
+        if not date_str:
+            print("No stories found in store")
+            return None, None, []
+        
+        stories = store.get_stories(date=date_str)
+        snapshots = store.get_snapshots([story['id'] for story in stories])
+        history = load_history_aggregates(store, date_str)
     
-    # 데이터 로드
-    stories = load_stories(latest_file)
+    print(f"Loaded {len(stories)} stories collected on {date_str}")
     if not stories:
         return None, None, []
     
+    return process_day(stories, snapshots, date_str, history)
+
+def process_day(stories, snapshots, date_str, history=None):
+    """
+    수집일 하루치 스토리를 처리하고 분석해 처리 결과, 분석 결과, 부분 집계, 제목 용어 행렬을 저장합니다.
+    
+    Args:
+        stories (list): 수집일의 스토리
+        snapshots (list): (스토리 ID, 시각, 점수, 댓글 수) 튜플 목록
+        date_str (str): 수집일 (YYYY-MM-DD)
+        history (list, optional): 키워드 급상승 기준선을 계산할 이전 날짜들의 부분 집계 (없으면 급상승 탐지 생략)
+    
+    Returns:
+        tuple: (DataFrame, 분석 결과, 저장된 파일 경로들)
+    """
     # DataFrame 변환 및 처리
     df = convert_to_dataframe(stories)
     df = extract_domains(df)
-    
-    # 데이터 분석
-    analysis = analyze_stories(df)
+    df = add_velocity(df, stories, snapshots)
+    with NearDuplicateIndex() as index:
+        df = add_clusters(df, index)
+    
+    # 데이터 분석 (기간 분석에 쓸 하루치 부분 집계와 리포트에서 쓸 제목 용어 행렬도 함께 저장)
+    term_matrix = TermMatrix.from_titles(df['title'], df['id'])
+    aggregates = StoryAggregates.from_dataframe(df, date_str, term_matrix)
+    analysis = analyze_stories(df, aggregates)
+    analysis['keyword_bursts'] = detect_bursts(aggregates, history) if history is not None else []
+    cluster_stats = ClusterStats()
+    cluster_stats.add(df['id'].tolist(), df['cluster_id'].tolist())
+    analysis.update(cluster_stats.to_analysis())
+    analysis['discussion_stats'] = extract_discussion_stats(stories)
+    aggregates.save(aggregates_path(date_str))
     
     # 처리된 데이터 저장
     df_file, analysis_file = save_processed_data(df, analysis, date_str)
+    term_matrix.save(terms_path(date_str))
+    
+    return df, analysis, [df_file, analysis_file, str(aggregates_path(date_str)), str(terms_path(date_str))]
+
+def process_stream(stories, label, chunk_size=DEFAULT_CHUNK_SIZE, store=None, history=None,
+                   output_dir=PROCESSED_DIR, index_path=None):
+    """
+    스토리를 chunk_size개씩 나눠 처리합니다. 묶음마다 DataFrame을 만들어 부분 집계에 더하고 처리 결과 파일에 이어 쓰므로,
+    메모리 사용량은 전체 스토리 수가 아니라 묶음 크기에 비례합니다. 스토리별 제목 용어 행렬은 저장하지 않습니다.
+    
+    Args:
+        stories (iterable): 스토리 (리스트, 제너레이터 모두 가능)
+        label (str): 결과 파일 이름에 넣을 날짜 또는 이름
+        chunk_size (int): 한 번에 처리할 스토리 수
+        store (StoryStore, optional): 속도 계산용 스냅샷을 조회할 저장소
+        history (list, optional): 키워드 급상승 기준선을 계산할 이전 날짜들의 부분 집계
+        output_dir (Path): 결과 파일을 저장할 디렉토리
+        index_path (Path, optional): 유사 중복 인덱스 경로 (기본값: 날짜를 넘어 유지되는 공용 인덱스)
+    
+    Returns:
+        tuple: (분석 결과, 저장된 파일 경로들), 처리한 스토리가 없으면 (None, [])
+    """
+    aggregates = StoryAggregates()
+    aggregates.dates.append(label)
+    cluster_stats = ClusterStats()
+    discussion_stats = {}
+    rising = None
+    chunk_count = 0
+    
+    with ProcessedWriter(label, output_dir) as writer, NearDuplicateIndex(index_path) as index:
+        for chunk in iter_chunks(stories, chunk_size):
+            df = convert_to_dataframe(chunk)
+            df = extract_domains(df)
+            if store is not None:
+                snapshots = store.get_snapshots([story['id'] for story in chunk])
+                df = add_velocity(df, chunk, snapshots)
+            df = add_clusters(df, index)
+            
+            # 분석 카운터를 묶음 단위로 갱신 (급상승 스토리는 상위 후보만 유지)
+            aggregates.add_dataframe(df)
+            cluster_stats.add(df['id'].tolist(), df['cluster_id'].tolist())
+            discussion_stats.update(extract_discussion_stats(chunk))
+            if 'score_velocity' in df.columns:
+                candidates = top_rising_stories(df)
+                rising = candidates if rising is None else top_rising_stories(pd.concat([rising, candidates]))
+            
+            writer.write(df)
+            chunk_count += 1
+            print(f"Processed chunk {chunk_count} ({aggregates.total_stories} stories)")
+    
+    if not chunk_count:
+        print("No stories to process")
+        return None, []
+    
+    df_file = writer.path
+    print(f"Saved processed data to {df_file}")
+    
+    analysis = aggregates.to_analysis()
+    analysis['rising_stories'] = summarize_rising_stories(rising) if rising is not None else []
+    analysis['keyword_bursts'] = detect_bursts(aggregates, history) if history is not None else []
+    analysis.update(cluster_stats.to_analysis())
+    analysis['discussion_stats'] = discussion_stats
+    
+    analysis_file = save_analysis(analysis, label, output_dir)
+    aggregates.save(aggregates_path(label, output_dir))
+    
+    return analysis, [str(df_file), analysis_file, str(aggregates_path(label, output_dir))]
+
+def process_stream_date(date_str=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    저장소에서 수집일의 스토리를 chunk_size개씩 읽어 스트리밍으로 처리합니다.
     
-    return df, analysis, [df_file, analysis_file]
+    Args:
+        date_str (str, optional): 수집일 (YYYY-MM-DD, 기본값: 저장소의 가장 최근 수집일)
+        chunk_size (int): 한 번에 처리할 스토리 수
+    
+    Returns:
+        tuple: (분석 결과, 저장된 파일 경로들)
+    """
+    with StoryStore() as store:
+        date_str = date_str or store.latest_date()
+        if not date_str:
+            print("No stories found in store")
+            return None, []
+        
+        print(f"Streaming stories collected on {date_str} in chunks of {chunk_size}")
+        history = load_history_aggregates(store, date_str)
+        return process_stream(store.iter_stories(date=date_str, batch_size=chunk_size), date_str, chunk_size, store,
+                              history)
+
+def process_stream_file(file_path, chunk_size=DEFAULT_CHUNK_SIZE, output_dir=INPUTS_DIR):
+    """
+    JSON 배열 또는 NDJSON 파일의 스토리를 chunk_size개씩 읽어 스트리밍으로 처리합니다.
+    결과는 수집일 결과와 섞이지 않도록 output_dir에 입력 파일 이름(확장자 제외)으로 저장하고,
+    유사 중복 묶음은 공용 인덱스 대신 처리가 끝나면 지우는 임시 인덱스로 부여합니다.
+    
+    Args:
+        file_path (str): 입력 파일 경로
+        chunk_size (int): 한 번에 처리할 스토리 수
+        output_dir (Path): 결과 파일을 저장할 디렉토리
+    
+    Returns:
+        tuple: (분석 결과, 저장된 파일 경로들)
+    """
+    print(f"Streaming stories from {file_path} in chunks of {chunk_size}")
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    
+    with StoryStore() as store, tempfile.TemporaryDirectory() as tmp_dir:
+        return process_stream(iter_stories(file_path), Path(file_path).stem, chunk_size, store,
+                              output_dir=output_dir, index_path=Path(tmp_dir) / "near_duplicates.sqlite3")
 
 def main():
     """
     메인 함수: 최신 데이터를 처리하고 분석합니다.
     """
+    parser = argparse.ArgumentParser(description="수집된 스토리 처리 및 분석")
+    parser.add_argument("date", nargs='?', default=None, help="처리할 수집일 (YYYY-MM-DD, 기본값: 가장 최근 수집일)")
+    parser.add_argument("--from", dest="start_date", default=None,
+                        help="기간 분석 시작 수집일 (YYYY-MM-DD, 지정하면 날짜별 부분 집계를 합쳐 기간 분석)")
+    parser.add_argument("--to", dest="end_date", default=None, help="기간 분석 끝 수집일 (기본값: 오늘)")
+    parser.add_argument("--stream", action="store_true", help="스토리를 묶음 단위로 읽어 처리 (메모리 사용량을 묶음 크기로 제한)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE,
+                        help=f"스트리밍 처리 묶음 크기 (기본값: {DEFAULT_CHUNK_SIZE})")
+    parser.add_argument("--input", default=None, help="저장소 대신 스트리밍으로 처리할 JSON 배열/NDJSON 파일")
+    parser.add_argument("--output-dir", default=str(INPUTS_DIR),
+                        help=f"--input 처리 결과를 저장할 디렉토리 (기본값: {INPUTS_DIR})")
+    args = parser.parse_args()
+    
+    if args.chunk_size < 1:
+        parser.error("--chunk-size must be at least 1")
+    
+    if args.start_date:
+        end_date = args.end_date or datetime.datetime.now().strftime('%Y-%m-%d')
+        analyze_date_range(args.start_date, end_date)
+        return
+    
+    if args.stream or args.input:
+        if args.input:
+            analysis, saved_files = process_stream_file(args.input, args.chunk_size, args.output_dir)
+        else:
+            analysis, saved_files = process_stream_date(args.date, args.chunk_size)
+        
+        if analysis is not None:
+            print(f"Processed {analysis['total_stories']} stories")
+        else:
+            print("No data processed")
+        return
+    
     print("Starting data processing pipeline...")
     
-    df, analysis, saved_files = process_latest_data()
+    df, analysis, saved_files = process_latest_data(args.date)
     
     if df is not None:
         print(f"Processed {len(df)} stories")
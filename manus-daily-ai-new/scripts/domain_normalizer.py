@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+도메인 정규화 모듈
+URL의 호스트를 함께 배포하는 Public Suffix List로 등록 도메인(eTLD+1)으로 정규화합니다.
+(예: blog.openai.com -> openai.com, news.bbc.co.uk -> bbc.co.uk, user.github.io -> user.github.io)
+"""
+
+import re
+from functools import lru_cache
+from pathlib import Path
+
+# 함께 배포하는 Public Suffix List (https://publicsuffix.org/list/public_suffix_list.dat, 네트워크 없이 사용)
+SUFFIX_LIST_PATH = Path(__file__).parent / "public_suffix_list.dat"
+
+# 등록 도메인으로 줄이지 않고 그대로 사용할 IPv4 주소
+IPV4_PATTERN = re.compile(r'^\d{1,3}(?:\.\d{1,3}){3}$')
+
+# 호스트별 등록 도메인 메모 크기
+DOMAIN_CACHE_SIZE = 100000
+
+class PublicSuffixList:
+    """
+    Public Suffix List 규칙(일반, 와일드카드 '*.', 예외 '!')으로 공개 접미사와 등록 도메인을 계산합니다.
+    
+    Args:
+        path (str | Path): 접미사 목록 파일 경로
+    """
+    
+    def __init__(self, path=SUFFIX_LIST_PATH):
+        self.rules = set()
+        self.wildcards = set()
+        self.exceptions = set()
+        
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                rule = line.split(None, 1)[0] if line.strip() else ''
+                if not rule or rule.startswith('//'):
+                    continue
+                
+                for form in self._forms(rule.lower()):
+                    if form.startswith('!'):
+                        self.exceptions.add(form[1:])
+                    elif form.startswith('*.'):
+                        self.wildcards.add(form[2:])
+                    else:
+                        self.rules.add(form)
+    
+    @staticmethod
+    def _forms(rule):
+        """
+        규칙의 유니코드 형태와 퓨니코드(xn--) 형태를 반환합니다. URL의 호스트는 둘 중 하나로 올 수 있습니다.
+        
+        Args:
+            rule (str): 규칙
+        
+        Returns:
+            set: 규칙 형태 목록
+        """
+        forms = {rule}
+        prefix = rule[:2] if rule.startswith('*.') else rule[:1] if rule.startswith('!') else ''
+        
+        try:
+            forms.add(prefix + rule[len(prefix):].encode('idna').decode('ascii'))
+        except UnicodeError:
+            pass
+        
+        return forms
+    
+    def public_suffix(self, host):
+        """
+        호스트의 공개 접미사를 찾습니다. 일치하는 규칙이 없으면 마지막 레이블을 접미사로 봅니다.
+        
+        Args:
+            host (str): 소문자 호스트
+        
+        Returns:
+            str: 공개 접미사
+        """
+        labels = host.split('.')
+        
+        # 긴 후보부터 확인하므로 가장 긴 규칙이 먼저 일치하고, 예외 규칙은 해당 와일드카드보다 먼저 확인됨
+        for index in range(len(labels)):
+            candidate = '.'.join(labels[index:])
+            if candidate in self.exceptions:
+                return '.'.join(labels[index + 1:])
+            if candidate in self.rules:
+                return candidate
+            if index + 1 < len(labels) and '.'.join(labels[index + 1:]) in self.wildcards:
+                return candidate
+        
+        return labels[-1]
+    
+    def registered_domain(self, host):
+        """
+        호스트의 등록 도메인(공개 접미사 + 레이블 하나)을 계산합니다.
+        
+        Args:
+            host (str): 소문자 호스트
+        
+        Returns:
+            str: 등록 도메인 (호스트 자체가 공개 접미사이면 호스트 그대로)
+        """
+        suffix = self.public_suffix(host)
+        if host == suffix:
+            return host
+        
+        labels = host[:-len(suffix) - 1].split('.')
+        return f"{labels[-1]}.{suffix}"
+
+# 모듈 전체에서 공유하는 접미사 목록 (처음 사용할 때 로드)
+_suffix_list = None
+
+def get_suffix_list():
+    """
+    공유 접미사 목록을 반환합니다. 처음 호출 시 파일에서 로드합니다.
+    
+    Returns:
+        PublicSuffixList: 공유 접미사 목록
+    """
+    global _suffix_list
+    
+    if _suffix_list is None:
+        _suffix_list = PublicSuffixList()
+    return _suffix_list
+
+@lru_cache(maxsize=DOMAIN_CACHE_SIZE)
+def registered_domain(host):
+    """
+    호스트를 등록 도메인으로 정규화합니다. 같은 호스트는 한 번만 계산합니다.
+    
+    Args:
+        host (str): 호스트 (대소문자, 끝의 '.' 무관)
+    
+    Returns:
+        str: 등록 도메인 (IP 주소는 그대로, 빈 호스트는 빈 문자열)
+    """
+    host = host.strip().rstrip('.').lower()
+    if not host or IPV4_PATTERN.match(host) or '[' in host:
+        return host
+    
+    return get_suffix_list().registered_domain(host)
+
+def url_netloc(url):
+    """
+    URL에서 스킴 뒤의 네트워크 위치(사용자 정보, 호스트, 포트) 부분을 잘라냅니다.
+    정규식 없이 문자열 분할만 사용하므로 많은 URL에 반복 적용하기에 저렴합니다.
+    
+    Args:
+        url (str): URL
+    
+    Returns:
+        str: 네트워크 위치 (없으면 빈 문자열)
+    """
+    if not url or not isinstance(url, str):
+        return ''
+    
+    scheme, separator, rest = url.partition('://')
+    if not separator or not scheme.isalpha():
+        return ''
+    
+    return rest.split('/', 1)[0]
+
+@lru_cache(maxsize=DOMAIN_CACHE_SIZE)
+def netloc_host(netloc):
+    """
+    네트워크 위치에서 호스트를 추출합니다. (사용자 정보, 포트, 쿼리, 'www.' 제외)
+    
+    Args:
+        netloc (str): 네트워크 위치
+    
+    Returns:
+        str: 소문자 호스트 (없으면 빈 문자열)
+    """
+    netloc = netloc.split('?', 1)[0].split('#', 1)[0].rpartition('@')[2]
+    
+    if netloc.startswith('['):
+        # IPv6 주소는 대괄호까지 호스트로 사용
+        host = netloc[:netloc.find(']') + 1]
+    else:
+        host = netloc.split(':', 1)[0]
+    
+    host = host.lower().rstrip('.')
+    return host[4:] if host.startswith('www.') else host
+
+def url_host(url):
+    """
+    URL에서 호스트를 추출합니다. ('www.'와 포트 제외)
+    
+    Args:
+        url (str): URL
+    
+    Returns:
+        str: 소문자 호스트 (없으면 빈 문자열)
+    """
+    return netloc_host(url_netloc(url))
+
+def url_domain(url):
+    """
+    URL의 등록 도메인을 반환합니다.
+    
+    Args:
+        url (str): URL
+    
+    Returns:
+        str: 등록 도메인 (없으면 빈 문자열)
+    """
+    return registered_domain(url_host(url))
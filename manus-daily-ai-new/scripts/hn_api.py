@@ -9,8 +9,23 @@ import json
 import time
 import os
 import datetime
+import asyncio
+import argparse
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from api_scope import DEFAULT_HN_API_BASE, scoped_path
+from hn_client import get_client, configure_client, DEFAULT_POOL_SIZE
+from rate_limiter import SharedRateLimiter
+from item_cache import ItemCache, DEFAULT_CACHE_PATH
+from keyword_matcher import KeywordMatcher
+from story_sink import StorySink, iter_ndjson
+from story_store import StoryStore, DEFAULT_STORE_PATH
+from comment_crawler import crawl_discussions, DEFAULT_MAX_DEPTH, DEFAULT_MAX_NODES
+from collection_budget import CollectionBudget, SourceYieldStats, SOURCE_YIELD_FILE, prioritize_plan
+from refresh_queue import build_refresh_queue, DEFAULT_REFRESH_RPM
+from collector_metrics import get_metrics, reset_metrics, METRICS_DIR
+
 # 기본 경로 설정
 BASE_DIR = Path(__file__).parent.parent
 DATA_DIR = BASE_DIR / "data"
@@ -20,13 +35,30 @@ REPORTS_DIR = BASE_DIR / "reports"
 DATA_DIR.mkdir(exist_ok=True)
 REPORTS_DIR.mkdir(exist_ok=True)
 
-# Hacker News API 엔드포인트
-HN_API_BASE = "https://hacker-news.firebaseio.com/v0"
+# Hacker News API 엔드포인트 (HN_API_BASE 환경 변수로 재정의 가능, 예: 로컬 리플레이 서버)
+HN_API_BASE = os.environ.get("HN_API_BASE", DEFAULT_HN_API_BASE).rstrip('/')
 HN_ITEM_URL = f"{HN_API_BASE}/item"
 HN_TOP_STORIES_URL = f"{HN_API_BASE}/topstories.json"
 HN_NEW_STORIES_URL = f"{HN_API_BASE}/newstories.json"
 HN_SHOW_STORIES_URL = f"{HN_API_BASE}/showstories.json"
 HN_ASK_STORIES_URL = f"{HN_API_BASE}/askstories.json"
+HN_MAX_ITEM_URL = f"{HN_API_BASE}/maxitem.json"
+HN_UPDATES_URL = f"{HN_API_BASE}/updates.json"
+
+# 증분 수집 체크포인트 파일
+CHECKPOINT_FILE = DATA_DIR / "collector_checkpoint.json"
+
+# 동시에 실행한 프로세스들이 함께 지키는 요청 상한 상태 파일
+RATE_LIMIT_FILE = DATA_DIR / "rate_limits.sqlite3"
+
+# 증분 수집 1회에 확인할 최대 신규 아이템 수 (초과분은 가장 최근 아이템만 확인)
+MAX_INCREMENTAL_NEW_ITEMS = 5000
+
+# 댓글 트리를 탐색할 스토리 수 (댓글 수 상위)
+DEFAULT_DISCUSSION_STORIES = 10
+
+# 아이템 동시 요청 수 기본값 (커넥션 풀 크기를 넘으면 연결 재사용 효과가 줄어듦)
+DEFAULT_CONCURRENCY = DEFAULT_POOL_SIZE
 
 # AI 관련 키워드 (소문자로 저장)
 AI_KEYWORDS = [
@@ -49,6 +81,42 @@ STARTUP_KEYWORDS = [
     'scale', 'scaling', 'growth', 'revenue', 'customer', 'pitch', 'demo day'
 ]
 
+# AI/스타트업 키워드를 한 번에 검사하는 매처 (모듈 로드 시 한 번만 컴파일)
+KEYWORD_MATCHER = KeywordMatcher({'ai': AI_KEYWORDS, 'startup': STARTUP_KEYWORDS})
+
+def set_api_base(base_url):
+    """
+    Hacker News API 기본 URL을 바꿉니다. (오프라인 벤치마크용 리플레이 서버 등)
+    이후에 여는 저장소와 하위 프로세스(처리, 리포트)도 같은 서버별 경로를 쓰도록 HN_API_BASE 환경 변수도 바꿉니다.
+    
+    Args:
+        base_url (str): 새 기본 URL (예: 'http://127.0.0.1:8765/v0')
+    """
+    global HN_API_BASE, HN_ITEM_URL, HN_TOP_STORIES_URL, HN_NEW_STORIES_URL, HN_SHOW_STORIES_URL
+    global HN_ASK_STORIES_URL, HN_MAX_ITEM_URL, HN_UPDATES_URL
+    
+    HN_API_BASE = base_url.rstrip('/')
+    os.environ["HN_API_BASE"] = HN_API_BASE
+    HN_ITEM_URL = f"{HN_API_BASE}/item"
+    HN_TOP_STORIES_URL = f"{HN_API_BASE}/topstories.json"
+    HN_NEW_STORIES_URL = f"{HN_API_BASE}/newstories.json"
+    HN_SHOW_STORIES_URL = f"{HN_API_BASE}/showstories.json"
+    HN_ASK_STORIES_URL = f"{HN_API_BASE}/askstories.json"
+    HN_MAX_ITEM_URL = f"{HN_API_BASE}/maxitem.json"
+    HN_UPDATES_URL = f"{HN_API_BASE}/updates.json"
+
+def api_scoped_path(path):
+    """
+    공식 API가 아닌 서버를 사용할 때 캐시/체크포인트 파일이 섞이지 않도록 서버별 경로를 만듭니다.
+    
+    Args:
+        path (Path): 공식 API에서 사용하는 경로
+    
+    Returns:
+        Path: 현재 API 기본 URL에 해당하는 경로
+    """
+    return scoped_path(path, HN_API_BASE)
+
 def get_stories(story_type='top', limit=100):
     """
     Hacker News에서 스토리 ID 목록을 가져옵니다.
@@ -70,10 +138,8 @@ def get_stories(story_type='top', limit=100):
     url = url_map.get(story_type, HN_TOP_STORIES_URL)
     
     try:
-        response = requests.get(url)
-        response.raise_for_status()
-        story_ids = response.json()
-        return story_ids[:limit]
+        story_ids = get_client().get_json(url)
+        return (story_ids or [])[:limit]
     except requests.exceptions.RequestException as e:
         print(f"Error fetching stories: {e}")
         return []
@@ -91,13 +157,104 @@ def get_item_details(item_id):
     url = f"{HN_ITEM_URL}/{item_id}.json"
     
     try:
-        response = requests.get(url)
-        response.raise_for_status()
-        return response.json()
+        return get_client().get_json(url)
     except requests.exceptions.RequestException as e:
         print(f"Error fetching item {item_id}: {e}")
         return None
 
+def get_item_field(item_id, field):
+    """
+    아이템의 특정 필드 값만 가져옵니다.
+    
+    Args:
+        item_id (int): 아이템 ID
+        field (str): 필드 이름 (예: 'score')
+    
+    Returns:
+        필드 값 (필드가 없으면 None)
+    
+    Raises:
+        requests.exceptions.RequestException: 요청 실패 시
+    """
+    return get_client().get_json(f"{HN_ITEM_URL}/{item_id}/{field}.json")
+
+# 모듈 전체에서 공유하는 아이템 캐시
+_item_cache = None
+
+def get_item_cache():
+    """
+    공유 아이템 캐시를 반환합니다. 처음 호출 시 생성합니다.
+    
+    Returns:
+        ItemCache: 공유 아이템 캐시
+    """
+    global _item_cache
+    
+    if _item_cache is None:
+        _item_cache = ItemCache(api_scoped_path(DEFAULT_CACHE_PATH))
+    return _item_cache
+
+def get_item_cached(item_id, cache=None):
+    """
+    캐시를 우선 사용하여 아이템 세부 정보를 가져옵니다.
+    바뀌지 않는 필드는 캐시에서 그대로 반환하고, TTL이 지난 필드만 새로 가져옵니다.
+    
+    Args:
+        item_id (int): 아이템 ID
+        cache (ItemCache, optional): 사용할 캐시 (기본값: 공유 캐시)
+    
+    Returns:
+        dict: 아이템 세부 정보
+    """
+    cache = cache or get_item_cache()
+    item, stale_fields = cache.get(item_id)
+    
+    # 캐시에 없으면 전체 아이템 요청
+    if item is None:
+        item = get_item_details(item_id)
+        if item:
+            cache.put(item)
+        return item
+    
+    if not stale_fields:
+        return item
+    
+    try:
+        if len(stale_fields) == 1:
+            # 필드 하나만 오래되었으면 해당 필드만 요청
+            field = stale_fields[0]
+            values = {field: get_item_field(item_id, field)}
+        else:
+            # 여러 필드가 오래되었으면 전체 아이템 한 번 요청이 더 저렴함
+            fresh = get_client().get_json(f"{HN_ITEM_URL}/{item_id}.json")
+            if not fresh:
+                return item
+            values = {field: fresh.get(field) for field in stale_fields}
+    except requests.exceptions.RequestException as e:
+        # 갱신에 실패하면 캐시된 값을 그대로 사용
+        print(f"Error refreshing item {item_id}: {e}")
+        return item
+    
+    return cache.update_fields(item_id, values) or item
+
+def match_ai_startup_keywords(item):
+    """
+    아이템의 제목, 본문, URL에서 매칭된 AI/스타트업 키워드를 찾습니다.
+    
+    Args:
+        item (dict): 아이템 세부 정보
+    
+    Returns:
+        dict: {'ai': [...], 'startup': [...]} 형식의 매칭된 키워드 목록
+    """
+    if not item:
+        return {'ai': [], 'startup': []}
+    
+    # 제목, 텍스트, URL 결합
+    combined_text = f"{item.get('title', '')} {item.get('text', '')} {item.get('url', '')}"
+    
+    return KEYWORD_MATCHER.find(combined_text)
+
 def is_ai_startup_related(item):
     """
     아이템이 AI 스타트업 관련인지 확인합니다.
@@ -108,110 +265,611 @@ def is_ai_startup_related(item):
     Returns:
         bool: AI 스타트업 관련 여부
     """
+    matched = match_ai_startup_keywords(item)
+    
+    # AI 관련 키워드가 있으면 관련 있는 것으로 간주
+    # 스타트업 키워드가 있으면 더 관련성이 높음
+    return bool(matched['ai'] or matched['startup'])
+
+def accept_ai_startup_story(item, stories_only=False):
+    """
+    아이템이 AI 스타트업 관련 스토리인지 확인하고, 관련 있으면 수집 정보를 추가합니다.
+    
+    Args:
+        item (dict): 아이템 세부 정보 (실패한 항목은 None)
+        stories_only (bool): 'story' 유형만 사용할지 여부
+    
+    Returns:
+        bool: 채택 여부
+    """
     if not item:
+        get_metrics().record_filter(None, False, 'missing')
+        return False
+    if stories_only and item.get('type') != 'story':
+        # 키워드별 거부 수를 남기기 위해 매칭 (요청 한 번에 비하면 비용이 무시할 만함)
+        get_metrics().record_filter(match_ai_startup_keywords(item), False, 'not_story')
         return False
     
-    # 제목과 텍스트 추출 (소문자로 변환)
-    title = item.get('title', '').lower()
-    text = item.get('text', '').lower()
-    url = item.get('url', '').lower()
+    matched = match_ai_startup_keywords(item)
+    if not (matched['ai'] or matched['startup']):
+        get_metrics().record_filter(matched, False, 'no_keyword')
+        return False
     
-    # 텍스트 결합
-    combined_text = f"{title} {text} {url}"
+    get_metrics().record_filter(matched, True)
     
-    # AI 키워드 확인
-    has_ai_keyword = any(keyword in combined_text for keyword in AI_KEYWORDS)
+    # 수집 시간과 매칭된 키워드 추가
+    item['collected_at'] = datetime.datetime.now().isoformat()
+    item['matched_keywords'] = matched
     
-    # 스타트업 키워드 확인
-    has_startup_keyword = any(keyword in combined_text for keyword in STARTUP_KEYWORDS)
+    print(f"Found AI startup related story: {item.get('title')}")
+    return True
+
+def collect_matching_stories(item_ids, fetch_func, concurrency=DEFAULT_CONCURRENCY, sink=None,
+                             stories_only=False, annotate=None, should_continue=None):
+    """
+    아이템을 동시에 가져오면서 AI 스타트업 관련 스토리를 고릅니다.
+    sink가 주어지면 채택한 스토리를 바로 기록하고, 이미 기록된 ID는 다시 가져오지 않습니다.
     
-    # AI 관련 키워드가 있으면 관련 있는 것으로 간주
-    # 스타트업 키워드가 있으면 더 관련성이 높음
-    return has_ai_keyword or has_startup_keyword
+    Args:
+        item_ids (list): 가져올 아이템 ID 목록
+        fetch_func (callable): 아이템 ID를 받아 세부 정보를 반환하는 함수
+        concurrency (int): 아이템 동시 요청 수
+        sink (StorySink, optional): 채택한 스토리를 기록할 저장소
+        stories_only (bool): 'story' 유형만 사용할지 여부
+        annotate (callable, optional): 필터 전에 아이템에 정보를 추가할 함수
+        should_continue (callable, optional): 요청 전마다 호출해 False이면 남은 아이템을 건너뛰는 함수
+    
+    Returns:
+        list: 이전에 기록된 스토리 + 이번에 채택한 스토리 (item_ids 순서)
+    """
+    resumed = []
+    if sink is not None and sink.written_ids:
+        resumed = list(iter_ndjson(sink.path))
+        item_ids = [item_id for item_id in item_ids if item_id not in sink]
+        print(f"Resuming: {len(resumed)} stories already written, {len(item_ids)} items left")
+    
+    accepted = {}
+    fetched = 0
+    
+    def on_item(index, item):
+        nonlocal fetched
+        fetched += 1
+        if item and annotate:
+            annotate(item)
+        if accept_ai_startup_story(item, stories_only):
+            accepted[index] = item
+            if sink is not None:
+                sink.write(item)
+    
+    start_time = time.monotonic()
+    fetch_items_concurrently(item_ids, concurrency, fetch_func, on_item, should_continue)
+    
+    skipped = len(item_ids) - fetched
+    print(f"Fetched {fetched} items in {time.monotonic() - start_time:.1f}s"
+          + (f" ({skipped} skipped, budget exhausted)" if skipped else ""))
+    
+    return resumed + [accepted[index] for index in sorted(accepted)]
 
-def fetch_ai_startup_stories(story_types=['top', 'new', 'show'], limit_per_type=100, max_stories=50):
+async def _fetch_items_async(item_ids, concurrency, fetch_func, on_item=None, should_continue=None,
+                             show_progress=True):
     """
-    여러 유형의 스토리에서 AI 스타트업 관련 스토리를 수집합니다.
+    세마포어로 동시 요청 수를 제한하면서 아이템들을 병렬로 가져옵니다.
     
     Args:
-        story_types (list): 수집할 스토리 유형 목록
-        limit_per_type (int): 각 유형별로 가져올 스토리 수
-        max_stories (int): 처리할 최대 스토리 수 (모든 유형 합계)
+        item_ids (list): 가져올 아이템 ID 목록
+        concurrency (int): 동시에 진행할 최대 요청 수
+        fetch_func (callable): 아이템 ID를 받아 세부 정보를 반환하는 함수
+        on_item (callable, optional): 아이템 하나를 가져올 때마다 (인덱스, 아이템)으로 호출할 함수
+        should_continue (callable, optional): 요청 전마다 호출해 False이면 요청을 보내지 않는 함수
+        show_progress (bool): 진행 상황 출력 여부
+    
+    Returns:
+        list: item_ids와 같은 순서의 아이템 목록 (실패하거나 건너뛴 항목은 None)
+    """
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(concurrency)
+    completed = 0
+    
+    # requests는 동기 라이브러리이므로 스레드 풀에서 실행
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        async def fetch_one(index, item_id):
+            nonlocal completed
+            async with semaphore:
+                # 예산이 끝났으면 요청을 보내지 않음 (세마포어 순서대로 검사하므로 우선순위 순서 유지)
+                if should_continue is not None and not should_continue():
+                    return None
+                item = await loop.run_in_executor(executor, fetch_func, item_id)
+            
+            get_metrics().record_item(item)
+            if on_item is not None:
+                on_item(index, item)
+            
+            # 진행 상황 표시 (10개마다)
+            completed += 1
+            if show_progress and (completed % 10 == 0 or completed == len(item_ids)):
+                print(f"Fetched {completed}/{len(item_ids)} items...")
+            return item
         
+        return await asyncio.gather(*(fetch_one(index, item_id) for index, item_id in enumerate(item_ids)))
+
+def fetch_items_concurrently(item_ids, concurrency=DEFAULT_CONCURRENCY, fetch_func=None, on_item=None,
+                             should_continue=None, show_progress=True):
+    """
+    여러 아이템의 세부 정보를 동시에 가져옵니다.
+    
+    Args:
+        item_ids (list): 가져올 아이템 ID 목록
+        concurrency (int): 동시에 진행할 최대 요청 수
+        fetch_func (callable, optional): 아이템을 가져올 함수 (기본값: get_item_details)
+        on_item (callable, optional): 아이템 하나를 가져올 때마다 (인덱스, 아이템)으로 호출할 함수
+        should_continue (callable, optional): 요청 전마다 호출해 False이면 요청을 보내지 않는 함수
+        show_progress (bool): 진행 상황 출력 여부
+    
     Returns:
-        list: AI 스타트업 관련 스토리 목록
+        list: item_ids와 같은 순서의 아이템 목록 (실패하거나 건너뛴 항목은 None)
+    """
+    if not item_ids:
+        return []
+    
+    fetch_func = fetch_func or get_item_details
+    concurrency = max(1, min(concurrency, len(item_ids)))
+    
+    return asyncio.run(_fetch_items_async(item_ids, concurrency, fetch_func, on_item, should_continue,
+                                          show_progress))
+
+def plan_fetch(story_types, limit_per_type):
+    """
+    여러 목록의 스토리 ID를 합쳐 중복을 제거하고 가져올 순서를 정합니다.
+    
+    Args:
+        story_types (list): 스토리 유형 목록
+        limit_per_type (int): 각 유형별로 가져올 스토리 수
+    
+    Returns:
+        list: 우선순위 순으로 정렬된 {'id', 'sources', 'rank'} 목록
+              (sources: ID가 나온 목록들, rank: 목록들 중 가장 높은 순위)
     """
-    ai_startup_stories = []
-    total_stories_processed = 0
+    plan = {}
+    total_ids = 0
     
     for story_type in story_types:
         print(f"Fetching {story_type} stories...")
         story_ids = get_stories(story_type, limit_per_type)
+        total_ids += len(story_ids)
         
-        for i, story_id in enumerate(story_ids):
-            # 최대 스토리 수 확인
-            if total_stories_processed >= max_stories:
-                print(f"Reached maximum number of stories to process ({max_stories})")
-                return ai_startup_stories
-                
-            # 진행 상황 표시 (10개마다)
-            if i % 10 == 0:
-                print(f"Processing {story_type} story {i+1}/{len(story_ids)}...")
-                
-            # API 요청 간 지연 추가 (0.5초로 증가)
-            time.sleep(0.5)
-            
-            item = get_item_details(story_id)
-            if item and is_ai_startup_related(item):
-                # 수집 시간 추가
-                item['collected_at'] = datetime.datetime.now().isoformat()
-                ai_startup_stories.append(item)
-                
-                print(f"Found AI startup related story: {item.get('title')}")
-            
-            total_stories_processed += 1
+        for rank, story_id in enumerate(story_ids):
+            entry = plan.get(story_id)
+            if entry is None:
+                plan[story_id] = {'id': story_id, 'sources': [story_type], 'rank': rank}
+            else:
+                entry['sources'].append(story_type)
+                entry['rank'] = min(entry['rank'], rank)
+    
+    # 목록 순위가 높을수록, 여러 목록에 나올수록, 앞선 유형에서 나왔을수록 우선
+    ordered = sorted(
+        plan.values(),
+        key=lambda entry: (entry['rank'], -len(entry['sources']), story_types.index(entry['sources'][0]))
+    )
     
-    return ai_startup_stories
+    print(f"Planned {len(ordered)} unique stories from {total_ids} list entries "
+          f"({total_ids - len(ordered)} duplicates removed)")
+    return ordered
 
-def save_stories_to_file(stories, filename=None):
+def fetch_ai_startup_stories(story_types=['top', 'new', 'show'], limit_per_type=100, max_stories=50,
+                             concurrency=DEFAULT_CONCURRENCY, use_cache=True, sink=None,
+                             time_budget=None, request_budget=None, budget=None):
     """
-    수집된 스토리를 JSON 파일로 저장합니다.
+    여러 유형의 스토리에서 AI 스타트업 관련 스토리를 수집합니다.
+    목록 간 중복 스토리는 한 번만 가져옵니다.
+    시간 예산이나 요청 예산이 주어지면 max_stories 대신 예산이 끝날 때까지 수집하며,
+    목록 순위, 목록별 키워드 적중률, 캐시 여부로 계산한 기대 수확량이 높은 후보부터 가져옵니다.
     
     Args:
-        stories (list): 저장할 스토리 목록
-        filename (str, optional): 저장할 파일 이름
+        story_types (list): 수집할 스토리 유형 목록
+        limit_per_type (int): 각 유형별로 가져올 스토리 수
+        max_stories (int): 처리할 최대 스토리 수 (중복 제거 후 모든 유형 합계)
+        concurrency (int): 아이템 동시 요청 수
+        use_cache (bool): 아이템 캐시 사용 여부
+        sink (StorySink, optional): 채택한 스토리를 바로 기록할 저장소 (중단 후 재시작 시 이어서 수집)
+        time_budget (float, optional): 시간 예산(초)
+        request_budget (int, optional): HTTP 요청 예산
+        budget (CollectionBudget, optional): 실행 전체가 함께 쓰는 예산 (주어지면 time_budget, request_budget 대신 사용)
         
     Returns:
-        str: 저장된 파일 경로
+        list: AI 스타트업 관련 스토리 목록
+    """
+    if budget is None and (time_budget is not None or request_budget is not None):
+        # 목록 요청도 예산에 포함되도록 목록을 가져오기 전에 시작
+        budget = CollectionBudget(time_budget, request_budget, lambda: get_client().requests_sent)
+    
+    plan = plan_fetch(story_types, limit_per_type)
+    yield_stats = SourceYieldStats(api_scoped_path(SOURCE_YIELD_FILE))
+    
+    if budget is not None:
+        cached_ids = get_item_cache().cached_ids(entry['id'] for entry in plan) if use_cache else set()
+        plan = prioritize_plan(plan, yield_stats, cached_ids)
+        print(f"Collecting with budget: "
+              f"{f'{budget.time_budget}s' if budget.time_budget is not None else 'unlimited time'}, "
+              f"{f'{budget.request_budget} requests' if budget.request_budget is not None else 'unlimited requests'} "
+              f"({len(cached_ids)} candidates cached)")
+    elif len(plan) > max_stories:
+        # 최대 스토리 수 확인
+        print(f"Reached maximum number of stories to process ({max_stories})")
+        plan = plan[:max_stories]
+    
+    plan_by_id = {entry['id']: entry for entry in plan}
+    fetched_ids = []
+    
+    # 각 스토리가 어느 목록에서 왔는지 기록
+    def annotate(item):
+        entry = plan_by_id.get(item.get('id'))
+        if entry:
+            item['source_lists'] = entry['sources']
+            item['list_rank'] = entry['rank']
+            fetched_ids.append(entry['id'])
+    
+    print(f"Fetching {len(plan)} items (concurrency: {concurrency})...")
+    fetch_func = get_item_cached if use_cache else get_item_details
+    
+    stories = collect_matching_stories(list(plan_by_id), fetch_func, concurrency, sink, annotate=annotate,
+                                       should_continue=budget.should_continue if budget else None)
+    
+    # 목록별 적중률 갱신 (다음 실행의 우선순위 계산에 사용)
+    accepted_ids = {story.get('id') for story in stories}
+    for item_id in fetched_ids:
+        yield_stats.record(plan_by_id[item_id]['sources'], item_id in accepted_ids)
+    yield_stats.save()
+    
+    if budget is not None:
+        report = budget.get_report()
+        print(f"Budget used: {report['time_used']}s, {report['requests_used']} requests "
+              f"(unused: {report['time_unused'] if report['time_unused'] is not None else '-'}s, "
+              f"{report['requests_unused'] if report['requests_unused'] is not None else '-'} requests, "
+              f"stopped by: {report['stopped_by'] or 'plan exhausted'})")
+    
+    return stories
+
+def add_discussion_stats(stories, top_n=DEFAULT_DISCUSSION_STORIES, max_depth=DEFAULT_MAX_DEPTH,
+                         max_nodes=DEFAULT_MAX_NODES, concurrency=DEFAULT_CONCURRENCY, budget=None):
+    """
+    댓글이 많은 스토리의 댓글 트리를 탐색하여 'discussion' 필드에 토론 통계를 추가합니다.
+    예산이 주어지면 댓글 요청도 같은 예산 안에서만 보내며, 예산이 이미 끝났으면 탐색하지 않습니다.
+    
+    Args:
+        stories (list): 스토리 목록
+        top_n (int): 댓글 트리를 탐색할 스토리 수 (댓글 수 상위)
+        max_depth (int): 탐색할 최대 댓글 깊이
+        max_nodes (int): 스토리당 가져올 최대 댓글 수
+        concurrency (int): 댓글 동시 요청 수
+        budget (CollectionBudget, optional): 수집과 함께 쓰는 예산
+    
+    Returns:
+        list: 토론 통계가 추가된 스토리 목록
+    """
+    targets = sorted(
+        (story for story in stories if story.get('kids')),
+        key=lambda story: story.get('descendants', 0),
+        reverse=True
+    )[:top_n]
+    
+    if not targets:
+        return stories
+    
+    should_continue = budget.should_continue if budget is not None else None
+    if should_continue is not None and not should_continue():
+        print("Skipping comment tree crawl: collection budget exhausted")
+        return stories
+    
+    print(f"Crawling comment trees of {len(targets)} stories (depth <= {max_depth}, <= {max_nodes} comments each)...")
+    discussions = crawl_discussions(
+        targets,
+        lambda item_ids: fetch_items_concurrently(item_ids, concurrency, get_item_cached, should_continue=should_continue),
+        KEYWORD_MATCHER,
+        max_depth=max_depth,
+        max_nodes=max_nodes,
+        should_continue=should_continue
+    )
+    
+    for story in targets:
+        story['discussion'] = discussions[story['id']]
+    
+    return stories
+
+def load_checkpoint(path=CHECKPOINT_FILE):
+    """
+    증분 수집 체크포인트를 로드합니다.
+    
+    Args:
+        path (Path): 체크포인트 파일 경로
+    
+    Returns:
+        dict: 체크포인트 (max_item, updates, saved_at) 또는 None
     """
-    if not filename:
-        # 현재 날짜를 파일 이름에 포함
-        today = datetime.datetime.now().strftime('%Y-%m-%d')
-        filename = f"hn_ai_startup_stories_{today}.json"
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        print(f"Error loading checkpoint from {path}: {e}")
+        return None
+
+def save_checkpoint(checkpoint, path=CHECKPOINT_FILE):
+    """
+    증분 수집 체크포인트를 원자적으로 저장합니다.
     
-    file_path = DATA_DIR / filename
+    Args:
+        checkpoint (dict): 저장할 체크포인트
+        path (Path): 체크포인트 파일 경로
+    """
+    tmp_path = Path(f"{path}.tmp")
     
-    with open(file_path, 'w', encoding='utf-8') as f:
-        json.dump(stories, f, ensure_ascii=False, indent=2)
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(checkpoint, f)
+    os.replace(tmp_path, path)
+
+def get_current_cursor():
+    """
+    현재 최대 아이템 ID와 최근 변경된 아이템 목록을 가져옵니다.
     
-    print(f"Saved {len(stories)} stories to {file_path}")
-    return str(file_path)
+    Returns:
+        dict: 체크포인트 형식의 현재 커서 (요청 실패 시 None)
+    """
+    try:
+        max_item = get_client().get_json(HN_MAX_ITEM_URL)
+        updates = get_client().get_json(HN_UPDATES_URL) or {}
+    except requests.exceptions.RequestException as e:
+        print(f"Error fetching maxitem/updates: {e}")
+        return None
+    
+    return {
+        'max_item': max_item,
+        'updates': updates.get('items', []),
+        'saved_at': datetime.datetime.now().isoformat()
+    }
+
+def get_item_fresh(item_id):
+    """
+    캐시를 건너뛰고 아이템을 새로 가져온 뒤 캐시에 저장합니다.
+    
+    Args:
+        item_id (int): 아이템 ID
+    
+    Returns:
+        dict: 아이템 세부 정보
+    """
+    item = get_item_details(item_id)
+    if item:
+        get_item_cache().put(item)
+    return item
+
+def fetch_incremental_stories(checkpoint, cursor, concurrency=DEFAULT_CONCURRENCY,
+                              max_new_items=MAX_INCREMENTAL_NEW_ITEMS, sink=None, budget=None):
+    """
+    체크포인트 이후 새로 생기거나 변경된 아이템 중 AI 스타트업 관련 스토리를 수집합니다.
+    예산이 끝나 일부 아이템만 확인했으면, 다음 실행에서 남은 아이템을 이어서 확인하도록 cursor를 고칩니다.
+    (max_item은 확인하지 못한 첫 신규 아이템 직전, updates에서는 확인하지 못한 변경 아이템 제외)
+    
+    Args:
+        checkpoint (dict): 이전 실행의 체크포인트
+        cursor (dict): 현재 커서 (get_current_cursor 결과, 다음 체크포인트로 저장됨)
+        concurrency (int): 아이템 동시 요청 수
+        max_new_items (int): 확인할 최대 신규 아이템 수
+        sink (StorySink, optional): 채택한 스토리를 바로 기록할 저장소
+        budget (CollectionBudget, optional): 수집 예산
+    
+    Returns:
+        list: AI 스타트업 관련 스토리 목록
+    """
+    last_max_item = checkpoint['max_item']
+    
+    # 마지막 maxitem 이후 새로 생성된 아이템
+    new_ids = list(range(last_max_item + 1, cursor['max_item'] + 1))
+    if len(new_ids) > max_new_items:
+        print(f"{len(new_ids)} new items since checkpoint, checking the latest {max_new_items} only")
+        new_ids = new_ids[-max_new_items:]
+    
+    # 이전 실행 이후 변경 목록에 새로 나타난 기존 아이템
+    seen_updates = set(checkpoint.get('updates', []))
+    changed_ids = [
+        item_id for item_id in cursor['updates']
+        if item_id not in seen_updates and item_id <= last_max_item
+    ]
+    
+    print(f"Incremental collection: {len(new_ids)} new items, {len(changed_ids)} changed items "
+          f"(maxitem {last_max_item} -> {cursor['max_item']})")
+    
+    # 예산이 끝나 확인하지 못한 아이템을 알 수 있도록 요청한 아이템 ID 기록
+    fetched_ids = set()
+    
+    def fetch_func(item_id):
+        fetched_ids.add(item_id)
+        return get_item_fresh(item_id)
+    
+    # 신규 아이템 대부분은 댓글이므로 스토리만 사용
+    stories = collect_matching_stories(new_ids + changed_ids, fetch_func, concurrency, sink, stories_only=True,
+                                       should_continue=budget.should_continue if budget is not None else None)
+    
+    if budget is not None and budget.stopped_by:
+        done = fetched_ids | (sink.written_ids if sink is not None else set())
+        pending_new = [item_id for item_id in new_ids if item_id not in done]
+        pending_changed = {item_id for item_id in changed_ids if item_id not in done}
+        if pending_new:
+            cursor['max_item'] = pending_new[0] - 1
+        cursor['updates'] = [item_id for item_id in cursor['updates'] if item_id not in pending_changed]
+        print(f"Budget exhausted with {len(pending_new)} new and {len(pending_changed)} changed items unchecked, "
+              f"next run resumes after item {cursor['max_item']}")
+    
+    return stories
+
+def save_stories_to_store(stories, collected_date=None):
+    """
+    수집된 스토리를 스토리 저장소에 저장합니다. 같은 ID는 최신 값으로 갱신되고 점수/댓글 수 스냅샷이 기록됩니다.
+    
+    Args:
+        stories (list): 저장할 스토리 목록
+        collected_date (str, optional): 수집일 (YYYY-MM-DD, 기본값: 오늘)
+    
+    Returns:
+        int: 저장한 스토리 수
+    """
+    collected_date = collected_date or datetime.datetime.now().strftime('%Y-%m-%d')
+    
+    with StoryStore(api_scoped_path(DEFAULT_STORE_PATH)) as store:
+        count = store.upsert(stories, collected_date)
+        print(f"Saved {count} stories to {store.path} ({store.count()} stories in store)")
+        
+        # 오래된 점수/댓글 수 스냅샷 정리
+        store.downsample_snapshots()
+    
+    return count
+
+def refresh_tracked_stories(max_requests=None, concurrency=DEFAULT_CONCURRENCY):
+    """
+    새로 고침 시각이 지난 추적 중인 스토리를 다시 가져와 점수/댓글 수와 스냅샷을 갱신합니다.
+    빠르게 오르는 스토리는 몇 분마다, 멈춘 스토리는 하루에 한 번 이하로 새로 고칩니다.
+    
+    Args:
+        max_requests (int, optional): 이번에 새로 고칠 최대 스토리 수
+        concurrency (int): 아이템 동시 요청 수
+    
+    Returns:
+        int: 갱신한 스토리 수
+    """
+    with StoryStore(api_scoped_path(DEFAULT_STORE_PATH)) as store:
+        queue = build_refresh_queue(store)
+        due_ids = queue.pop_due(limit=max_requests)
+        overdue = len(queue.pop_due())
+        
+        print(f"Refreshing {len(due_ids)} of {len(due_ids) + len(queue) + overdue} tracked stories"
+              + (f" ({overdue} due stories deferred by request limit)" if overdue else ""))
+        
+        items = fetch_items_concurrently(due_ids, concurrency, get_item_fresh)
+        updated = store.update_stories(items)
+        store.downsample_snapshots()
+        
+        # 요청 상한으로 미룬 스토리가 있으면 바로 다시 실행해야 함
+        next_due = time.time() if overdue else queue.peek_due()
+        if next_due is not None:
+            print(f"Next refresh due in {max(0, next_due - time.time()) / 60:.1f} minutes")
+    
+    print(f"Refreshed {updated} stories")
+    return updated
+
+def save_run_metrics():
+    """
+    이번 실행의 계측 값을 HTTP 클라이언트/캐시 통계와 함께 저장합니다.
+    """
+    extra = {'http_client': get_client().get_stats(), 'item_cache': get_item_cache().get_stats()}
+    # 리플레이 서버 등으로 실행한 계측 값이 실제 수집 기록에 섞이지 않도록 서버별 디렉토리에 저장
+    summary_path = get_metrics().save(api_scoped_path(METRICS_DIR), extra=extra)
+    print(f"Saved collector metrics to {summary_path}")
 
 def main():
     """
     메인 함수: AI 스타트업 관련 스토리를 수집하고 저장합니다.
     """
-    print("Starting Hacker News AI startup stories collection...")
+    parser = argparse.ArgumentParser(description="Hacker News AI 스타트업 스토리 수집")
+    parser.add_argument("--incremental", action="store_true",
+                        help="체크포인트 이후 새로 생기거나 변경된 아이템만 수집")
+    parser.add_argument("--api-base", default=None,
+                        help="Hacker News API 기본 URL (기본값: HN_API_BASE 환경 변수 또는 공식 API)")
+    parser.add_argument("--time-budget", type=float, default=None,
+                        help="전체 수집 시간 예산(초), 지정하면 최대 스토리 수 대신 예산 안에서 우선순위 순으로 수집")
+    parser.add_argument("--request-budget", type=int, default=None,
+                        help="전체 수집 HTTP 요청 예산")
+    parser.add_argument("--refresh", action="store_true",
+                        help="목록을 수집하지 않고 새로 고침 시각이 지난 추적 중인 스토리만 갱신 "
+                             "(--request-budget이 새로 고칠 최대 스토리 수)")
+    parser.add_argument("--refresh-rpm", type=float, default=DEFAULT_REFRESH_RPM,
+                        help="새로 고침 요청 상한 (분당 요청 수, 동시에 실행한 새로 고침 프로세스 전체 합계)")
+    parser.add_argument("--discussion-stories", type=int, default=DEFAULT_DISCUSSION_STORIES,
+                        help="댓글 트리를 탐색할 스토리 수 (0이면 탐색하지 않음)")
+    args = parser.parse_args()
     
-    # 여러 유형의 스토리에서 AI 스타트업 관련 스토리 수집
-    ai_startup_stories = fetch_ai_startup_stories()
+    if args.api_base:
+        set_api_base(args.api_base)
     
-    # 결과가 있으면 파일로 저장
+    reset_metrics('refresh' if args.refresh else 'incremental' if args.incremental else 'full')
+    
+    if args.refresh:
+        # 분당 요청 상한을 같은 API 서버로 동시에 실행한 새로 고침 프로세스 전체에 적용
+        rate = args.refresh_rpm / 60
+        rate_limiter = SharedRateLimiter(api_scoped_path(RATE_LIMIT_FILE), 'refresh', rate=rate, burst=max(1, rate))
+        configure_client(rate_limiter=rate_limiter)
+        print(f"Refreshing tracked stories from {HN_API_BASE} (up to {args.refresh_rpm:g} requests/minute)...")
+        refresh_tracked_stories(max_requests=args.request_budget)
+        save_run_metrics()
+        get_item_cache().close()
+        rate_limiter.close()
+        return
+    
+    print(f"Starting Hacker News AI startup stories collection from {HN_API_BASE}...")
+    
+    next_checkpoint = None
+    
+    # 목록, 아이템, 증분 커서, 댓글 트리 요청이 모두 같은 예산을 씀
+    budget = None
+    if args.time_budget is not None or args.request_budget is not None:
+        budget = CollectionBudget(args.time_budget, args.request_budget, lambda: get_client().requests_sent)
+    
+    # 채택한 스토리를 바로 기록하는 수집 저널 (중단되면 다음 실행에서 이어서 수집, 서버별로 따로 둠)
+    today = datetime.datetime.now().strftime('%Y-%m-%d')
+    journal_path = api_scoped_path(DATA_DIR / f"hn_ai_startup_stories_{today}.ndjson")
+    
+    with StorySink(journal_path) as sink:
+        if args.incremental:
+            checkpoint = load_checkpoint(api_scoped_path(CHECKPOINT_FILE))
+            # 수집 전에 커서를 잡아야 수집 중 생성된 아이템을 다음 실행에서 놓치지 않음
+            next_checkpoint = get_current_cursor()
+            
+            if next_checkpoint is None:
+                print("Could not read maxitem/updates, falling back to full collection")
+                ai_startup_stories = fetch_ai_startup_stories(sink=sink, budget=budget)
+            elif checkpoint is None:
+                print("No checkpoint found, running full collection")
+                ai_startup_stories = fetch_ai_startup_stories(sink=sink, budget=budget)
+            else:
+                ai_startup_stories = fetch_incremental_stories(checkpoint, next_checkpoint, sink=sink, budget=budget)
+        else:
+            # 여러 유형의 스토리에서 AI 스타트업 관련 스토리 수집
+            ai_startup_stories = fetch_ai_startup_stories(sink=sink, budget=budget)
+    
+    # 댓글이 많은 스토리의 토론 통계 추가
+    if args.discussion_stories > 0:
+        add_discussion_stats(ai_startup_stories, top_n=args.discussion_stories, budget=budget)
+    
+    # 결과가 있으면 저장소에 저장 (같은 ID는 갱신되므로 증분 수집도 그대로 병합됨)
     if ai_startup_stories:
-        save_stories_to_file(ai_startup_stories)
+        save_stories_to_store(ai_startup_stories, today)
         print(f"Collected {len(ai_startup_stories)} AI startup related stories")
     else:
         print("No AI startup related stories found")
 
+    # 수집이 끝까지 완료되었으므로 저널 삭제
+    journal_path.unlink(missing_ok=True)
+    
+    # 저장이 끝난 뒤에 체크포인트 갱신
+    if next_checkpoint is not None:
+        save_checkpoint(next_checkpoint, api_scoped_path(CHECKPOINT_FILE))
+        print(f"Saved checkpoint at maxitem {next_checkpoint['max_item']}")
+    
+    # HTTP 클라이언트 통계 출력
+    stats = get_client().get_stats()
+    print(f"HTTP client: {stats['requests']} requests, {stats['connections_opened']} connections opened, "
+          f"{stats['handshakes_avoided']} handshakes avoided, {stats['retries']} retries, "
+          f"{stats['failures']} failures")
+    print(f"Rate limiter: {stats['rate_limit']['rate']} req/s, {stats['rate_limit']['throttles']} throttled responses, "
+          f"{stats['rate_limit']['total_wait']}s with requests waiting")
+    
+    # 아이템 캐시 통계 출력
+    cache_stats = get_item_cache().get_stats()
+    print(f"Item cache: {cache_stats['hits']} hits, {cache_stats['stale_hits']} refreshed, "
+          f"{cache_stats['misses']} misses, {cache_stats['evictions']} evicted, {cache_stats['size']} cached items")
+    
+    # 요청 지연 시간, 처리량, 필터 통계 저장
+    save_run_metrics()
+    get_item_cache().close()
+
 if __name__ == "__main__":
     main()
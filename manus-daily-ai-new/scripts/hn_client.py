@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+Hacker News HTTP 클라이언트 모듈
+커넥션 풀과 keep-alive를 사용하는 공유 세션으로 API 요청을 처리합니다.
+"""
+
+import threading
+import time
+import requests
+from requests.adapters import HTTPAdapter
+
+from collector_metrics import get_metrics
+from rate_limiter import AdaptiveRateLimiter, parse_retry_after
+
+# 커넥션 풀 크기 (동시 요청 수보다 작으면 연결이 재사용되지 못하고 버려짐)
+DEFAULT_POOL_SIZE = 16
+
+# 요청 제한 시간 (연결, 읽기) 초 단위
+DEFAULT_TIMEOUT = (3.05, 10)
+
+# 재시도 설정
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_BACKOFF_FACTOR = 0.5
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+class HNClient:
+    """
+    keep-alive 세션을 공유하며 지수 백오프로 재시도하는 HTTP 클라이언트입니다.
+    
+    Args:
+        pool_size (int): 호스트당 유지할 최대 연결 수
+        timeout (float | tuple): 요청별 제한 시간 (연결, 읽기)
+        max_retries (int): 일시적 오류 발생 시 최대 재시도 횟수
+        backoff_factor (float): 재시도 대기 시간 기준값 (backoff_factor * 2^(n-1)초)
+        rate_limiter (AdaptiveRateLimiter, optional): 요청 속도 제한기 (기본값: 기본 설정으로 생성)
+    """
+    
+    def __init__(self, pool_size=DEFAULT_POOL_SIZE, timeout=DEFAULT_TIMEOUT,
+                 max_retries=DEFAULT_MAX_RETRIES, backoff_factor=DEFAULT_BACKOFF_FACTOR,
+                 rate_limiter=None):
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.rate_limiter = rate_limiter or AdaptiveRateLimiter()
+        
+        # 재시도는 직접 처리하므로 어댑터 자체 재시도는 끔
+        self._adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0)
+        self.session = requests.Session()
+        self.session.mount('https://', self._adapter)
+        self.session.mount('http://', self._adapter)
+        
+        self._lock = threading.Lock()
+        self.requests_sent = 0
+        self.retries = 0
+        self.failures = 0
+    
+    def _backoff_delay(self, attempt):
+        """
+        재시도 차수에 따른 대기 시간을 계산합니다.
+        
+        Args:
+            attempt (int): 재시도 차수 (1부터 시작)
+        
+        Returns:
+            float: 대기 시간(초)
+        """
+        return self.backoff_factor * (2 ** (attempt - 1))
+    
+    def get_json(self, url):
+        """
+        URL에 GET 요청을 보내고 JSON 응답을 반환합니다.
+        요청 전 속도 제한기를 거치며, 연결 오류, 시간 초과, 429/5xx 응답은 지수 백오프로 재시도합니다.
+        429/5xx 응답과 Retry-After 헤더는 속도 제한기에 전달되어 이후 요청 속도를 늦춥니다.
+        
+        Args:
+            url (str): 요청할 URL
+        
+        Returns:
+            JSON 응답 본문
+        
+        Raises:
+            requests.exceptions.RequestException: 재시도 후에도 실패한 경우
+        """
+        last_error = None
+        retry_after = None
+        
+        for attempt in range(self.max_retries + 1):
+            if attempt > 0:
+                with self._lock:
+                    self.retries += 1
+                time.sleep(max(self._backoff_delay(attempt), retry_after or 0))
+            
+            self.rate_limiter.acquire()
+            
+            with self._lock:
+                self.requests_sent += 1
+            
+            started = time.monotonic()
+            try:
+                response = self.session.get(url, timeout=self.timeout)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                status = 'timeout' if isinstance(e, requests.exceptions.Timeout) else 'connection_error'
+                get_metrics().record_request(url, status, time.monotonic() - started)
+                last_error = e
+                retry_after = None
+                continue
+            
+            # 본문은 이미 읽혔으므로 지연 시간에는 전송 시간까지 포함됨
+            get_metrics().record_request(url, response.status_code, time.monotonic() - started,
+                                         len(response.content))
+            
+            if response.status_code in RETRY_STATUS_CODES:
+                retry_after = parse_retry_after(response.headers.get('Retry-After'))
+                self.rate_limiter.on_throttle(retry_after)
+                last_error = requests.exceptions.HTTPError(
+                    f"{response.status_code} Error for url: {url}", response=response
+                )
+                continue
+            
+            self.rate_limiter.on_success()
+            
+            try:
+                response.raise_for_status()
+                return response.json()
+            except requests.exceptions.RequestException:
+                with self._lock:
+                    self.failures += 1
+                raise
+        
+        with self._lock:
+            self.failures += 1
+        raise last_error
+    
+    def connections_opened(self):
+        """
+        지금까지 새로 연결된(핸드셰이크를 수행한) 연결 수를 반환합니다.
+        
+        Returns:
+            int: 새로 연 연결 수
+        """
+        pools = self._adapter.poolmanager.pools
+        total = 0
+        
+        for key in list(pools.keys()):
+            pool = pools.get(key)
+            if pool is not None:
+                total += pool.num_connections
+        
+        return total
+    
+    def get_stats(self):
+        """
+        클라이언트 사용 통계를 반환합니다.
+        
+        Returns:
+            dict: 요청 수, 재시도 수, 실패 수, 새 연결 수, 생략된 핸드셰이크 수, 속도 제한 통계
+        """
+        connections = self.connections_opened()
+        rate_stats = self.rate_limiter.get_stats()
+        
+        with self._lock:
+            return {
+                'requests': self.requests_sent,
+                'retries': self.retries,
+                'failures': self.failures,
+                'connections_opened': connections,
+                'handshakes_avoided': max(0, self.requests_sent - connections),
+                'rate_limit': rate_stats
+            }
+    
+    def close(self):
+        """
+        세션과 풀에 있는 연결을 닫습니다.
+        """
+        self.session.close()
+
+# 모듈 전체에서 공유하는 클라이언트
+_client = None
+_client_lock = threading.Lock()
+
+def get_client():
+    """
+    공유 HTTP 클라이언트를 반환합니다. 처음 호출 시 기본 설정으로 생성합니다.
+    
+    Returns:
+        HNClient: 공유 클라이언트
+    """
+    global _client
+    
+    with _client_lock:
+        if _client is None:
+            _client = HNClient()
+        return _client
+
+def configure_client(**kwargs):
+    """
+    공유 HTTP 클라이언트를 주어진 설정으로 다시 생성합니다.
+    
+    Args:
+        **kwargs: HNClient 생성자 인수 (pool_size, timeout, max_retries, backoff_factor, rate_limiter)
+    
+    Returns:
+        HNClient: 새로 생성된 공유 클라이언트
+    """
+    global _client
+    
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+        _client = HNClient(**kwargs)
+        return _client
@@ -0,0 +1,402 @@
+#!/usr/bin/env python3
+"""
+Hacker News API 리플레이 서버 모듈
+녹화된 응답(fixture) 또는 합성 데이터로 Hacker News API를 흉내 내는 로컬 HTTP 서버입니다.
+지연 시간, 오류, 429 응답을 주입할 수 있어 수집기 성능을 오프라인에서 측정할 수 있습니다.
+"""
+
+import argparse
+import json
+import random
+import re
+import threading
+import time
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from pathlib import Path
+
+# 기본 서버 설정
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+# 서빙하는 스토리 목록 이름
+LIST_NAMES = ['topstories', 'newstories', 'showstories', 'askstories']
+
+# 합성 데이터에 사용할 단어
+SYNTHETIC_AI_TERMS = [
+    'AI', 'LLM', 'machine learning', 'GPT', 'vector database', 'AI agent', 'RAG',
+    'fine-tuning', 'computer vision', 'OpenAI', 'Claude', 'Llama', 'embeddings'
+]
+SYNTHETIC_STARTUP_TERMS = ['startup', 'raises Series A', 'seed funding', 'launch', 'YC', 'SaaS', 'founders']
+SYNTHETIC_FILLER = [
+    'Rust', 'PostgreSQL', 'kernel', 'browser', 'compiler', 'Linux', 'design', 'history', 'physics',
+    'email', 'HTML', 'garden', 'bicycle', 'chess', 'music', 'database', 'terminal', 'editor'
+]
+SYNTHETIC_DOMAINS = ['github.com', 'openai.com', 'blog.openai.com', 'techcrunch.com', 'arxiv.org', 'example.co.uk']
+
+# 경로 패턴
+ITEM_PATH_PATTERN = re.compile(r'^/item/(\d+)(?:/(\w+))?\.json$')
+
+def generate_synthetic_data(num_stories=500, comments_per_story=20, keyword_rate=0.3,
+                            seed=42, start_id=40000000, now=None):
+    """
+    스토리, 댓글 트리, 목록, maxitem, updates로 구성된 합성 데이터를 만듭니다.
+    
+    Args:
+        num_stories (int): 생성할 스토리 수
+        comments_per_story (int): 스토리당 평균 댓글 수
+        keyword_rate (float): 제목에 AI/스타트업 키워드가 들어갈 확률
+        seed (int): 난수 시드
+        start_id (int): 첫 아이템 ID
+        now (int, optional): 기준 시각 (유닉스 타임스탬프)
+    
+    Returns:
+        dict: {'lists', 'items', 'maxitem', 'updates'} 형식의 리플레이 데이터
+    """
+    rng = random.Random(seed)
+    now = now or int(time.time())
+    items = {}
+    story_ids = []
+    next_id = start_id
+    
+    for index in range(num_stories):
+        words = rng.sample(SYNTHETIC_FILLER, rng.randint(3, 6))
+        if rng.random() < keyword_rate:
+            words.insert(rng.randrange(len(words) + 1), rng.choice(SYNTHETIC_AI_TERMS))
+        if rng.random() < keyword_rate / 2:
+            words.append(rng.choice(SYNTHETIC_STARTUP_TERMS))
+        
+        prefix = rng.choice(['', '', '', 'Show HN: ', 'Ask HN: '])
+        story_time = now - rng.randint(0, 3 * 24 * 3600)
+        story = {
+            'id': next_id,
+            'type': 'story',
+            'by': f"user{rng.randint(1, num_stories // 3 + 1)}",
+            'time': story_time,
+            'title': prefix + ' '.join(words),
+            'score': int(rng.paretovariate(1.2) * 5),
+            'descendants': 0,
+            'kids': []
+        }
+        if prefix != 'Ask HN: ':
+            story['url'] = f"https://{rng.choice(SYNTHETIC_DOMAINS)}/{'-'.join(w.lower() for w in words[:3])}"
+        items[next_id] = story
+        story_ids.append(next_id)
+        next_id += 1
+        
+        # 댓글 트리 생성 (부모를 무작위로 골라 깊이가 생기도록)
+        thread = [story]
+        for _ in range(rng.randint(0, comments_per_story * 2)):
+            parent = rng.choice(thread)
+            comment = {
+                'id': next_id,
+                'type': 'comment',
+                'by': f"user{rng.randint(1, num_stories)}",
+                'time': story_time + rng.randint(60, 24 * 3600),
+                'parent': parent['id'],
+                'text': ' '.join(rng.sample(SYNTHETIC_FILLER + SYNTHETIC_AI_TERMS, 8)),
+                'kids': []
+            }
+            parent['kids'].append(next_id)
+            items[next_id] = comment
+            thread.append(comment)
+            story['descendants'] += 1
+            next_id += 1
+    
+    lists = {
+        'topstories': sorted(story_ids, key=lambda i: items[i]['score'], reverse=True)[:500],
+        'newstories': sorted(story_ids, key=lambda i: items[i]['time'], reverse=True)[:500],
+        'showstories': [i for i in story_ids if items[i]['title'].startswith('Show HN')][:200],
+        'askstories': [i for i in story_ids if items[i]['title'].startswith('Ask HN')][:200]
+    }
+    
+    return {
+        'lists': lists,
+        'items': items,
+        'maxitem': next_id - 1,
+        'updates': {'items': rng.sample(list(items), min(100, len(items))), 'profiles': []}
+    }
+
+def load_fixtures(fixtures_dir):
+    """
+    record_fixtures로 녹화한 디렉토리에서 리플레이 데이터를 로드합니다.
+    
+    Args:
+        fixtures_dir (str | Path): fixture 디렉토리
+    
+    Returns:
+        dict: {'lists', 'items', 'maxitem', 'updates'} 형식의 리플레이 데이터
+    """
+    fixtures_dir = Path(fixtures_dir)
+    lists = {}
+    
+    for name in LIST_NAMES:
+        list_file = fixtures_dir / f"{name}.json"
+        if list_file.exists():
+            lists[name] = json.loads(list_file.read_text(encoding='utf-8'))
+    
+    items = {}
+    items_file = fixtures_dir / "items.ndjson"
+    if items_file.exists():
+        with open(items_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    item = json.loads(line)
+                    items[item['id']] = item
+    
+    def read_optional(name, default):
+        path = fixtures_dir / name
+        return json.loads(path.read_text(encoding='utf-8')) if path.exists() else default
+    
+    return {
+        'lists': lists,
+        'items': items,
+        'maxitem': read_optional("maxitem.json", max(items) if items else 0),
+        'updates': read_optional("updates.json", {'items': [], 'profiles': []})
+    }
+
+def record_fixtures(fixtures_dir, limit_per_list=100, include_comments=False):
+    """
+    실제 Hacker News API 응답을 fixture 디렉토리로 녹화합니다.
+    
+    Args:
+        fixtures_dir (str | Path): 저장할 디렉토리
+        limit_per_list (int): 목록별로 녹화할 스토리 수
+        include_comments (bool): 스토리의 최상위 댓글도 녹화할지 여부
+    
+    Returns:
+        int: 녹화한 아이템 수
+    """
+    import hn_api
+    from hn_client import get_client
+    
+    fixtures_dir = Path(fixtures_dir)
+    fixtures_dir.mkdir(parents=True, exist_ok=True)
+    item_ids = []
+    
+    for name in LIST_NAMES:
+        ids = get_client().get_json(f"{hn_api.HN_API_BASE}/{name}.json") or []
+        (fixtures_dir / f"{name}.json").write_text(json.dumps(ids), encoding='utf-8')
+        item_ids.extend(ids[:limit_per_list])
+    
+    for name in ['maxitem', 'updates']:
+        body = get_client().get_json(f"{hn_api.HN_API_BASE}/{name}.json")
+        (fixtures_dir / f"{name}.json").write_text(json.dumps(body), encoding='utf-8')
+    
+    item_ids = list(dict.fromkeys(item_ids))
+    items = [item for item in hn_api.fetch_items_concurrently(item_ids, fetch_func=hn_api.get_item_details) if item]
+    
+    if include_comments:
+        kid_ids = [kid for item in items for kid in item.get('kids', [])]
+        items.extend(item for item in hn_api.fetch_items_concurrently(kid_ids, fetch_func=hn_api.get_item_details) if item)
+    
+    with open(fixtures_dir / "items.ndjson", 'w', encoding='utf-8') as f:
+        for item in items:
+            f.write(json.dumps(item, ensure_ascii=False) + '\n')
+    
+    print(f"Recorded {len(items)} items to {fixtures_dir}")
+    return len(items)
+
+class ReplayConfig:
+    """
+    리플레이 서버의 장애 주입 설정입니다.
+    
+    Args:
+        latency_ms (float): 응답 지연 평균(밀리초)
+        jitter_ms (float): 응답 지연 편차(밀리초, 균등 분포)
+        error_rate (float): 500 응답 비율
+        throttle_rate (float): 429 응답 비율
+        retry_after (float): 429 응답의 Retry-After 값(초)
+        seed (int, optional): 난수 시드
+    """
+    
+    def __init__(self, latency_ms=0.0, jitter_ms=0.0, error_rate=0.0, throttle_rate=0.0,
+                 retry_after=1.0, seed=None):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.retry_after = retry_after
+        self.random = random.Random(seed)
+
+def make_handler(data, config, stats, stats_lock):
+    """
+    리플레이 데이터를 서빙하는 요청 핸들러 클래스를 만듭니다.
+    
+    Args:
+        data (dict): 리플레이 데이터
+        config (ReplayConfig): 장애 주입 설정
+        stats (dict): 응답 상태 코드별 카운터 (서버와 공유)
+        stats_lock (threading.Lock): stats 잠금
+    
+    Returns:
+        type: BaseHTTPRequestHandler 하위 클래스
+    """
+    
+    class ReplayHandler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+        
+        def log_message(self, format, *args):
+            pass
+        
+        def _send(self, status, body=None, headers=None):
+            payload = json.dumps(body).encode('utf-8') if status == 200 else b''
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json; charset=utf-8')
+            self.send_header('Content-Length', str(len(payload)))
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(payload)
+            
+            with stats_lock:
+                stats[status] = stats.get(status, 0) + 1
+        
+        def _resolve(self, path):
+            """
+            요청 경로에 해당하는 응답 본문을 찾습니다. 찾지 못하면 KeyError를 발생시킵니다.
+            """
+            path = path.split('?', 1)[0]
+            if path.startswith('/v0/'):
+                path = path[3:]
+            
+            if path == '/maxitem.json':
+                return data['maxitem']
+            if path == '/updates.json':
+                return data['updates']
+            
+            match = ITEM_PATH_PATTERN.match(path)
+            if match:
+                item = data['items'].get(int(match.group(1)))
+                if match.group(2):
+                    return item.get(match.group(2)) if item else None
+                return item
+            
+            name = path.strip('/').removesuffix('.json')
+            return data['lists'][name]
+        
+        def do_GET(self):
+            # 지연 및 장애 주입
+            with stats_lock:
+                roll = config.random.random()
+                delay = config.latency_ms + config.random.uniform(-config.jitter_ms, config.jitter_ms)
+            
+            if delay > 0:
+                time.sleep(delay / 1000)
+            
+            if roll < config.throttle_rate:
+                self._send(429, headers={'Retry-After': str(config.retry_after)})
+                return
+            if roll < config.throttle_rate + config.error_rate:
+                self._send(500)
+                return
+            
+            try:
+                body = self._resolve(self.path)
+            except KeyError:
+                self._send(404)
+                return
+            
+            # Firebase API처럼 없는 아이템은 null로 응답
+            self._send(200, body)
+    
+    return ReplayHandler
+
+class ReplayServer:
+    """
+    백그라운드 스레드에서 실행되는 리플레이 서버입니다.
+    
+    Args:
+        data (dict): 리플레이 데이터 (generate_synthetic_data 또는 load_fixtures 결과)
+        config (ReplayConfig, optional): 장애 주입 설정
+        host (str): 바인딩할 호스트
+        port (int): 바인딩할 포트 (0이면 임의의 빈 포트)
+    """
+    
+    def __init__(self, data, config=None, host=DEFAULT_HOST, port=0):
+        self.stats = {}
+        self._stats_lock = threading.Lock()
+        handler = make_handler(data, config or ReplayConfig(), self.stats, self._stats_lock)
+        self._server = ThreadingHTTPServer((host, port), handler)
+        self._server.daemon_threads = True
+        self._thread = None
+    
+    @property
+    def base_url(self):
+        """
+        hn_api.set_api_base에 넘길 기본 URL
+        """
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/v0"
+    
+    def start(self):
+        """
+        백그라운드 스레드에서 서버를 시작합니다.
+        
+        Returns:
+            ReplayServer: 자기 자신
+        """
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+    
+    def serve_forever(self):
+        """
+        현재 스레드에서 서버를 실행합니다.
+        """
+        self._server.serve_forever()
+    
+    def stop(self):
+        """
+        서버를 종료합니다.
+        """
+        self._server.shutdown()
+        self._server.server_close()
+    
+    def __enter__(self):
+        return self.start()
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+def main():
+    """
+    메인 함수: 리플레이 서버를 실행하거나 실제 API 응답을 녹화합니다.
+    """
+    parser = argparse.ArgumentParser(description="Hacker News API 리플레이 서버")
+    parser.add_argument("--host", default=DEFAULT_HOST, help="바인딩할 호스트")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="바인딩할 포트")
+    parser.add_argument("--fixtures", help="서빙할 fixture 디렉토리 (없으면 합성 데이터 사용)")
+    parser.add_argument("--record", metavar="DIR", help="실제 API 응답을 DIR에 녹화하고 종료")
+    parser.add_argument("--record-comments", action="store_true", help="녹화 시 최상위 댓글 포함")
+    parser.add_argument("--stories", type=int, default=500, help="합성 스토리 수")
+    parser.add_argument("--seed", type=int, default=42, help="합성 데이터/장애 주입 난수 시드")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="응답 지연 평균(밀리초)")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="응답 지연 편차(밀리초)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="500 응답 비율")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="429 응답 비율")
+    parser.add_argument("--retry-after", type=float, default=1.0, help="429 응답의 Retry-After(초)")
+    args = parser.parse_args()
+    
+    if args.record:
+        record_fixtures(args.record, include_comments=args.record_comments)
+        return
+    
+    if args.fixtures:
+        data = load_fixtures(args.fixtures)
+    else:
+        data = generate_synthetic_data(num_stories=args.stories, seed=args.seed)
+    
+    config = ReplayConfig(args.latency_ms, args.jitter_ms, args.error_rate, args.throttle_rate,
+                          args.retry_after, args.seed)
+    server = ReplayServer(data, config, args.host, args.port)
+    
+    print(f"Serving {len(data['items'])} items at {server.base_url}")
+    print(f"Run the collector with: HN_API_BASE={server.base_url} python3 scripts/hn_api.py")
+    
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.stop()
+
+if __name__ == "__main__":
+    main()
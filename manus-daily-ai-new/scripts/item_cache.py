@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""
+Hacker News 아이템 캐시 모듈
+아이템 JSON을 SQLite에 저장하고, 시간이 지나며 바뀌는 필드만 TTL에 따라 새로 가져오게 합니다.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+# 기본 경로 설정
+BASE_DIR = Path(__file__).parent.parent
+DATA_DIR = BASE_DIR / "data"
+CACHE_DIR = DATA_DIR / "cache"
+DEFAULT_CACHE_PATH = CACHE_DIR / "hn_items.sqlite3"
+
+# 시간이 지나며 바뀌는 필드별 TTL(초). 나머지 필드(제목, URL, 작성자 등)는 바뀌지 않음
+MUTABLE_FIELD_TTLS = {
+    'score': 30 * 60,
+    'descendants': 30 * 60,
+    'kids': 60 * 60
+}
+
+# 작성 후 이 시간이 지난 아이템은 더 이상 투표/댓글이 불가능하므로 새로 가져오지 않음
+FROZEN_AFTER_SECONDS = 14 * 24 * 3600
+
+# 캐시에 유지할 최대 아이템 수
+DEFAULT_MAX_ENTRIES = 50000
+
+# 이 횟수만큼 저장할 때마다 크기 제한을 확인
+EVICTION_CHECK_INTERVAL = 200
+
+class ItemCache:
+    """
+    아이템 ID를 키로 하는 SQLite 기반 아이템 캐시입니다.
+    
+    Args:
+        path (str | Path): SQLite 파일 경로
+        max_entries (int): 유지할 최대 아이템 수 (초과 시 오래 사용하지 않은 항목부터 삭제)
+        field_ttls (dict, optional): 필드별 TTL(초)
+    """
+    
+    def __init__(self, path=DEFAULT_CACHE_PATH, max_entries=DEFAULT_MAX_ENTRIES, field_ttls=None):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+        self.field_ttls = field_ttls or MUTABLE_FIELD_TTLS
+        
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS items (
+                id INTEGER PRIMARY KEY,
+                item TEXT NOT NULL,
+                field_times TEXT NOT NULL,
+                last_access REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_items_last_access ON items (last_access)")
+        self._conn.commit()
+        
+        self._puts_since_check = 0
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def _stale_fields(self, item, field_times, now):
+        """
+        TTL이 지난 변하는 필드 목록을 계산합니다.
+        
+        Args:
+            item (dict): 캐시된 아이템
+            field_times (dict): 필드별 마지막 갱신 시각
+            now (float): 현재 시각
+        
+        Returns:
+            list: 새로 가져와야 하는 필드 목록
+        """
+        if now - item.get('time', now) > FROZEN_AFTER_SECONDS:
+            return []
+        
+        return [
+            field for field, ttl in self.field_ttls.items()
+            if now - field_times.get(field, 0) > ttl
+        ]
+    
+    def get(self, item_id, now=None):
+        """
+        캐시된 아이템과 새로 가져와야 하는 필드 목록을 반환합니다.
+        
+        Args:
+            item_id (int): 아이템 ID
+            now (float, optional): 현재 시각 (기본값: time.time())
+        
+        Returns:
+            tuple: (아이템 또는 None, 새로 가져와야 하는 필드 목록)
+        """
+        now = now or time.time()
+        
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT item, field_times FROM items WHERE id = ?", (item_id,)
+            ).fetchone()
+            
+            if row is None:
+                self.misses += 1
+                return None, []
+            
+            self._conn.execute("UPDATE items SET last_access = ? WHERE id = ?", (now, item_id))
+            
+            item = json.loads(row[0])
+            stale = self._stale_fields(item, json.loads(row[1]), now)
+            
+            if stale:
+                self.stale_hits += 1
+            else:
+                self.hits += 1
+            
+            return item, stale
+    
+    def put(self, item, now=None):
+        """
+        아이템 전체를 캐시에 저장합니다. 모든 변하는 필드가 방금 갱신된 것으로 기록됩니다.
+        
+        Args:
+            item (dict): 저장할 아이템
+            now (float, optional): 현재 시각
+        """
+        if not item or 'id' not in item:
+            return
+        
+        now = now or time.time()
+        field_times = {field: now for field in self.field_ttls}
+        
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO items (id, item, field_times, last_access) VALUES (?, ?, ?, ?)",
+                (item['id'], json.dumps(item, ensure_ascii=False), json.dumps(field_times), now)
+            )
+            self._conn.commit()
+            self._maybe_evict()
+    
+    def update_fields(self, item_id, values, now=None):
+        """
+        캐시된 아이템의 일부 필드만 갱신합니다.
+        
+        Args:
+            item_id (int): 아이템 ID
+            values (dict): 갱신할 필드와 값 (값이 None이면 필드 삭제)
+            now (float, optional): 현재 시각
+        
+        Returns:
+            dict: 갱신된 아이템 (캐시에 없으면 None)
+        """
+        now = now or time.time()
+        
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT item, field_times FROM items WHERE id = ?", (item_id,)
+            ).fetchone()
+            
+            if row is None:
+                return None
+            
+            item = json.loads(row[0])
+            field_times = json.loads(row[1])
+            
+            for field, value in values.items():
+                if value is None:
+                    item.pop(field, None)
+                else:
+                    item[field] = value
+                field_times[field] = now
+            
+            self._conn.execute(
+                "UPDATE items SET item = ?, field_times = ?, last_access = ? WHERE id = ?",
+                (json.dumps(item, ensure_ascii=False), json.dumps(field_times), now, item_id)
+            )
+            self._conn.commit()
+            
+            return item
+    
+    def _maybe_evict(self):
+        """
+        일정 횟수 저장마다 크기 제한을 확인하고 초과분을 삭제합니다. 잠금을 잡은 상태에서 호출해야 합니다.
+        """
+        self._puts_since_check += 1
+        if self._puts_since_check < EVICTION_CHECK_INTERVAL:
+            return
+        
+        self._puts_since_check = 0
+        self._evict()
+    
+    def _evict(self):
+        """
+        최대 크기를 넘는 항목을 마지막 사용 시각이 오래된 순서로 삭제합니다.
+        """
+        count = self._conn.execute("SELECT COUNT(*) FROM items").fetchone()[0]
+        excess = count - self.max_entries
+        
+        if excess > 0:
+            self._conn.execute(
+                "DELETE FROM items WHERE id IN (SELECT id FROM items ORDER BY last_access LIMIT ?)",
+                (excess,)
+            )
+            self._conn.commit()
+            self.evictions += excess
+    
+    def cached_ids(self, item_ids):
+        """
+        주어진 ID 중 캐시에 있는 ID를 반환합니다. 접근 시각과 적중 통계는 바꾸지 않습니다.
+        
+        Args:
+            item_ids (list): 확인할 아이템 ID 목록
+        
+        Returns:
+            set: 캐시에 있는 아이템 ID 집합
+        """
+        item_ids = list(item_ids)
+        found = set()
+        
+        with self._lock:
+            # SQLite 변수 개수 제한을 넘지 않도록 나눠서 조회
+            for start in range(0, len(item_ids), 500):
+                chunk = item_ids[start:start + 500]
+                placeholders = ','.join('?' * len(chunk))
+                rows = self._conn.execute(f"SELECT id FROM items WHERE id IN ({placeholders})", chunk)
+                found.update(row[0] for row in rows)
+        
+        return found
+    
+    def get_stats(self):
+        """
+        캐시 사용 통계를 반환합니다.
+        
+        Returns:
+            dict: 적중, 부분 적중(필드 갱신 필요), 미스, 삭제 수와 현재 크기
+        """
+        with self._lock:
+            size = self._conn.execute("SELECT COUNT(*) FROM items").fetchone()[0]
+            return {
+                'hits': self.hits,
+                'stale_hits': self.stale_hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'size': size
+            }
+    
+    def close(self):
+        """
+        크기 제한을 적용하고 데이터베이스 연결을 닫습니다.
+        """
+        with self._lock:
+            self._evict()
+            self._conn.commit()
+            self._conn.close()
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+키워드 매칭 모듈
+키워드 목록을 단어 단위 트라이(오토마톤)로 한 번만 컴파일하고, 텍스트를 한 번 훑으며 매칭합니다.
+"""
+
+import re
+from collections import Counter
+
+# 단어 토큰: 영문자/숫자 연속 구간 ('ai'가 'mail' 안에서 매칭되지 않도록 단어 단위로 비교)
+TOKEN_PATTERN = re.compile(r'[a-z0-9]+')
+
+# 허용할 어미 (짧은 키워드는 복수형만 허용하여 오탐 방지)
+SHORT_KEYWORD_LENGTH = 3
+SHORT_SUFFIXES = ('', 's')
+LONG_SUFFIXES = ('', 's', 'es', 'd', 'ed', 'ing', 'er', 'ers')
+
+# 트라이 노드에서 매칭된 키워드를 저장하는 키 (토큰과 겹치지 않는 값)
+MATCH_KEY = None
+
+def tokenize(text):
+    """
+    텍스트를 소문자 단어 토큰 목록으로 나눕니다.
+    
+    Args:
+        text (str): 원본 텍스트
+    
+    Returns:
+        list: 토큰 목록
+    """
+    return TOKEN_PATTERN.findall(text.lower())
+
+def keyword_variants(keyword):
+    """
+    키워드 하나가 매칭될 수 있는 토큰 시퀀스 목록을 만듭니다.
+    여러 단어 키워드는 붙여 쓴 형태('finetuning', 'genai')도 포함합니다.
+    
+    Args:
+        keyword (str): 소문자 키워드
+    
+    Returns:
+        list: 토큰 튜플 목록
+    """
+    tokens = tokenize(keyword)
+    if not tokens:
+        return []
+    
+    suffixes = SHORT_SUFFIXES if len(keyword) <= SHORT_KEYWORD_LENGTH else LONG_SUFFIXES
+    forms = [tokens]
+    if len(tokens) > 1:
+        forms.append([''.join(tokens)])
+    
+    variants = []
+    for form in forms:
+        for suffix in suffixes:
+            variants.append(tuple(form[:-1]) + (form[-1] + suffix,))
+    
+    return variants
+
+class KeywordMatcher:
+    """
+    분류별 키워드 목록을 단어 트라이로 컴파일한 매처입니다.
+    같은 위치에서는 가장 긴 키워드를 우선 매칭하며, 매칭된 구간은 겹치지 않습니다.
+    
+    Args:
+        keyword_groups (dict): 분류 이름 -> 키워드 목록 (소문자)
+    """
+    
+    def __init__(self, keyword_groups):
+        self.categories = list(keyword_groups)
+        self._trie = {}
+        
+        for category, keywords in keyword_groups.items():
+            for keyword in keywords:
+                for variant in keyword_variants(keyword):
+                    node = self._trie
+                    for token in variant:
+                        node = node.setdefault(token, {})
+                    # 같은 형태가 여러 키워드에 해당하면 먼저 등록된 키워드 사용
+                    node.setdefault(MATCH_KEY, (category, keyword))
+        
+        # 키워드 첫 단어 집합 (매칭 가능성이 없는 텍스트를 빠르게 걸러냄)
+        self._first_tokens = frozenset(self._trie)
+    
+    def iter_matches(self, text):
+        """
+        텍스트에서 매칭된 키워드를 순서대로 반환합니다.
+        
+        Args:
+            text (str): 검사할 텍스트
+        
+        Yields:
+            tuple: (분류, 키워드)
+        """
+        tokens = tokenize(text)
+        if self._first_tokens.isdisjoint(tokens):
+            return
+        
+        trie = self._trie
+        position = 0
+        count = len(tokens)
+        
+        while position < count:
+            node = trie.get(tokens[position])
+            if node is None:
+                position += 1
+                continue
+            
+            # 가장 긴 매칭 찾기
+            best = node.get(MATCH_KEY)
+            best_end = position + 1
+            end = position + 1
+            while end < count:
+                node = node.get(tokens[end])
+                if node is None:
+                    break
+                end += 1
+                if MATCH_KEY in node:
+                    best = node[MATCH_KEY]
+                    best_end = end
+            
+            if best is None:
+                position += 1
+                continue
+            
+            yield best
+            position = best_end
+    
+    def matches(self, text):
+        """
+        텍스트에 키워드가 하나라도 있는지 확인합니다.
+        
+        Args:
+            text (str): 검사할 텍스트
+        
+        Returns:
+            bool: 매칭 여부
+        """
+        return next(self.iter_matches(text), None) is not None
+    
+    def find(self, text):
+        """
+        텍스트에서 분류별로 매칭된 키워드 목록을 찾습니다.
+        
+        Args:
+            text (str): 검사할 텍스트
+        
+        Returns:
+            dict: 분류 -> 매칭된 키워드 목록 (중복 제거, 처음 나온 순서)
+        """
+        found = {category: [] for category in self.categories}
+        
+        for category, keyword in self.iter_matches(text):
+            if keyword not in found[category]:
+                found[category].append(keyword)
+        
+        return found
+    
+    def count(self, text):
+        """
+        텍스트에서 키워드별 등장 횟수를 셉니다.
+        
+        Args:
+            text (str): 검사할 텍스트
+        
+        Returns:
+            Counter: 키워드 -> 등장 횟수
+        """
+        return Counter(keyword for _, keyword in self.iter_matches(text))
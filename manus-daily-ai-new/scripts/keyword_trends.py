@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+키워드 추세 모듈
+날짜별 부분 집계의 제목 단어/문구 빈도로 최근 기간의 기준선을 만들고, 오늘 빈도가 기준선에서 통계적으로 벗어난 용어를 찾습니다.
+전체 용어와 기간을 (날짜 x 용어) 배열 하나로 계산합니다.
+"""
+
+import numpy as np
+import pandas as pd
+
+# 기준선을 계산할 이전 기간 (일)
+BURST_WINDOW_DAYS = 14
+
+# 급상승을 판단하는 데 필요한 최소 기준 날짜 수
+BURST_MIN_HISTORY_DAYS = 3
+
+# 급상승으로 판단할 z 점수와 오늘 최소 등장 횟수
+BURST_Z_THRESHOLD = 3.0
+BURST_MIN_COUNT = 3
+
+# 분석 결과에 남길 급상승 용어 수
+TOP_BURSTS_COUNT = 15
+
+def term_counts(aggregates):
+    """
+    부분 집계의 단어와 문구 빈도를 하나의 딕셔너리로 합칩니다.
+    
+    Args:
+        aggregates (StoryAggregates): 부분 집계
+    
+    Returns:
+        dict: 용어 -> 등장 횟수
+    """
+    return {**aggregates.keywords, **aggregates.phrases}
+
+def detect_bursts(today, history, z_threshold=BURST_Z_THRESHOLD, min_count=BURST_MIN_COUNT):
+    """
+    오늘 빈도가 이전 날짜들의 기준선보다 비정상적으로 높은 용어를 찾습니다.
+    
+    용어 빈도는 날짜별 스토리 수로 나눈 비율로 비교합니다. 기준선은 이전 날짜 비율의 평균과 표준편차이며,
+    기준 기간에 거의 등장하지 않은 용어가 한두 번 등장만으로 튀지 않도록 표준편차는 오늘 기대 횟수의
+    포아송 표준편차(sqrt(기대 횟수), 최소 1회) 아래로 내려가지 않게 합니다.
+    
+    Args:
+        today (StoryAggregates): 오늘 부분 집계
+        history (list): 이전 날짜들의 부분 집계 (스토리가 없는 날짜는 제외됨)
+        z_threshold (float): 급상승으로 판단할 z 점수
+        min_count (int): 오늘 최소 등장 횟수
+    
+    Returns:
+        list: 급상승 용어 (z 점수 높은 순), 기준 날짜가 부족하면 빈 목록
+    """
+    history = [day for day in history if day.total_stories]
+    if len(history) < BURST_MIN_HISTORY_DAYS or not today.total_stories:
+        return []
+    
+    today_counts = pd.Series(term_counts(today), dtype='float64')
+    today_counts = today_counts[today_counts >= min_count]
+    if today_counts.empty:
+        return []
+    
+    # (날짜 x 용어) 등장 횟수 배열: 날짜별 용어를 오늘 용어 목록에서 한 번에 찾아 해당 열에 채움 (오늘 없는 용어는 버림)
+    terms = today_counts.index
+    counts = np.zeros((len(history), len(terms)))
+    for row, day_counts in enumerate(map(term_counts, history)):
+        columns = terms.get_indexer(list(day_counts))
+        found = columns >= 0
+        counts[row, columns[found]] = np.fromiter(day_counts.values(), dtype='float64', count=len(day_counts))[found]
+    totals = np.array([day.total_stories for day in history], dtype='float64')
+    
+    rates = counts / totals[:, None]
+    baseline = rates.mean(axis=0)
+    spread = rates.std(axis=0, ddof=1)
+    
+    today_rate = today_counts.to_numpy() / today.total_stories
+    expected = baseline * today.total_stories
+    sigma = np.maximum(spread, np.sqrt(np.maximum(expected, 1.0)) / today.total_stories)
+    z_scores = (today_rate - baseline) / sigma
+    
+    flagged = np.flatnonzero(z_scores >= z_threshold)
+    flagged = flagged[np.argsort(-z_scores[flagged], kind='stable')][:TOP_BURSTS_COUNT]
+    
+    return [
+        {
+            'term': terms[index],
+            'count': int(today_counts.iloc[index]),
+            'expected': round(float(expected[index]), 2),
+            'z_score': round(float(z_scores[index]), 2),
+            'new': not counts[:, index].any(),
+            'history_days': len(history)
+        }
+        for index in flagged
+    ]
@@ -0,0 +1,419 @@
+#!/usr/bin/env python3
+"""
+유사 중복 스토리 탐지 모듈
+제목의 MinHash 서명과 LSH 밴드, 정규화한 URL로 같은 소식을 다룬 스토리(Show HN, 블로그 글, 기사 등)를 묶습니다.
+서명과 밴드 버킷은 SQLite에 날짜를 넘어 유지하며, 새 스토리는 자신의 버킷에 들어 있는 후보만 비교하므로
+스토리당 비용이 누적된 스토리 수에 비례하지 않습니다.
+"""
+
+import hashlib
+import sqlite3
+import threading
+import zlib
+from collections import Counter
+from itertools import chain
+from pathlib import Path
+
+import numpy as np
+
+from api_scope import scoped_path
+from domain_normalizer import url_host
+from keyword_matcher import TOKEN_PATTERN
+from term_matrix import STOPWORDS, TITLE_NOISE_WORDS
+
+# 기본 경로 설정
+BASE_DIR = Path(__file__).parent.parent
+DATA_DIR = BASE_DIR / "data"
+DEFAULT_INDEX_PATH = DATA_DIR / "near_duplicates.sqlite3"
+
+# MinHash 순열 수와 LSH 밴드 구성 (밴드 20개 x 3행: 유사도 0.5인 쌍의 약 93%가 후보가 됨)
+NUM_PERMUTATIONS = 60
+LSH_BANDS = 20
+LSH_ROWS = NUM_PERMUTATIONS // LSH_BANDS
+
+# 같은 소식으로 볼 추정 자카드 유사도
+DUPLICATE_SIMILARITY = 0.5
+
+# 해시 순열 계수 (고정 시드로 생성해 저장된 서명과 항상 같은 순열을 사용)
+MINHASH_SEED = 20240601
+MERSENNE_PRIME = (1 << 31) - 1
+_rng = np.random.default_rng(MINHASH_SEED)
+PERMUTATION_A = _rng.integers(1, MERSENNE_PRIME, size=NUM_PERMUTATIONS, dtype=np.uint64)
+PERMUTATION_B = _rng.integers(0, MERSENNE_PRIME, size=NUM_PERMUTATIONS, dtype=np.uint64)
+
+# 밴드 버킷 키를 섞는 상수 (SQLite INTEGER에 들어가도록 63비트로 자름)
+BAND_MIXERS = np.array([0x9E3779B97F4A7C15, 0xC2B2AE3D27D4EB4F, 0x165667B19E3779F9], dtype=np.uint64)
+BUCKET_MASK = (1 << 63) - 1
+
+# 버킷마다 서명을 비교할 최대 후보 수: 이보다 작은 버킷은 전부 비교하고, 흔한 단어로 붐비는 버킷만 최근 후보로 제한
+# (붐비는 버킷에만 있는 오래된 스토리는 놓칠 수 있음: 붐비는 버킷 테스트에서 10개는 재게시의 98.2%, 100개는 99.2%를 묶고
+#  스토리당 비용은 약 0.5ms에서 1.3ms로 늘어나며, 제한이 없으면 버킷 크기에 비례해 수십 ms로 늘어남)
+MAX_BUCKET_CANDIDATES = 100
+
+# 한 번에 서명을 계산할 스토리 수 (순열 x 슁글 배열 크기 제한)
+SIGNATURE_BATCH_SIZE = 2000
+
+# URL 비교에서 무시할 추적용 쿼리 매개변수
+TRACKING_PARAMS = frozenset({'ref', 'source', 'fbclid', 'gclid', 'mc_cid', 'mc_eid'})
+
+# 분석 결과에 남길 중복 묶음 수
+DUPLICATE_CLUSTERS_COUNT = 10
+
+def title_shingles(title):
+    """
+    제목을 비교용 슁글(단어와 인접 두 단어) 집합으로 바꿉니다. 불용어와 'Show HN' 같은 머리말은 제외합니다.
+    
+    Args:
+        title (str): 제목
+    
+    Returns:
+        set: 슁글 집합 (비교할 단어가 없으면 빈 집합)
+    """
+    if not isinstance(title, str):
+        return set()
+    
+    words = [word for word in TOKEN_PATTERN.findall(title.lower())
+             if word not in STOPWORDS and word not in TITLE_NOISE_WORDS]
+    return set(words) | {f"{first} {second}" for first, second in zip(words, words[1:])}
+
+def canonical_url(url):
+    """
+    비교용 URL을 만듭니다. (스킴, 'www.', 프래그먼트, 끝의 '/', utm_* 등 추적용 쿼리 매개변수 제외)
+    쿼리의 나머지 매개변수는 정렬해 남깁니다. (item?id=1과 item?id=2는 다른 URL)
+    
+    Args:
+        url (str): URL
+    
+    Returns:
+        str: 정규화한 URL (없으면 빈 문자열)
+    """
+    host = url_host(url)
+    if not host:
+        return ''
+    
+    path, _, query = url.partition('://')[2].split('#', 1)[0].partition('?')
+    path = path.partition('/')[2].rstrip('/')
+    params = sorted(
+        param for param in query.split('&')
+        if param and not param.startswith('utm_') and param.split('=', 1)[0] not in TRACKING_PARAMS
+    )
+    return f"{host}/{path}?{'&'.join(params)}" if params else f"{host}/{path}"
+
+def url_bucket(url):
+    """
+    정규화한 URL의 버킷 키를 계산합니다. 같은 URL의 스토리는 같은 버킷에 들어갑니다.
+    
+    Args:
+        url (str): 정규화한 URL
+    
+    Returns:
+        int: 버킷 키 (URL이 없으면 None)
+    """
+    if not url:
+        return None
+    digest = hashlib.blake2b(f"url:{url}".encode('utf-8'), digest_size=8).digest()
+    return int.from_bytes(digest, 'big') & BUCKET_MASK
+
+def minhash_signatures(titles):
+    """
+    제목들의 MinHash 서명을 한꺼번에 계산합니다.
+    슁글 해시를 (순열 x 슁글) 배열로 한 번에 변환하고, 제목 경계마다 최솟값을 구합니다.
+    
+    Args:
+        titles (list): 제목 목록
+    
+    Returns:
+        tuple: (서명 배열 (제목 수 x NUM_PERMUTATIONS, uint32), 슁글이 있는 제목 여부 배열)
+    """
+    shingle_sets = [title_shingles(title) for title in titles]
+    lengths = np.fromiter(map(len, shingle_sets), dtype=np.int64, count=len(shingle_sets))
+    signatures = np.full((len(titles), NUM_PERMUTATIONS), MERSENNE_PRIME, dtype=np.uint32)
+    
+    for start in range(0, len(titles), SIGNATURE_BATCH_SIZE):
+        batch = shingle_sets[start:start + SIGNATURE_BATCH_SIZE]
+        batch_lengths = lengths[start:start + SIGNATURE_BATCH_SIZE]
+        nonempty = np.flatnonzero(batch_lengths)
+        if not len(nonempty):
+            continue
+        
+        hashes = np.fromiter(
+            (zlib.crc32(shingle.encode('utf-8')) for shingle in chain.from_iterable(batch)),
+            dtype=np.uint64, count=int(batch_lengths.sum())
+        ) % np.uint64(MERSENNE_PRIME)
+        values = (PERMUTATION_A[:, None] * hashes[None, :] + PERMUTATION_B[:, None]) % np.uint64(MERSENNE_PRIME)
+        
+        # 빈 제목을 건너뛴 경계 위치에서 제목별 최솟값
+        offsets = np.concatenate([[0], np.cumsum(batch_lengths)[:-1]])[nonempty]
+        signatures[start + nonempty] = np.minimum.reduceat(values, offsets, axis=1).T
+    
+    return signatures, lengths > 0
+
+def band_buckets(signatures):
+    """
+    서명을 LSH_BANDS개 밴드로 나눠 밴드별 버킷 키를 계산합니다. 밴드 번호도 키에 섞어 밴드끼리 겹치지 않게 합니다.
+    
+    Args:
+        signatures (numpy.ndarray): 서명 배열 (스토리 수 x NUM_PERMUTATIONS)
+    
+    Returns:
+        numpy.ndarray: 버킷 키 배열 (스토리 수 x LSH_BANDS, int64)
+    """
+    bands = signatures.astype(np.uint64).reshape(len(signatures), LSH_BANDS, LSH_ROWS)
+    keys = np.arange(LSH_BANDS, dtype=np.uint64)[None, :] * BAND_MIXERS[0]
+    
+    with np.errstate(over='ignore'):
+        for row in range(LSH_ROWS):
+            keys = (keys ^ bands[:, :, row]) * BAND_MIXERS[row % len(BAND_MIXERS)]
+    
+    return (keys & np.uint64(BUCKET_MASK)).astype(np.int64)
+
+class NearDuplicateIndex:
+    """
+    스토리 MinHash 서명과 LSH 버킷을 저장하는 SQLite 인덱스입니다.
+    스토리마다 묶음 ID(cluster_id)를 부여하며, 묶음 ID는 묶음에서 가장 먼저 인덱스에 들어온 스토리의 ID입니다.
+    
+    Args:
+        path (str | Path, optional): SQLite 파일 경로 (기본값: 현재 API 서버의 기본 인덱스)
+        threshold (float): 같은 소식으로 볼 추정 자카드 유사도
+    """
+    
+    def __init__(self, path=None, threshold=DUPLICATE_SIMILARITY):
+        self.path = Path(path) if path is not None else scoped_path(DEFAULT_INDEX_PATH)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.threshold = threshold
+        
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS signatures (
+                story_id INTEGER PRIMARY KEY,
+                cluster_id INTEGER NOT NULL,
+                url_bucket INTEGER,
+                signature BLOB
+            );
+            CREATE TABLE IF NOT EXISTS lsh_buckets (
+                bucket INTEGER NOT NULL,
+                story_id INTEGER NOT NULL,
+                PRIMARY KEY (bucket, story_id)
+            ) WITHOUT ROWID;
+            """
+        )
+        self._conn.commit()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def _known_clusters(self, story_ids):
+        """
+        이미 인덱스에 있는 스토리의 묶음 ID를 조회합니다.
+        
+        Returns:
+            dict: 스토리 ID -> 묶음 ID
+        """
+        known = {}
+        for start in range(0, len(story_ids), 500):
+            batch = story_ids[start:start + 500]
+            placeholders = ','.join('?' * len(batch))
+            known.update(self._conn.execute(
+                f"SELECT story_id, cluster_id FROM signatures WHERE story_id IN ({placeholders})", batch
+            ).fetchall())
+        return known
+    
+    def _match(self, signature, buckets, url_key):
+        """
+        버킷을 공유하는 후보 중 가장 비슷한 스토리의 묶음 ID를 찾습니다.
+        URL이 같은 스토리가 있으면 그 묶음을 사용하고, 없으면 제목 버킷의 후보와 서명을 비교합니다.
+        (후보가 MAX_BUCKET_CANDIDATES개보다 많은 버킷은 최근 후보만 비교)
+        
+        Args:
+            signature (numpy.ndarray): 서명 (슁글이 없으면 None)
+            buckets (list): 제목 밴드 버킷 키 목록
+            url_key (int): URL 버킷 키 (없으면 None)
+        
+        Returns:
+            int: 묶음 ID (유사한 스토리가 없으면 None)
+        """
+        if url_key is not None:
+            row = self._conn.execute(
+                """
+                SELECT MIN(s.cluster_id) FROM lsh_buckets b JOIN signatures s ON s.story_id = b.story_id
+                WHERE b.bucket = ? AND s.url_bucket = ?
+                """,
+                (url_key, url_key)
+            ).fetchone()
+            if row[0] is not None:
+                return row[0]
+        
+        if signature is None or not buckets:
+            return None
+        
+        # 버킷별로 (bucket, story_id) 인덱스를 역순으로 읽어 최근 후보만 가져옴
+        recent = ' UNION '.join(
+            ['SELECT * FROM (SELECT story_id FROM lsh_buckets WHERE bucket = ? ORDER BY story_id DESC LIMIT ?)'] * len(buckets))
+        candidates = self._conn.execute(
+            f"SELECT cluster_id, signature FROM signatures WHERE signature IS NOT NULL AND story_id IN ({recent})",
+            [value for bucket in buckets for value in (bucket, MAX_BUCKET_CANDIDATES)]
+        ).fetchall()
+        if not candidates:
+            return None
+        
+        # 후보 서명을 한 배열로 비교해 가장 비슷한 후보 선택 (유사도가 같으면 묶음 ID가 작은 묶음)
+        cluster_ids = np.array([cluster_id for cluster_id, _ in candidates], dtype=np.int64)
+        similarities = (np.frombuffer(b''.join(blob for _, blob in candidates), dtype=np.uint32)
+                        .reshape(len(candidates), NUM_PERMUTATIONS) == signature).mean(axis=1)
+        best = np.lexsort((cluster_ids, -similarities))[0]
+        
+        return int(cluster_ids[best]) if similarities[best] >= self.threshold else None
+    
+    def assign(self, story_ids, titles, urls):
+        """
+        스토리에 묶음 ID를 부여합니다. 이미 인덱스에 있는 스토리는 저장된 묶음 ID를 그대로 사용하고,
+        새 스토리는 ID 순서대로 후보와 비교한 뒤 인덱스에 추가하므로 같은 묶음 안의 새 스토리끼리도 묶입니다.
+        
+        Args:
+            story_ids (list): 스토리 ID 목록
+            titles (list): 제목 목록
+            urls (list): URL 목록
+        
+        Returns:
+            dict: 스토리 ID -> 묶음 ID
+        """
+        story_ids = [int(story_id) for story_id in story_ids]
+        
+        with self._lock:
+            clusters = self._known_clusters(story_ids)
+            new_rows = sorted(
+                {story_id: (title, url) for story_id, title, url in zip(story_ids, titles, urls)
+                 if story_id not in clusters}.items()
+            )
+            if not new_rows:
+                return clusters
+            
+            signatures, has_shingles = minhash_signatures([title for _, (title, _) in new_rows])
+            buckets = band_buckets(signatures)
+            
+            for index, (story_id, (_, url)) in enumerate(new_rows):
+                url_key = url_bucket(canonical_url(url))
+                signature = signatures[index] if has_shingles[index] else None
+                story_buckets = buckets[index].tolist() if signature is not None else []
+                if url_key is not None:
+                    story_buckets.append(url_key)
+                
+                cluster_id = self._match(signature, story_buckets, url_key)
+                clusters[story_id] = story_id if cluster_id is None else cluster_id
+                
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO signatures (story_id, cluster_id, url_bucket, signature) VALUES (?, ?, ?, ?)",
+                    (story_id, clusters[story_id], url_key, signature.tobytes() if signature is not None else None)
+                )
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO lsh_buckets (bucket, story_id) VALUES (?, ?)",
+                    [(bucket, story_id) for bucket in story_buckets]
+                )
+            
+            self._conn.commit()
+        
+        return clusters
+    
+    def remove(self, story_ids):
+        """
+        스토리를 인덱스에서 지웁니다. 저장된 서명으로 밴드 버킷 키를 다시 계산해 버킷 행도 함께 지우므로,
+        다시 assign()하면 묶음 ID를 새로 부여합니다. 지운 스토리를 묶음 ID로 가진 다른 스토리의 묶음 ID는 바뀌지 않습니다.
+        
+        Args:
+            story_ids (list): 스토리 ID 목록
+        
+        Returns:
+            int: 지운 스토리 수
+        """
+        story_ids = [int(story_id) for story_id in story_ids]
+        removed = 0
+        
+        with self._lock:
+            for start in range(0, len(story_ids), 500):
+                batch = story_ids[start:start + 500]
+                placeholders = ','.join('?' * len(batch))
+                rows = self._conn.execute(
+                    f"SELECT story_id, url_bucket, signature FROM signatures WHERE story_id IN ({placeholders})", batch
+                ).fetchall()
+                if not rows:
+                    continue
+                
+                bucket_rows = [(url_key, story_id) for story_id, url_key, _ in rows if url_key is not None]
+                signed = [(story_id, blob) for story_id, _, blob in rows if blob is not None]
+                if signed:
+                    signatures = (np.frombuffer(b''.join(blob for _, blob in signed), dtype=np.uint32)
+                                  .reshape(len(signed), NUM_PERMUTATIONS))
+                    bucket_rows += [(bucket, story_id) for (story_id, _), keys in zip(signed, band_buckets(signatures).tolist())
+                                    for bucket in keys]
+                
+                self._conn.executemany("DELETE FROM lsh_buckets WHERE bucket = ? AND story_id = ?", bucket_rows)
+                self._conn.executemany("DELETE FROM signatures WHERE story_id = ?", [(story_id,) for story_id, _, _ in rows])
+                removed += len(rows)
+            
+            self._conn.commit()
+        
+        return removed
+    
+    def count(self):
+        """
+        인덱스에 있는 스토리 수를 반환합니다.
+        """
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM signatures").fetchone()[0]
+    
+    def close(self):
+        """
+        데이터베이스 연결을 닫습니다.
+        """
+        with self._lock:
+            self._conn.close()
+
+class ClusterStats:
+    """
+    처리한 스토리의 묶음별 개수를 누적해 중복 제거 후 스토리 수와 중복 묶음을 계산합니다.
+    묶음 ID와 다른 ID를 가진(묶음에 나중에 들어온) 스토리만 따로 기억합니다.
+    """
+    
+    def __init__(self):
+        self.sizes = Counter()
+        self.members = {}
+    
+    def add(self, story_ids, cluster_ids):
+        """
+        스토리와 묶음 ID를 더합니다.
+        
+        Args:
+            story_ids (iterable): 스토리 ID 목록
+            cluster_ids (iterable): 묶음 ID 목록 (같은 순서)
+        """
+        for story_id, cluster_id in zip(story_ids, cluster_ids):
+            self.sizes[cluster_id] += 1
+            if story_id != cluster_id:
+                self.members.setdefault(cluster_id, []).append(story_id)
+    
+    def to_analysis(self):
+        """
+        중복 제거 후 스토리 수와 큰 중복 묶음 목록을 반환합니다.
+        
+        Returns:
+            dict: unique_stories, duplicate_clusters
+        """
+        clusters = []
+        for cluster_id, members in self.members.items():
+            size = self.sizes[cluster_id]
+            story_ids = ([cluster_id] if size > len(members) else []) + sorted(members)
+            if len(story_ids) > 1:
+                clusters.append({'cluster_id': cluster_id, 'size': size, 'story_ids': story_ids})
+        
+        clusters.sort(key=lambda cluster: (-cluster['size'], cluster['cluster_id']))
+        return {
+            'unique_stories': len(self.sizes),
+            'duplicate_clusters': clusters[:DUPLICATE_CLUSTERS_COUNT]
+        }
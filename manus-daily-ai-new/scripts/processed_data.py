@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+처리 결과 저장 모듈
+처리된 스토리 DataFrame을 Parquet(zstd 압축, 컬럼 단위)으로 저장하고 필요한 컬럼만 읽습니다.
+시간은 datetime, 작성자/종류/요일은 범주형 그대로 복원되므로 읽은 뒤 다시 변환할 필요가 없습니다.
+pyarrow가 설치되어 있지 않으면 CSV로 저장합니다.
+"""
+
+import os
+from pathlib import Path
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
+
+from api_scope import scoped_path
+
+# 기본 경로 설정
+BASE_DIR = Path(__file__).parent.parent
+DATA_DIR = BASE_DIR / "data"
+PROCESSED_DIR = scoped_path(DATA_DIR / "processed")
+
+# Parquet 압축 방식
+PARQUET_COMPRESSION = 'zstd'
+
+# CSV로 읽을 때 datetime으로 변환할 컬럼
+DATETIME_COLUMNS = ['time', 'date']
+
+def parquet_available():
+    """
+    Parquet으로 저장할 수 있는지(pyarrow 설치 여부) 확인합니다.
+    """
+    return pq is not None
+
+def processed_path(label, processed_dir=PROCESSED_DIR):
+    """
+    처리 결과를 저장할 파일 경로를 반환합니다. (pyarrow가 있으면 .parquet, 없으면 .csv)
+    
+    Args:
+        label (str): 파일 이름에 넣을 날짜 또는 이름
+        processed_dir (Path): 처리 결과 디렉토리
+    
+    Returns:
+        Path: 파일 경로
+    """
+    suffix = 'parquet' if parquet_available() else 'csv'
+    return Path(processed_dir) / f"processed_stories_{label}.{suffix}"
+
+def find_processed_file(label, processed_dir=PROCESSED_DIR):
+    """
+    저장된 처리 결과 파일을 찾습니다. 읽을 수 있으면 Parquet 파일을, 없으면 CSV 파일을 사용합니다.
+    
+    Args:
+        label (str): 날짜 또는 이름
+        processed_dir (Path): 처리 결과 디렉토리
+    
+    Returns:
+        Path: 파일 경로 (없으면 None)
+    """
+    parquet_file = Path(processed_dir) / f"processed_stories_{label}.parquet"
+    csv_file = Path(processed_dir) / f"processed_stories_{label}.csv"
+    
+    if parquet_available() and parquet_file.exists():
+        return parquet_file
+    if csv_file.exists():
+        return csv_file
+    return None
+
+def _arrow_type(dtype):
+    """
+    pandas 자료형에 해당하는 Arrow 타입을 반환합니다. 문자열(object) 컬럼은 string, 범주형은 int32 코드의 딕셔너리입니다.
+    """
+    if isinstance(dtype, pd.CategoricalDtype):
+        return pa.dictionary(pa.int32(), _arrow_type(dtype.categories.dtype))
+    if pd.api.types.is_object_dtype(dtype) or pd.api.types.is_string_dtype(dtype):
+        return pa.string()
+    return pa.from_numpy_dtype(dtype)
+
+def processed_schema(df):
+    """
+    DataFrame 컬럼 자료형으로 Arrow 스키마를 만듭니다.
+    값에서 타입을 추론하지 않으므로 첫 묶음에서 값이 모두 비어 있는 컬럼(url, text 등)도 null 타입이 되지 않아
+    이후 묶음도 같은 스키마로 쓸 수 있습니다.
+    
+    Args:
+        df (pandas.DataFrame): 처리된 DataFrame (행이 없어도 됨)
+    
+    Returns:
+        pyarrow.Schema: 컬럼별 Arrow 스키마 (pandas 메타데이터 포함)
+    """
+    metadata = pa.Schema.from_pandas(df, preserve_index=False).metadata
+    return pa.schema([pa.field(str(column), _arrow_type(dtype)) for column, dtype in df.dtypes.items()], metadata=metadata)
+
+def save_processed(df, label, processed_dir=PROCESSED_DIR):
+    """
+    처리된 DataFrame을 원자적으로 저장합니다.
+    
+    Args:
+        df (pandas.DataFrame): 처리된 DataFrame
+        label (str): 파일 이름에 넣을 날짜 또는 이름
+        processed_dir (Path): 처리 결과 디렉토리
+    
+    Returns:
+        Path: 저장된 파일 경로
+    """
+    with ProcessedWriter(label, processed_dir) as writer:
+        writer.write(df)
+    return writer.path
+
+def load_processed(path, columns=None):
+    """
+    저장된 처리 결과를 로드합니다. Parquet 파일은 요청한 컬럼만 디스크에서 읽습니다.
+    
+    Args:
+        path (str | Path): 처리 결과 파일 경로
+        columns (list, optional): 읽을 컬럼 (파일에 없는 컬럼은 무시, 기본값: 모두)
+    
+    Returns:
+        pandas.DataFrame: 처리된 DataFrame
+    """
+    path = Path(path)
+    
+    if path.suffix == '.parquet':
+        if columns is not None:
+            available = set(pq.read_schema(path).names)
+            columns = [column for column in columns if column in available]
+        return pd.read_parquet(path, columns=columns)
+    
+    usecols = None if columns is None else (lambda column: column in columns)
+    df = pd.read_csv(path, usecols=usecols)
+    for column in DATETIME_COLUMNS:
+        if column in df.columns:
+            df[column] = pd.to_datetime(df[column], errors='coerce')
+    return df
+
+class ProcessedWriter:
+    """
+    처리된 DataFrame을 묶음 단위로 이어 쓰는 작성기입니다. 임시 파일에 쓰고 close()에서 최종 경로로 옮깁니다.
+    Parquet은 묶음마다 행 그룹을 하나씩 추가하고, CSV는 첫 묶음에만 헤더를 씁니다.
+    
+    Args:
+        label (str): 파일 이름에 넣을 날짜 또는 이름
+        processed_dir (Path): 처리 결과 디렉토리
+    """
+    
+    def __init__(self, label, processed_dir=PROCESSED_DIR):
+        Path(processed_dir).mkdir(parents=True, exist_ok=True)
+        self.path = processed_path(label, processed_dir)
+        self.tmp_path = Path(f"{self.path}.tmp")
+        self.rows = 0
+        self._writer = None
+        self._schema = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            self.discard()
+    
+    def write(self, df):
+        """
+        DataFrame 묶음을 이어 씁니다. Parquet 스키마는 첫 묶음의 컬럼 자료형으로 정하고 이후 묶음을 그 스키마로 변환합니다.
+        
+        Args:
+            df (pandas.DataFrame): 처리된 DataFrame 묶음
+        """
+        if parquet_available():
+            if self._writer is None:
+                self._schema = processed_schema(df)
+                self._writer = pq.ParquetWriter(str(self.tmp_path), self._schema, compression=PARQUET_COMPRESSION)
+            self._writer.write_table(pa.Table.from_pandas(df, schema=self._schema, preserve_index=False))
+        else:
+            df.to_csv(self.tmp_path, mode='w' if self.rows == 0 else 'a', header=self.rows == 0,
+                      index=False, encoding='utf-8')
+        self.rows += len(df)
+    
+    def close(self):
+        """
+        쓰기를 마치고 임시 파일을 최종 경로로 옮깁니다.
+        """
+        if self._writer is not None:
+            self._writer.close()
+        if self.tmp_path.exists():
+            os.replace(self.tmp_path, self.path)
+    
+    def discard(self):
+        """
+        쓰던 임시 파일을 지웁니다.
+        """
+        if self._writer is not None:
+            self._writer.close()
+        self.tmp_path.unlink(missing_ok=True)
@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+요청 속도 제한 모듈
+토큰 버킷 방식으로 요청 속도를 제한하고, 서버 응답에 따라 속도를 자동으로 조절합니다.
+여러 프로세스가 함께 지켜야 하는 상한은 SQLite 파일에 공유한 다음 허용 시각으로 적용합니다.
+"""
+
+import email.utils
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+# 기본 속도 설정 (초당 요청 수)
+DEFAULT_RATE = 25.0
+DEFAULT_BURST = 25
+DEFAULT_MIN_RATE = 1.0
+DEFAULT_MAX_RATE = 50.0
+
+# 제한 응답(429/5xx)을 받으면 속도를 이 비율로 줄임
+DECREASE_FACTOR = 0.5
+
+# 동시에 들어온 제한 응답으로 속도가 연속해서 줄지 않도록 감속 사이에 둘 최소 간격(초)
+DECREASE_COOLDOWN = 1.0
+
+# 정상 응답마다 늘릴 속도 (초당 요청 수)
+INCREASE_STEP = 0.1
+
+# 공유 상한 파일의 쓰기 잠금을 기다릴 최대 시간(초)
+SHARED_LOCK_TIMEOUT = 30.0
+
+def parse_retry_after(value):
+    """
+    Retry-After 헤더 값을 대기 시간(초)으로 변환합니다.
+    
+    Args:
+        value (str): 헤더 값 (초 단위 숫자 또는 HTTP 날짜)
+    
+    Returns:
+        float: 대기 시간(초), 해석할 수 없으면 None
+    """
+    if not value:
+        return None
+    
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    
+    if retry_at is None:
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+class AdaptiveRateLimiter:
+    """
+    제한 응답에 따라 속도를 줄이고 정상 응답이 이어지면 다시 늘리는 토큰 버킷입니다.
+    여러 스레드에서 함께 사용할 수 있습니다.
+    
+    Args:
+        rate (float): 초기 속도 (초당 요청 수)
+        burst (int): 한 번에 몰아서 보낼 수 있는 최대 요청 수
+        min_rate (float): 줄일 수 있는 최저 속도
+        max_rate (float): 늘릴 수 있는 최고 속도
+    """
+    
+    def __init__(self, rate=DEFAULT_RATE, burst=DEFAULT_BURST,
+                 min_rate=DEFAULT_MIN_RATE, max_rate=DEFAULT_MAX_RATE):
+        self.rate = rate
+        self.burst = burst
+        self.min_rate = min_rate
+        self.max_rate = max(max_rate, rate)
+        
+        self._lock = threading.Lock()
+        self._tokens = float(burst)
+        self._updated_at = time.monotonic()
+        self._blocked_until = 0.0
+        self._decreased_at = float('-inf')
+        
+        self.throttles = 0
+        # 요청이 하나라도 대기 중이던 벽시계 시간 (스레드별 대기 시간을 더하면 동시 대기가 겹쳐 세어짐)
+        self.total_wait = 0.0
+        self._waiting_until = 0.0
+    
+    def _reserve(self):
+        """
+        토큰 하나를 예약하고 사용 가능해질 때까지 기다려야 하는 시간을 반환합니다.
+        토큰이 부족하면 음수로 빌려 쓰므로, 대기 순서가 예약 순서대로 유지됩니다.
+        
+        Returns:
+            float: 대기 시간(초)
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.rate)
+            self._updated_at = now
+            self._tokens -= 1
+            
+            wait = 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+            return max(wait, self._blocked_until - now)
+    
+    def _record_wait(self, wait):
+        """
+        지금부터 wait초 동안의 대기를 기록합니다. 다른 스레드의 대기와 겹치는 구간은 한 번만 셉니다.
+        
+        Args:
+            wait (float): 대기 시간(초)
+        """
+        with self._lock:
+            now = time.monotonic()
+            until = now + wait
+            if until > self._waiting_until:
+                self.total_wait += until - max(now, self._waiting_until)
+                self._waiting_until = until
+    
+    def acquire(self):
+        """
+        요청을 보낼 수 있을 때까지 현재 스레드를 대기시킵니다.
+        """
+        wait = self._reserve()
+        if wait > 0:
+            self._record_wait(wait)
+            time.sleep(wait)
+    
+    def on_success(self):
+        """
+        정상 응답을 기록하고 속도를 조금 늘립니다.
+        """
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + INCREASE_STEP)
+    
+    def on_throttle(self, retry_after=None):
+        """
+        제한 응답(429/5xx)을 기록하고 속도를 줄입니다.
+        
+        Args:
+            retry_after (float, optional): 서버가 요청한 대기 시간(초)
+        """
+        with self._lock:
+            now = time.monotonic()
+            self.throttles += 1
+            
+            if now - self._decreased_at >= DECREASE_COOLDOWN:
+                self.rate = max(self.min_rate, self.rate * DECREASE_FACTOR)
+                self._decreased_at = now
+            
+            # 쌓여 있던 토큰을 비워 즉시 몰려가는 요청을 막음
+            self._tokens = min(self._tokens, 0.0)
+            
+            if retry_after:
+                self._blocked_until = max(self._blocked_until, now + retry_after)
+    
+    def get_stats(self):
+        """
+        속도 제한 통계를 반환합니다.
+        
+        Returns:
+            dict: 현재 속도, 제한 응답 수, 요청이 대기 중이던 벽시계 시간
+        """
+        with self._lock:
+            return {
+                'rate': round(self.rate, 2),
+                'throttles': self.throttles,
+                'total_wait': round(self.total_wait, 2)
+            }
+
+class SharedRateLimiter(AdaptiveRateLimiter):
+    """
+    같은 SQLite 파일을 쓰는 모든 프로세스가 함께 지키는 속도 상한을 더한 AdaptiveRateLimiter입니다.
+    제한 응답에 따라 속도를 줄이는 것은 프로세스마다 하고, 요청 시각은 파일에 저장한 키별 다음 허용 시각에서 예약하므로
+    같은 키로 동시에 실행한 프로세스들의 요청을 합쳐도 rate를 넘지 않습니다.
+    
+    Args:
+        path (str | Path): 공유 상태를 저장할 SQLite 파일 경로
+        key (str): 상한을 함께 쓸 요청 종류 (예: 'refresh')
+        rate (float): 모든 프로세스를 합친 최고 속도 (초당 요청 수)
+        burst (int): 쉬고 난 뒤 한 번에 몰아서 보낼 수 있는 최대 요청 수
+        min_rate (float): 줄일 수 있는 최저 속도
+    """
+    
+    def __init__(self, path, key, rate, burst=1, min_rate=DEFAULT_MIN_RATE):
+        super().__init__(rate=rate, burst=burst, min_rate=min(min_rate, rate), max_rate=rate)
+        self.key = key
+        self.ceiling = rate
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        
+        self._shared_lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), timeout=SHARED_LOCK_TIMEOUT, check_same_thread=False,
+                                     isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS rate_limits (key TEXT PRIMARY KEY, next_at REAL NOT NULL)")
+    
+    def _reserve_shared(self):
+        """
+        모든 프로세스가 공유하는 다음 허용 시각에서 요청 하나의 시각을 예약합니다.
+        프로세스 사이에서 비교할 수 있도록 벽시계 시각(time.time)을 사용합니다.
+        
+        Returns:
+            float: 대기 시간(초)
+        """
+        interval = 1.0 / self.ceiling
+        
+        with self._shared_lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._conn.execute("SELECT next_at FROM rate_limits WHERE key = ?", (self.key,)).fetchone()
+                now = time.time()
+                # 쉬는 동안 쌓인 여유는 burst개까지만 인정
+                slot = max(row[0] if row else now, now - (self.burst - 1) * interval)
+                self._conn.execute("INSERT OR REPLACE INTO rate_limits (key, next_at) VALUES (?, ?)",
+                                   (self.key, slot + interval))
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        
+        return max(0.0, slot - now)
+    
+    def _reserve(self):
+        """
+        프로세스 안의 토큰 버킷과 공유 상한에서 각각 예약하고 더 긴 대기 시간을 반환합니다.
+        
+        Returns:
+            float: 대기 시간(초)
+        """
+        return max(super()._reserve(), self._reserve_shared())
+    
+    def close(self):
+        """
+        공유 상한 데이터베이스 연결을 닫습니다.
+        """
+        with self._shared_lock:
+            self._conn.close()
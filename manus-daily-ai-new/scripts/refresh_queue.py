@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+새로 고침 큐 모듈
+추적 중인 스토리를 다음 새로 고침 시각 기준의 최소 힙으로 관리하고,
+최근 점수/댓글 증가 속도에 따라 스토리마다 새로 고침 간격을 조절합니다.
+"""
+
+import heapq
+import time
+
+from story_velocity import compute_velocity
+
+# 작성 후 이 시간이 지난 스토리는 투표/댓글이 불가능하므로 추적하지 않음
+TRACKING_WINDOW = 14 * 24 * 3600
+
+# 새로 고침 간격 범위(초)
+MIN_REFRESH_INTERVAL = 5 * 60
+MAX_REFRESH_INTERVAL = 24 * 3600
+
+# 다음 새로 고침까지 기대하는 변화량 (점수 기준, 댓글 하나는 점수 COMMENT_WEIGHT만큼으로 계산)
+REFRESH_TARGET_CHANGE = 5.0
+COMMENT_WEIGHT = 2.0
+
+# 이 속도 미만이고 이 나이를 넘은 스토리는 더 이상 새로 고치지 않음
+COLD_VELOCITY = 0.05
+COLD_AFTER = 3 * 24 * 3600
+
+# 전체 새로 고침 요청 상한 기본값 (분당 요청 수)
+DEFAULT_REFRESH_RPM = 120
+
+def refresh_interval(score_velocity, comment_velocity, age):
+    """
+    스토리의 최근 속도로 다음 새로 고침까지의 간격을 계산합니다.
+    기대 변화량이 REFRESH_TARGET_CHANGE만큼 쌓일 때쯤 다시 확인하도록 합니다.
+    
+    Args:
+        score_velocity (float): 시간당 점수 증가
+        comment_velocity (float): 시간당 댓글 증가
+        age (float): 스토리 나이(초)
+    
+    Returns:
+        float: 새로 고침 간격(초), 더 이상 새로 고칠 필요가 없으면 None
+    """
+    if age > TRACKING_WINDOW:
+        return None
+    
+    heat = max(0.0, score_velocity) + COMMENT_WEIGHT * max(0.0, comment_velocity)
+    if heat < COLD_VELOCITY and age > COLD_AFTER:
+        return None
+    if heat <= 0:
+        return MAX_REFRESH_INTERVAL
+    
+    interval = REFRESH_TARGET_CHANGE / heat * 3600
+    return min(MAX_REFRESH_INTERVAL, max(MIN_REFRESH_INTERVAL, interval))
+
+class RefreshQueue:
+    """
+    다음 새로 고침 시각을 키로 하는 스토리 최소 힙입니다.
+    같은 스토리를 다시 넣으면 이전 항목은 꺼낼 때 버려집니다.
+    """
+    
+    def __init__(self):
+        self._heap = []
+        self._due = {}
+    
+    def __len__(self):
+        return len(self._due)
+    
+    def push(self, story_id, due):
+        """
+        스토리를 새로 고침 시각과 함께 넣습니다.
+        
+        Args:
+            story_id (int): 스토리 ID
+            due (float): 새로 고침 시각 (유닉스 타임스탬프)
+        """
+        self._due[story_id] = due
+        heapq.heappush(self._heap, (due, story_id))
+    
+    def remove(self, story_id):
+        """
+        스토리를 큐에서 뺍니다.
+        
+        Args:
+            story_id (int): 스토리 ID
+        """
+        self._due.pop(story_id, None)
+    
+    def peek_due(self):
+        """
+        가장 먼저 새로 고칠 스토리의 시각을 반환합니다.
+        
+        Returns:
+            float: 새로 고침 시각, 큐가 비었으면 None
+        """
+        self._discard_stale()
+        return self._heap[0][0] if self._heap else None
+    
+    def pop_due(self, now=None, limit=None):
+        """
+        새로 고침 시각이 지난 스토리를 시각 순서로 꺼냅니다.
+        
+        Args:
+            now (float, optional): 현재 시각 (기본값: time.time())
+            limit (int, optional): 꺼낼 최대 개수
+        
+        Returns:
+            list: 스토리 ID 목록
+        """
+        now = now or time.time()
+        due_ids = []
+        
+        while limit is None or len(due_ids) < limit:
+            self._discard_stale()
+            if not self._heap or self._heap[0][0] > now:
+                break
+            
+            _, story_id = heapq.heappop(self._heap)
+            del self._due[story_id]
+            due_ids.append(story_id)
+        
+        return due_ids
+    
+    def _discard_stale(self):
+        """
+        다시 넣거나 뺀 스토리의 이전 힙 항목을 버립니다.
+        """
+        while self._heap and self._due.get(self._heap[0][1]) != self._heap[0][0]:
+            heapq.heappop(self._heap)
+
+def build_refresh_queue(store, now=None):
+    """
+    저장소의 추적 중인 스토리와 스냅샷으로 새로 고침 큐를 만듭니다.
+    각 스토리의 다음 새로 고침 시각은 마지막 스냅샷 시각에 속도 기반 간격을 더한 값입니다.
+    
+    Args:
+        store (StoryStore): 스토리 저장소
+        now (float, optional): 현재 시각
+    
+    Returns:
+        RefreshQueue: 새로 고침 큐
+    """
+    now = now or time.time()
+    queue = RefreshQueue()
+    
+    tracked = store.get_tracked_stories(int(now - TRACKING_WINDOW))
+    if not tracked:
+        return queue
+    
+    stories = [{'id': story_id, 'time': story_time} for story_id, story_time in tracked]
+    snapshots = store.get_snapshots([story_id for story_id, _ in tracked])
+    velocity = compute_velocity(snapshots, stories)
+    
+    last_sampled = {}
+    for story_id, ts, _, _ in snapshots:
+        last_sampled[story_id] = ts
+    
+    for story_id, story_time in tracked:
+        if story_id in velocity.index:
+            row = velocity.loc[story_id]
+            interval = refresh_interval(row['score_velocity'], row['comment_velocity'], now - story_time)
+        else:
+            interval = refresh_interval(0.0, 0.0, now - story_time)
+        
+        if interval is not None:
+            queue.push(story_id, last_sampled.get(story_id, story_time) + interval)
+    
+    return queue
@@ -7,7 +7,6 @@
 import json
 import pandas as pd
 import datetime
-import os
 from pathlib import Path
 import re
 import sys
@@ -16,49 +15,58 @@ import math
 import time
 from collections import Counter
 
+from api_scope import scoped_path
+from processed_data import find_processed_file, load_processed
+from story_store import StoryStore
+from term_matrix import TermMatrix
+
 # 기본 경로 설정
 BASE_DIR = Path(__file__).parent.parent
 DATA_DIR = BASE_DIR / "data"
 REPORTS_DIR = BASE_DIR / "reports"
-PROCESSED_DIR = DATA_DIR / "processed"
+PROCESSED_DIR = scoped_path(DATA_DIR / "processed")
 TEMPLATES_DIR = BASE_DIR / "templates"
 
+# 리포트에서 사용하는 처리 결과 컬럼 (Parquet에서는 이 컬럼만 읽음)
+REPORT_COLUMNS = ['id', 'title', 'url', 'text', 'score', 'by', 'time', 'descendants',
+                  'score_velocity', 'comment_velocity', 'score_acceleration', 'cluster_id']
+
+# 스토리마다 표시할 제목 용어 수
+STORY_TERMS_COUNT = 4
+
 # 디렉토리가 없으면 생성
 REPORTS_DIR.mkdir(exist_ok=True)
 
 def load_processed_data(date_str=None):
     """
-    처리된 데이터와 분석 결과를 로드합니다.
+    처리된 데이터, 분석 결과와 제목 용어 행렬을 로드합니다.
     
     Args:
         date_str (str, optional): 날짜 문자열
         
     Returns:
-        tuple: (DataFrame, 분석 결과)
+        tuple: (DataFrame, 분석 결과, 용어 행렬 또는 None, 로드한 수집일)
     """
     if not date_str:
-        date_str = datetime.datetime.now().strftime('%Y-%m-%d')
+        # 저장소의 가장 최근 수집일 사용 (디렉토리를 훑지 않음)
+        with StoryStore() as store:
+            date_str = store.latest_date()
+        
+        if not date_str:
+            print("No stories found in store")
+            return None, None, None, None
     
     # 처리된 데이터 파일 찾기
-    df_file = PROCESSED_DIR / f"processed_stories_{date_str}.csv"
+    df_file = find_processed_file(date_str, PROCESSED_DIR)
     analysis_file = PROCESSED_DIR / f"analysis_{date_str}.json"
     
-    # 파일이 없으면 최신 파일 찾기
-    if not df_file.exists() or not analysis_file.exists():
-        df_files = list(PROCESSED_DIR.glob('processed_stories_*.csv'))
-        analysis_files = list(PROCESSED_DIR.glob('analysis_*.json'))
-        
-        if not df_files or not analysis_files:
-            print("No processed data files found")
-            return None, None
-        
-        # 가장 최근 파일 선택
-        df_file = max(df_files, key=os.path.getmtime)
-        analysis_file = max(analysis_files, key=os.path.getmtime)
+    if df_file is None or not analysis_file.exists():
+        print(f"No processed data for {date_str}, run data_processor.py first")
+        return None, None, None, date_str
     
     try:
-        # DataFrame 로드
-        df = pd.read_csv(df_file)
+        # DataFrame 로드 (리포트에 필요한 컬럼만)
+        df = load_processed(df_file, REPORT_COLUMNS)
         
         # 분석 결과 로드
         with open(analysis_file, 'r', encoding='utf-8') as f:
@@ -67,17 +75,20 @@ def load_processed_data(date_str=None):
         print(f"Loaded processed data from {df_file}")
         print(f"Loaded analysis results from {analysis_file}")
         
-        return df, analysis
+        # 제목 용어 행렬 로드 (스트리밍 처리 결과에는 없음)
+        term_matrix = TermMatrix.load(PROCESSED_DIR / f"terms_{date_str}.npz")
+        
+        return df, analysis, term_matrix, date_str
     except Exception as e:
         print(f"Error loading processed data: {e}")
-        return None, None
+        return None, None, None, date_str
 
 def format_time_ago(timestamp):
     """
     타임스탬프를 '~시간 전' 형식으로 변환합니다.
     
     Args:
-        timestamp: 변환할 타임스탬프
+        timestamp: 변환할 타임스탬프 (ISO 형식 문자열 또는 datetime)
         
     Returns:
         str: 변환된 문자열
@@ -102,13 +113,29 @@ def format_time_ago(timestamp):
     else:
         return "방금 전"
 
-def prepare_report_data(df, analysis):
+def collapse_duplicates(sorted_df, count):
+    """
+    정렬된 스토리에서 유사 중복 묶음마다 첫 스토리만 남기고 상위 count개를 반환합니다.
+    
+    Args:
+        sorted_df (pandas.DataFrame): 정렬된 DataFrame
+        count (int): 반환할 스토리 수
+    
+    Returns:
+        pandas.DataFrame: 묶음별 대표 스토리 상위 count개
+    """
+    if 'cluster_id' not in sorted_df.columns:
+        return sorted_df.head(count)
+    return sorted_df.drop_duplicates('cluster_id').head(count)
+
+def prepare_report_data(df, analysis, term_matrix=None):
     """
     리포트 생성에 필요한 데이터를 준비합니다.
     
     Args:
         df (pandas.DataFrame): 처리된 DataFrame
         analysis (dict): 분석 결과
+        term_matrix (TermMatrix, optional): 스토리별 제목 용어를 찾을 용어 행렬
         
     Returns:
         dict: 리포트 데이터
@@ -138,6 +165,14 @@ def prepare_report_data(df, analysis):
         for keyword, count in analysis['top_keywords'].items():
             top_keywords.append({'keyword': keyword, 'count': count})
     
+    # 자주 등장한 두 단어 문구
+    top_phrases = []
+    for phrase, count in analysis.get('top_phrases', {}).items():
+        top_phrases.append({'phrase': phrase, 'count': count})
+    
+    # 평소보다 갑자기 많이 등장한 용어
+    keyword_bursts = analysis.get('keyword_bursts', [])
+    
     # 시간대별 분포
     hour_data = {'labels': [], 'values': []}
     if 'hour_distribution' in analysis:
@@ -158,10 +193,10 @@ def prepare_report_data(df, analysis):
     # 상위 스토리 (점수 기준)
     top_stories = []
     if not df.empty and 'score' in df.columns:
-        top_df = df.sort_values('score', ascending=False).head(5)
+        top_df = collapse_duplicates(df.sort_values('score', ascending=False), 5)
         for _, row in top_df.iterrows():
             story = row.to_dict()
-            if 'time' in story and isinstance(story['time'], str):
+            if pd.notna(story.get('time')):
                 try:
                     story['time_ago'] = format_time_ago(story['time'])
                 except:
@@ -171,35 +206,76 @@ def prepare_report_data(df, analysis):
     # 새로운 스토리 (시간 기준)
     new_stories = []
     if not df.empty and 'time' in df.columns:
-        new_df = df.sort_values('time', ascending=False).head(5)
+        new_df = collapse_duplicates(df.sort_values('time', ascending=False), 5)
         for _, row in new_df.iterrows():
             story = row.to_dict()
-            if 'time' in story and isinstance(story['time'], str):
+            if pd.notna(story.get('time')):
                 try:
                     story['time_ago'] = format_time_ago(story['time'])
                 except:
                     story['time_ago'] = story['time']
             new_stories.append(story)
     
+    # 급상승 스토리 (시간당 점수 증가 기준)
+    rising_stories = []
+    if not df.empty and 'score_velocity' in df.columns:
+        rising_df = collapse_duplicates(df[df['score_velocity'] > 0].sort_values(
+            ['score_velocity', 'score_acceleration'], ascending=False
+        ), 5)
+        for _, row in rising_df.iterrows():
+            story = row.to_dict()
+            if pd.notna(story.get('time')):
+                try:
+                    story['time_ago'] = format_time_ago(story['time'])
+                except:
+                    story['time_ago'] = story['time']
+            story['score_velocity'] = round(story['score_velocity'], 1)
+            story['comment_velocity'] = round(story['comment_velocity'], 1)
+            story['accelerating'] = story['score_acceleration'] > 0
+            rising_stories.append(story)
+    
     # 토론이 활발한 스토리 (댓글 수 기준)
     discussions = []
+    discussion_stats = analysis.get('discussion_stats', {})
     if not df.empty and 'descendants' in df.columns:
-        disc_df = df.sort_values('descendants', ascending=False).head(5)
+        disc_df = collapse_duplicates(df.sort_values('descendants', ascending=False), 5)
         for _, row in disc_df.iterrows():
             story = row.to_dict()
-            if 'time' in story and isinstance(story['time'], str):
+            if pd.notna(story.get('time')):
                 try:
                     story['time_ago'] = format_time_ago(story['time'])
                 except:
                     story['time_ago'] = story['time']
+            
+            # 수집 단계에서 탐색한 댓글 트리 통계 추가
+            stats = discussion_stats.get(str(int(story['id']))) if pd.notna(story.get('id')) else None
+            if stats:
+                story['discussion'] = stats
+                story['comment_keywords'] = list(stats.get('keyword_hits', {}).keys())[:5]
             discussions.append(story)
     
-    # 요약 텍스트 생성
+    # 대표 스토리에 묶인 유사 스토리 수
+    if 'cluster_id' in df.columns:
+        cluster_sizes = df['cluster_id'].value_counts()
+        for story_list in [top_stories, new_stories, rising_stories, discussions]:
+            for story in story_list:
+                story['duplicates'] = int(cluster_sizes.get(story['cluster_id'], 1)) - 1
+    
+    # 스토리별 주요 제목 용어 (용어 행렬에서 조회)
+    if term_matrix is not None:
+        for story_list in [top_stories, new_stories, rising_stories]:
+            for story in story_list:
+                if pd.notna(story.get('id')):
+                    story['terms'] = term_matrix.story_terms(story['id'], STORY_TERMS_COUNT)
+    
+    # 요약 텍스트 생성 (유사 중복을 묶은 소식 수가 다르면 함께 표시)
+    unique_stories = analysis.get('unique_stories', total_stories)
+    unique_text = f" (유사 중복을 묶으면 {unique_stories}개의 소식)" if unique_stories < total_stories else ""
     top_domain = top_domains[0]['domain'] if top_domains else "없음"
     top_keyword = top_keywords[0]['keyword'] if top_keywords else "없음"
     
     summary_text = f"""
-    오늘 Hacker News에서 {total_stories}개의 AI 스타트업 관련 스토리가 수집되었습니다.
+    오늘 Hacker News에서 {total_stories}개의 AI 스타트업 관련 스토리가 수집되었습니다.{unique_text}
     평균 점수는 {avg_score}점이며, 최고 점수는 {max_score}점입니다.
     가장 많이 언급된 도메인은 {top_domain}이고, 가장 인기 있는 키워드는 '{top_keyword}'입니다.
     """
@@ -215,10 +291,13 @@ def prepare_report_data(df, analysis):
         'top_domain': top_domain,
         'top_domains': top_domains,
         'top_keywords': top_keywords,
+        'top_phrases': top_phrases,
+        'keyword_bursts': keyword_bursts,
         'hour_data': hour_data,
         'day_data': day_data,
         'top_stories': top_stories,
         'new_stories': new_stories,
+        'rising_stories': rising_stories,
         'discussions': discussions
     }
     
@@ -253,7 +332,8 @@ def generate_report(report_data, template_file='report_template.html'):
             return text
             
         # 스토리 목록에서 텍스트 필드 정리
-        for story_list in [report_data['top_stories'], report_data['new_stories'], report_data['discussions']]:
+        for story_list in [report_data['top_stories'], report_data['new_stories'], report_data['rising_stories'],
+                           report_data['discussions']]:
             for story in story_list:
                 if 'title' in story:
                     story['title'] = clean_text(story['title'])
@@ -270,10 +350,13 @@ def generate_report(report_data, template_file='report_template.html'):
             top_domain=clean_text(report_data['top_domain']),
             top_domains=report_data['top_domains'],
             top_keywords=report_data['top_keywords'],
+            top_phrases=report_data['top_phrases'],
+            keyword_bursts=report_data['keyword_bursts'],
             hour_data=json.dumps(report_data['hour_data']),
             day_data=json.dumps(report_data['day_data']),
             top_stories=report_data['top_stories'],
             new_stories=report_data['new_stories'],
+            rising_stories=report_data['rising_stories'],
             discussions=report_data['discussions']
         )
         
@@ -300,7 +383,7 @@ def save_report(html_content, date_str=None):
         date_str = datetime.datetime.now().strftime('%Y-%m-%d')
     
     # 리포트 파일 경로
-    report_file = REPORTS_DIR / f"ai_startup_report_{date_str}.html"
+    report_file = scoped_path(REPORTS_DIR / f"ai_startup_report_{date_str}.html")
     
     try:
         # HTML 파일 저장
@@ -325,14 +408,14 @@ def create_report(date_str=None):
     """
     print("Starting report generation...")
     
-    # 처리된 데이터 로드
-    df, analysis = load_processed_data(date_str)
+    # 처리된 데이터 로드 (날짜를 주지 않으면 가장 최근 수집일로 정해짐)
+    df, analysis, term_matrix, date_str = load_processed_data(date_str)
     if df is None or analysis is None:
         print("No data available for report generation")
         return None
     
     # 리포트 데이터 준비
-    report_data = prepare_report_data(df, analysis)
+    report_data = prepare_report_data(df, analysis, term_matrix)
     if report_data is None:
         print("Failed to prepare report data")
         return None
@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+과거 데이터 재처리 모듈
+분석 로직이 바뀌었을 때 기간 안의 수집일을 프로세스 풀에서 날짜별로 병렬 재처리하고,
+날짜별 결과를 합쳐 키워드 급상승과 기간 분석을 다시 계산합니다.
+날짜별 소요 시간과 순차 실행 대비 속도 향상을 출력하고 저장합니다.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from data_processor import (
+    PROCESSED_DIR, DEFAULT_CHUNK_SIZE, aggregates_path, analyze_date_range, iter_chunks, load_history_aggregates,
+    process_day, save_analysis
+)
+from keyword_trends import detect_bursts
+from near_duplicates import NearDuplicateIndex
+from story_aggregates import StoryAggregates
+from story_store import StoryStore
+
+# 기본 작업자 프로세스 수
+DEFAULT_WORKERS = os.cpu_count() or 1
+
+def assign_clusters(store, dates, chunk_size=DEFAULT_CHUNK_SIZE, recluster=False):
+    """
+    기간 안의 스토리를 수집일 순서대로 유사 중복 인덱스에 넣습니다.
+    묶음 ID는 인덱스에 들어온 순서에 따라 정해지므로, 작업자들이 동시에 인덱스에 쓰지 않고
+    순차 처리와 같은 묶음을 얻도록 병렬 처리 전에 한 번만 실행합니다.
+    이미 인덱스에 있는 스토리는 저장된 묶음 ID를 그대로 쓰므로, 유사도 기준이나 서명 방식이 바뀌었다면
+    recluster로 기간 안의 스토리를 인덱스에서 먼저 지운 뒤 다시 묶습니다. (기간 밖 스토리의 묶음 ID는 그대로 유지)
+    
+    Args:
+        store (StoryStore): 스토리 저장소
+        dates (list): 수집일 목록 (오름차순)
+        chunk_size (int): 한 번에 인덱스에 넣을 스토리 수
+        recluster (bool): 기간 안의 스토리를 인덱스에서 지우고 묶음 ID를 다시 부여할지 여부
+    
+    Returns:
+        dict: 수집일 -> 스토리 수
+    """
+    counts = {}
+    
+    with NearDuplicateIndex() as index:
+        if recluster:
+            # 앞 날짜 스토리가 뒤 날짜 스토리의 예전 묶음에 들어가지 않도록 기간 전체를 먼저 지움
+            removed = sum(
+                index.remove([story['id'] for story in chunk])
+                for date_str in dates
+                for chunk in iter_chunks(store.iter_stories(date=date_str, batch_size=chunk_size), chunk_size)
+            )
+            print(f"Removed {removed} stories from the near-duplicate index for reclustering")
+        
+        for date_str in dates:
+            counts[date_str] = 0
+            for chunk in iter_chunks(store.iter_stories(date=date_str, batch_size=chunk_size), chunk_size):
+                index.assign([story['id'] for story in chunk], [story.get('title') for story in chunk],
+                             [story.get('url') for story in chunk])
+                counts[date_str] += len(chunk)
+    
+    return counts
+
+def reprocess_day(date_str):
+    """
+    수집일 하루치를 다시 처리하고 처리 결과, 분석 결과, 부분 집계, 제목 용어 행렬을 저장합니다. (작업자 프로세스에서 실행)
+    키워드 급상승은 모든 날짜의 부분 집계가 갱신된 뒤 merge_results()에서 계산합니다.
+    
+    Args:
+        date_str (str): 수집일 (YYYY-MM-DD)
+    
+    Returns:
+        dict: 수집일, 스토리 수, 소요 시간, CPU 시간, 작업자 프로세스 ID
+    """
+    start_time = time.monotonic()
+    start_cpu = time.process_time()
+    
+    # 여러 작업자의 저장 메시지가 섞이지 않도록 처리 중 출력은 숨김
+    with contextlib.redirect_stdout(io.StringIO()):
+        with StoryStore() as store:
+            stories = store.get_stories(date=date_str)
+            snapshots = store.get_snapshots([story['id'] for story in stories])
+        
+        if stories:
+            process_day(stories, snapshots, date_str)
+    
+    return {
+        'date': date_str,
+        'stories': len(stories),
+        'seconds': round(time.monotonic() - start_time, 3),
+        'cpu_seconds': round(time.process_time() - start_cpu, 3),
+        'pid': os.getpid()
+    }
+
+def merge_results(dates):
+    """
+    날짜별 재처리 결과를 합칩니다. 갱신된 부분 집계로 날짜별 키워드 급상승을 계산해 분석 결과에 넣고,
+    기간 전체의 분석 결과를 저장합니다.
+    
+    Args:
+        dates (list): 재처리한 수집일 목록 (오름차순)
+    
+    Returns:
+        str: 기간 분석 결과 파일 경로
+    """
+    with StoryStore() as store:
+        for date_str in dates:
+            today = StoryAggregates.load(aggregates_path(date_str))
+            analysis_file = PROCESSED_DIR / f"analysis_{date_str}.json"
+            if today is None or not analysis_file.exists():
+                continue
+            
+            with open(analysis_file, 'r', encoding='utf-8') as f:
+                analysis = json.load(f)
+            analysis['keyword_bursts'] = detect_bursts(today, load_history_aggregates(store, date_str))
+            save_analysis(analysis, date_str)
+    
+    _, analysis_file = analyze_date_range(dates[0], dates[-1])
+    return analysis_file
+
+def run_reprocess(start_date, end_date, workers=DEFAULT_WORKERS, recluster=False, measure_serial=False):
+    """
+    기간 안의 수집일을 프로세스 풀에서 병렬로 재처리하고 결과를 합칩니다.
+    스토리가 많은 날짜부터 작업자에게 넘겨 마지막에 긴 날짜 하나만 남는 일을 줄입니다.
+    속도 향상은 같은 날짜들을 현재 프로세스에서 순차로 다시 처리해 잰 시간(measure_serial)과 병렬 처리 시간의 비율이며,
+    작업자가 1이면 병렬 처리 시간이 곧 순차 처리 시간입니다. 순차 처리는 병렬 처리 뒤에 실행하므로 디스크 캐시의 이득을 봅니다.
+    
+    Args:
+        start_date (str): 시작 수집일 (YYYY-MM-DD, 포함)
+        end_date (str): 끝 수집일 (YYYY-MM-DD, 포함)
+        workers (int): 작업자 프로세스 수 (1이면 현재 프로세스에서 순차 처리)
+        recluster (bool): 기간 안의 스토리 유사 중복 묶음을 다시 부여할지 여부
+        measure_serial (bool): 순차 처리 시간을 재서 속도 향상을 계산할지 여부 (처리 시간이 약 두 배로 늘어남)
+    
+    Returns:
+        dict: 날짜별 소요 시간과 전체 소요 시간, 잰 경우 순차 처리 시간과 속도 향상 (기간에 수집일이 없으면 None)
+    """
+    start_time = time.monotonic()
+    
+    with StoryStore() as store:
+        dates = [date for date in store.dates() if start_date <= date <= end_date]
+        if not dates:
+            print(f"No stories collected between {start_date} and {end_date}")
+            return None
+        
+        counts = assign_clusters(store, dates, recluster=recluster)
+    
+    cluster_seconds = time.monotonic() - start_time
+    workers = max(1, min(workers, len(dates)))
+    print(f"Reprocessing {len(dates)} days ({start_date} ~ {end_date}, {sum(counts.values())} stories) "
+          f"with {workers} workers (near-duplicate clusters assigned in {cluster_seconds:.1f}s)")
+    
+    results = {}
+    failed = []
+    ordered = sorted(dates, key=lambda date: -counts[date])
+    pool_start = time.monotonic()
+    
+    def record(result):
+        results[result['date']] = result
+        print(f"{result['date']}: {result['stories']} stories in {result['seconds']:.2f}s "
+              f"(cpu {result['cpu_seconds']:.2f}s, pid {result['pid']})")
+    
+    if workers == 1:
+        for date_str in ordered:
+            try:
+                record(reprocess_day(date_str))
+            except Exception as e:
+                print(f"{date_str}: reprocessing failed: {e}")
+                failed.append(date_str)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(reprocess_day, date_str): date_str for date_str in ordered}
+            for future in as_completed(futures):
+                try:
+                    record(future.result())
+                except Exception as e:
+                    print(f"{futures[future]}: reprocessing failed: {e}")
+                    failed.append(futures[future])
+    
+    pool_seconds = time.monotonic() - pool_start
+    
+    # 날짜별 결과 합치기 (키워드 급상승, 기간 분석)
+    merge_start = time.monotonic()
+    done = sorted(results)
+    range_file = merge_results(done) if done else None
+    merge_seconds = time.monotonic() - merge_start
+    total_seconds = time.monotonic() - start_time
+    
+    # 순차 처리 시간: 작업자가 1이면 병렬 처리 시간 그대로, 아니면 같은 날짜들을 이 프로세스에서 다시 처리해 잼
+    serial_seconds = None
+    if workers == 1:
+        serial_seconds = pool_seconds
+    elif measure_serial and done:
+        print(f"Measuring serial baseline over {len(done)} days...")
+        serial_start = time.monotonic()
+        for date_str in done:
+            reprocess_day(date_str)
+        serial_seconds = time.monotonic() - serial_start
+    
+    cpu_seconds = sum(result['cpu_seconds'] for result in results.values())
+    summary = {
+        'from': start_date,
+        'to': end_date,
+        'workers': workers,
+        'recluster': recluster,
+        'days': [results[date] for date in done],
+        'failed': sorted(failed),
+        'cluster_seconds': round(cluster_seconds, 3),
+        'pool_seconds': round(pool_seconds, 3),
+        'merge_seconds': round(merge_seconds, 3),
+        'total_seconds': round(total_seconds, 3),
+        'cpu_seconds': round(cpu_seconds, 3),
+        'serial_seconds': round(serial_seconds, 3) if serial_seconds is not None else None,
+        'speedup': round(serial_seconds / pool_seconds, 2) if serial_seconds is not None and pool_seconds else None,
+        'range_analysis': range_file
+    }
+    
+    summary_file = PROCESSED_DIR / f"reprocess_{start_date}_{end_date}.json"
+    with open(summary_file, 'w', encoding='utf-8') as f:
+        json.dump(summary, f, ensure_ascii=False, indent=2)
+    
+    print(f"Reprocessed {len(done)} days in {pool_seconds:.1f}s with {workers} workers "
+          f"(summed cpu time of workers: {cpu_seconds:.1f}s)")
+    if summary['speedup'] is not None:
+        print(f"Measured serial time: {serial_seconds:.1f}s, speedup: {summary['speedup']:.2f}x")
+    elif workers > 1:
+        print("Speedup not measured (use --measure-serial or compare with a --workers 1 run)")
+    print(f"Total {total_seconds:.1f}s including cluster assignment {cluster_seconds:.1f}s and merge {merge_seconds:.1f}s")
+    if failed:
+        print(f"Failed days: {', '.join(sorted(failed))}")
+    print(f"Saved reprocess timings to {summary_file}")
+    
+    return summary
+
+def main():
+    """
+    메인 함수: 지정한 기간의 수집일을 다시 처리합니다.
+    """
+    parser = argparse.ArgumentParser(description="기간 안의 수집일 병렬 재처리")
+    parser.add_argument("--from", dest="start_date", required=True, help="시작 수집일 (YYYY-MM-DD, 포함)")
+    parser.add_argument("--to", dest="end_date", required=True, help="끝 수집일 (YYYY-MM-DD, 포함)")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS,
+                        help=f"작업자 프로세스 수 (기본값: {DEFAULT_WORKERS}, 1이면 순차 처리)")
+    parser.add_argument("--recluster", action="store_true",
+                        help="기간 안의 스토리를 유사 중복 인덱스에서 지우고 묶음을 다시 부여 (기간 밖 스토리의 묶음은 유지)")
+    parser.add_argument("--measure-serial", action="store_true",
+                        help="병렬 처리 뒤 같은 날짜들을 순차로 다시 처리해 속도 향상을 잼 (처리 시간이 약 두 배로 늘어남)")
+    args = parser.parse_args()
+    
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    if args.end_date < args.start_date:
+        parser.error(f"Invalid range: {args.start_date} ~ {args.end_date}")
+    
+    summary = run_reprocess(args.start_date, args.end_date, args.workers, args.recluster, args.measure_serial)
+    return 0 if summary is not None and not summary['failed'] else 1
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -33,12 +33,17 @@ logging.basicConfig(
 
 logger = logging.getLogger("ai_news_scheduler")
 
-def run_script(script_name):
+# 추적 중인 스토리 새로 고침 확인 간격(분) - 실제 새로 고침 간격은 스토리별 속도에 따라 다름
+# refresh_queue.MIN_REFRESH_INTERVAL(5분)과 맞춰야 빠르게 오르는 스토리가 5분마다 새로 고쳐짐
+REFRESH_INTERVAL_MINUTES = 5
+
+def run_script(script_name, args=None):
     """
     지정된 스크립트를 실행합니다.
     
     Args:
         script_name (str): 실행할 스크립트 파일 이름
+        args (list, optional): 스크립트에 전달할 명령행 인수
         
     Returns:
         bool: 성공 여부
@@ -52,7 +57,7 @@ def run_script(script_name):
     try:
         logger.info(f"Running script: {script_path}")
         result = subprocess.run(
-            [sys.executable, str(script_path)],
+            [sys.executable, str(script_path)] + (args or []),
             capture_output=True,
             text=True,
             check=True
@@ -67,18 +72,33 @@ def run_script(script_name):
         logger.error(f"Failed to run script: {e}")
         return False
 
-def collect_data():
+def collect_data(incremental=True):
     """
     데이터 수집 작업을 실행합니다.
+    
+    Args:
+        incremental (bool): 체크포인트 이후 변경분만 수집할지 여부
     """
     logger.info("Starting data collection job")
-    success = run_script("hn_api.py")
+    success = run_script("hn_api.py", ["--incremental"] if incremental else None)
     
     if success:
         logger.info("Data collection completed successfully")
     else:
         logger.error("Data collection failed")
 
+def refresh_stories():
+    """
+    추적 중인 스토리 새로 고침 작업을 실행합니다. (새로 고침 시각이 지난 스토리만 갱신)
+    """
+    logger.info("Starting story refresh job")
+    success = run_script("hn_api.py", ["--refresh"])
+    
+    if success:
+        logger.info("Story refresh completed successfully")
+    else:
+        logger.error("Story refresh failed")
+
 def process_data():
     """
     데이터 처리 작업을 실행합니다.
@@ -109,8 +129,8 @@ def run_full_pipeline():
     """
     logger.info("Starting full pipeline execution")
     
-    # 데이터 수집
-    collect_data()
+    # 데이터 수집 (하루 한 번은 목록 전체를 다시 확인)
+    collect_data(incremental=False)
     
     # 데이터 처리
     process_data()
@@ -131,6 +151,9 @@ def setup_schedule():
     schedule.every(1).hours.do(collect_data)
     schedule.every(1).hours.at(":15").do(process_data)
     
+    # 주기적으로 추적 중인 스토리 중 새로 고침 시각이 지난 스토리 갱신
+    schedule.every(REFRESH_INTERVAL_MINUTES).minutes.do(refresh_stories)
+    
     # 매일 오후 6시에 리포트 생성
     schedule.every().day.at("18:00").do(generate_report)
     
@@ -170,6 +193,8 @@ def main():
         
         if command == "collect":
             collect_data()
+        elif command == "refresh":
+            refresh_stories()
         elif command == "process":
             process_data()
         elif command == "report":
@@ -178,7 +203,7 @@ def main():
             run_full_pipeline()
         else:
             print(f"Unknown command: {command}")
-            print("Available commands: collect, process, report, pipeline")
+            print("Available commands: collect, refresh, process, report, pipeline")
     else:
         # 인수가 없으면 스케줄러 실행
         run_scheduler()
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+스토리 집계 모듈
+하루치 스토리의 개수, 점수 합계, 도메인/작성자/키워드/문구 빈도, 시간대/요일 분포를 합칠 수 있는 부분 집계로 만들고,
+여러 날의 부분 집계를 더해 기간 분석 결과를 만듭니다. 기간 분석 비용은 스토리 수가 아니라 날짜 수에 비례합니다.
+"""
+
+import json
+import os
+from collections import Counter
+from pathlib import Path
+
+from term_matrix import TermMatrix
+
+# 집계 파일 형식 버전 (집계 방식이 바뀌면 올려서 이전 파일을 다시 계산하게 함)
+AGGREGATES_VERSION = 2
+
+# 분석 결과에 남길 상위 항목 수
+TOP_DOMAINS_COUNT = 10
+TOP_AUTHORS_COUNT = 10
+TOP_KEYWORDS_COUNT = 20
+TOP_PHRASES_COUNT = 10
+
+DAY_ORDER = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+
+def _value_counts(series):
+    """
+    컬럼 값별 개수를 Python 기본 타입의 Counter로 반환합니다.
+    """
+    return Counter({key: int(count) for key, count in series.value_counts().items() if count})
+
+class StoryAggregates:
+    """
+    더하기로 합칠 수 있는 스토리 부분 집계입니다.
+    하루치 집계를 날짜별로 저장해 두면 기간 분석은 저장된 집계를 더하기만 하면 됩니다.
+    """
+    
+    def __init__(self):
+        self.dates = []
+        self.total_stories = 0
+        self.score_sum = 0
+        self.score_max = 0
+        self.domains = Counter()
+        self.authors = Counter()
+        self.keywords = Counter()
+        self.phrases = Counter()
+        self.hours = Counter()
+        self.days = Counter()
+    
+    @classmethod
+    def from_dataframe(cls, df, date_str=None, term_matrix=None):
+        """
+        DataFrame 하나로 부분 집계를 만듭니다.
+        
+        Args:
+            df (pandas.DataFrame): convert_to_dataframe/extract_domains를 거친 DataFrame
+            date_str (str, optional): 집계 날짜 (YYYY-MM-DD)
+            term_matrix (TermMatrix, optional): 이미 만든 제목 용어 행렬 (없으면 새로 만듦)
+        
+        Returns:
+            StoryAggregates: 부분 집계
+        """
+        aggregates = cls()
+        aggregates.add_dataframe(df, term_matrix)
+        if date_str:
+            aggregates.dates.append(date_str)
+        return aggregates
+    
+    def add_dataframe(self, df, term_matrix=None):
+        """
+        DataFrame의 스토리를 집계에 더합니다.
+        
+        Args:
+            df (pandas.DataFrame): 더할 DataFrame
+            term_matrix (TermMatrix, optional): df 제목의 용어 행렬 (없으면 새로 만듦)
+        """
+        self.total_stories += len(df)
+        if df.empty:
+            return
+        
+        if 'score' in df.columns:
+            self.score_sum += int(df['score'].sum())
+            self.score_max = max(self.score_max, int(df['score'].max()))
+        if 'domain' in df.columns:
+            self.domains.update(_value_counts(df['domain']))
+        if 'by' in df.columns:
+            self.authors.update(_value_counts(df['by']))
+        if term_matrix is None and 'title' in df.columns:
+            term_matrix = TermMatrix.from_titles(df['title'], df['id'])
+        if term_matrix is not None:
+            self.keywords.update(term_matrix.term_counts(1))
+            self.phrases.update(term_matrix.term_counts(2))
+        if 'hour' in df.columns:
+            self.hours.update(_value_counts(df['hour']))
+        if 'day_of_week' in df.columns:
+            self.days.update(_value_counts(df['day_of_week']))
+    
+    def merge(self, other):
+        """
+        다른 부분 집계를 더합니다.
+        
+        Args:
+            other (StoryAggregates): 더할 부분 집계
+        
+        Returns:
+            StoryAggregates: 자기 자신
+        """
+        self.dates.extend(other.dates)
+        self.total_stories += other.total_stories
+        self.score_sum += other.score_sum
+        self.score_max = max(self.score_max, other.score_max)
+        self.domains.update(other.domains)
+        self.authors.update(other.authors)
+        self.keywords.update(other.keywords)
+        self.phrases.update(other.phrases)
+        self.hours.update(other.hours)
+        self.days.update(other.days)
+        return self
+    
+    def to_analysis(self):
+        """
+        집계로 분석 결과를 만듭니다.
+        
+        Returns:
+            dict: 기본 통계, 인기 도메인/작성자/키워드/문구, 시간대/요일 분포
+        """
+        return {
+            'total_stories': self.total_stories,
+            'avg_score': self.score_sum / self.total_stories if self.total_stories else 0,
+            'max_score': self.score_max,
+            'top_domains': dict(self.domains.most_common(TOP_DOMAINS_COUNT)),
+            'top_authors': dict(self.authors.most_common(TOP_AUTHORS_COUNT)),
+            'hour_distribution': {hour: self.hours[hour] for hour in sorted(self.hours)},
+            'day_distribution': {day: self.days.get(day, 0) for day in DAY_ORDER},
+            'top_keywords': dict(self.keywords.most_common(TOP_KEYWORDS_COUNT)),
+            'top_phrases': dict(self.phrases.most_common(TOP_PHRASES_COUNT))
+        }
+    
+    def to_dict(self):
+        """
+        집계를 JSON으로 저장할 수 있는 형태로 반환합니다.
+        
+        Returns:
+            dict: 집계
+        """
+        return {
+            'version': AGGREGATES_VERSION,
+            'dates': self.dates,
+            'total_stories': self.total_stories,
+            'score_sum': self.score_sum,
+            'score_max': self.score_max,
+            'domains': dict(self.domains),
+            'authors': dict(self.authors),
+            'keywords': dict(self.keywords),
+            'phrases': dict(self.phrases),
+            'hours': {str(hour): count for hour, count in self.hours.items()},
+            'days': dict(self.days)
+        }
+    
+    @classmethod
+    def from_dict(cls, data):
+        """
+        저장된 집계를 복원합니다.
+        
+        Args:
+            data (dict): to_dict() 결과
+        
+        Returns:
+            StoryAggregates: 집계
+        """
+        aggregates = cls()
+        aggregates.dates = list(data['dates'])
+        aggregates.total_stories = data['total_stories']
+        aggregates.score_sum = data['score_sum']
+        aggregates.score_max = data['score_max']
+        aggregates.domains = Counter(data['domains'])
+        aggregates.authors = Counter(data['authors'])
+        aggregates.keywords = Counter(data['keywords'])
+        aggregates.phrases = Counter(data['phrases'])
+        aggregates.hours = Counter({int(hour): count for hour, count in data['hours'].items()})
+        aggregates.days = Counter(data['days'])
+        return aggregates
+    
+    def save(self, path):
+        """
+        집계를 원자적으로 저장합니다.
+        
+        Args:
+            path (str | Path): 저장할 파일 경로
+        """
+        tmp_path = Path(f"{path}.tmp")
+        
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+    
+    @classmethod
+    def load(cls, path):
+        """
+        저장된 집계를 로드합니다.
+        
+        Args:
+            path (str | Path): 집계 파일 경로
+        
+        Returns:
+            StoryAggregates: 집계 (파일이 없거나 형식 버전이 다르면 None)
+        """
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            print(f"Error loading aggregates from {path}: {e}")
+            return None
+        
+        if data.get('version') != AGGREGATES_VERSION:
+            return None
+        return cls.from_dict(data)
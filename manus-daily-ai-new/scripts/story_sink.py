@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+스토리 스트리밍 저장 모듈
+수집된 스토리를 한 줄에 하나씩(NDJSON) 이어 쓰고, 중단된 수집을 이어서 진행할 수 있게 합니다.
+"""
+
+import json
+import os
+import threading
+from pathlib import Path
+
+# 이 개수만큼 기록할 때마다 디스크에 동기화(fsync)
+DEFAULT_FSYNC_EVERY = 20
+
+def iter_ndjson(path):
+    """
+    NDJSON 파일의 레코드를 한 줄씩 읽어 반환합니다.
+    중단으로 잘린 마지막 줄처럼 해석할 수 없는 줄은 건너뜁니다.
+    
+    Args:
+        path (str | Path): NDJSON 파일 경로
+    
+    Yields:
+        dict: 레코드
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except ValueError:
+                continue
+
+def _recover_file(path):
+    """
+    비정상 종료로 잘린 마지막 줄을 잘라내고, 온전히 기록된 레코드의 ID를 반환합니다.
+    
+    Args:
+        path (Path): NDJSON 파일 경로
+    
+    Returns:
+        set: 기록된 레코드 ID 집합
+    """
+    written_ids = set()
+    if not path.exists():
+        return written_ids
+    
+    valid_size = 0
+    with open(path, 'rb') as f:
+        for line in f:
+            if not line.endswith(b'\n'):
+                break
+            try:
+                record = json.loads(line)
+            except ValueError:
+                break
+            written_ids.add(record.get('id'))
+            valid_size += len(line)
+    
+    if valid_size < path.stat().st_size:
+        print(f"Truncating incomplete record at the end of {path}")
+        with open(path, 'r+b') as f:
+            f.truncate(valid_size)
+    
+    return written_ids
+
+class StorySink:
+    """
+    채택된 스토리를 NDJSON 파일에 추가 기록하는 저장소입니다.
+    파일이 이미 있으면 기록된 ID를 읽어 두고, 같은 ID는 다시 기록하지 않습니다.
+    
+    Args:
+        path (str | Path): NDJSON 파일 경로
+        fsync_every (int): 디스크 동기화 간격 (기록 수)
+    """
+    
+    def __init__(self, path, fsync_every=DEFAULT_FSYNC_EVERY):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.fsync_every = fsync_every
+        
+        self._lock = threading.Lock()
+        self.written_ids = _recover_file(self.path)
+        self._file = open(self.path, 'a', encoding='utf-8')
+        self._pending = 0
+    
+    def __contains__(self, story_id):
+        return story_id in self.written_ids
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def write(self, story):
+        """
+        스토리 하나를 기록합니다.
+        
+        Args:
+            story (dict): 기록할 스토리
+        
+        Returns:
+            bool: 새로 기록했는지 여부 (이미 기록된 ID면 False)
+        """
+        with self._lock:
+            if story.get('id') in self.written_ids:
+                return False
+            
+            self._file.write(json.dumps(story, ensure_ascii=False) + '\n')
+            self.written_ids.add(story.get('id'))
+            self._pending += 1
+            
+            if self._pending >= self.fsync_every:
+                self._sync()
+            
+            return True
+    
+    def _sync(self):
+        """
+        버퍼를 비우고 디스크에 동기화합니다. 잠금을 잡은 상태에서 호출해야 합니다.
+        """
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._pending = 0
+    
+    def sync(self):
+        """
+        아직 동기화되지 않은 기록을 디스크에 반영합니다.
+        """
+        with self._lock:
+            self._sync()
+    
+    def close(self):
+        """
+        남은 기록을 동기화하고 파일을 닫습니다.
+        """
+        with self._lock:
+            if self._file.closed:
+                return
+            self._sync()
+            self._file.close()
@@ -0,0 +1,530 @@
+#!/usr/bin/env python3
+"""
+스토리 저장소 모듈
+수집된 스토리를 SQLite(WAL 모드)에 ID 기준으로 저장하고, 시간/점수/도메인/작성자/수집일 인덱스로 조회합니다.
+"""
+
+import argparse
+import datetime
+import json
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+from api_scope import scoped_path
+from domain_normalizer import url_domain
+from story_sink import iter_ndjson
+
+# 기본 경로 설정
+BASE_DIR = Path(__file__).parent.parent
+DATA_DIR = BASE_DIR / "data"
+DEFAULT_STORE_PATH = DATA_DIR / "stories.sqlite3"
+
+# 저장된 domain 컬럼의 규칙 버전 (PRAGMA user_version, 규칙이 바뀌면 열 때 다시 계산)
+DOMAIN_RULES_VERSION = 1
+
+# 정렬에 사용할 수 있는 컬럼
+SORTABLE_COLUMNS = {'time', 'score', 'descendants', 'id'}
+
+# 스냅샷 다운샘플링 규칙: (이보다 오래된 샘플, 남길 간격) - 스토리별로 간격마다 마지막 샘플만 유지
+SNAPSHOT_DOWNSAMPLING = [
+    (24 * 3600, 3600),
+    (7 * 24 * 3600, 24 * 3600)
+]
+
+# 새로 고침 시 갱신하는 필드 (시간이 지나며 바뀌는 필드)
+REFRESHED_FIELDS = ('score', 'descendants', 'kids', 'dead', 'deleted')
+
+# 예전 일별 파일 이름 (hn_ai_startup_stories_YYYY-MM-DD.json / .ndjson)
+DAILY_FILE_PATTERN = re.compile(r'hn_ai_startup_stories_(\d{4}-\d{2}-\d{2})\.(?:json|ndjson)$')
+
+class StoryStore:
+    """
+    스토리 ID를 키로 하는 SQLite 스토리 저장소입니다.
+    같은 스토리를 다시 저장하면 점수와 댓글 수 등 최신 값으로 갱신하며,
+    스토리가 수집된 날짜는 별도 테이블에 모두 기록하여 날짜별 조회에 사용합니다.
+    
+    Args:
+        path (str | Path, optional): SQLite 파일 경로 (기본값: 현재 API 서버의 기본 저장소)
+    """
+    
+    def __init__(self, path=None):
+        self.path = Path(path) if path is not None else scoped_path(DEFAULT_STORE_PATH)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS stories (
+                id INTEGER PRIMARY KEY,
+                time INTEGER,
+                score INTEGER,
+                descendants INTEGER,
+                by TEXT,
+                domain TEXT,
+                title TEXT,
+                url TEXT,
+                collected_at TEXT,
+                data TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_stories_time ON stories (time);
+            CREATE INDEX IF NOT EXISTS idx_stories_score ON stories (score);
+            CREATE INDEX IF NOT EXISTS idx_stories_domain ON stories (domain);
+            CREATE INDEX IF NOT EXISTS idx_stories_by ON stories (by);
+            
+            CREATE TABLE IF NOT EXISTS story_collections (
+                date TEXT NOT NULL,
+                story_id INTEGER NOT NULL,
+                PRIMARY KEY (date, story_id)
+            );
+            CREATE INDEX IF NOT EXISTS idx_story_collections_story ON story_collections (story_id);
+            
+            CREATE TABLE IF NOT EXISTS story_snapshots (
+                story_id INTEGER NOT NULL,
+                ts INTEGER NOT NULL,
+                score INTEGER,
+                descendants INTEGER,
+                PRIMARY KEY (story_id, ts)
+            ) WITHOUT ROWID;
+            """
+        )
+        self._conn.commit()
+        
+        if self._conn.execute("PRAGMA user_version").fetchone()[0] < DOMAIN_RULES_VERSION:
+            self._renormalize_domains()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def _renormalize_domains(self):
+        """
+        이전 규칙으로 저장된 domain 컬럼을 현재 등록 도메인 규칙으로 다시 계산합니다.
+        """
+        with self._lock:
+            rows = self._conn.execute("SELECT id, url FROM stories").fetchall()
+            self._conn.executemany(
+                "UPDATE stories SET domain = ? WHERE id = ?",
+                [(url_domain(url), story_id) for story_id, url in rows]
+            )
+            self._conn.execute(f"PRAGMA user_version = {DOMAIN_RULES_VERSION}")
+            self._conn.commit()
+        
+        if rows:
+            print(f"Renormalized domains of {len(rows)} stories in {self.path}")
+    
+    def upsert(self, stories, collected_date=None, date_from_time=False, now=None):
+        """
+        스토리를 저장합니다. 이미 있는 ID는 최신 값으로 갱신하고, 점수/댓글 수 스냅샷을 함께 기록합니다.
+        저장된 스토리의 필드 중 새 스토리에 없는 필드(토론 통계 등 수집 후 추가한 정보)는 유지됩니다.
+        
+        Args:
+            stories (iterable): 저장할 스토리
+            collected_date (str, optional): 수집일 (YYYY-MM-DD, 기본값: 스토리의 collected_at 날짜 또는 오늘)
+            date_from_time (bool): 수집일 대신 스토리 작성일(로컬 날짜)을 기록할지 여부
+                                   (백필한 과거 스토리를 작성일의 기간 분석과 키워드 기준선에 넣을 때 True)
+            now (int, optional): 스냅샷 시각 (유닉스 타임스탬프, 기본값: 현재 시각)
+        
+        Returns:
+            int: 저장한 스토리 수
+        """
+        today = datetime.datetime.now().strftime('%Y-%m-%d')
+        now = int(now or time.time())
+        rows = []
+        collections = []
+        snapshots = []
+        
+        for story in stories:
+            if not story or story.get('id') is None:
+                continue
+            
+            rows.append([
+                story['id'], story.get('time'), story.get('score', 0), story.get('descendants', 0),
+                story.get('by', ''), url_domain(story.get('url')), story.get('title', ''), story.get('url', ''),
+                story.get('collected_at', ''), story
+            ])
+            snapshots.append((story['id'], now, story.get('score', 0), story.get('descendants', 0)))
+            if date_from_time and story.get('time'):
+                date = datetime.datetime.fromtimestamp(story['time']).strftime('%Y-%m-%d')
+            else:
+                date = collected_date or (story.get('collected_at') or '')[:10] or today
+            collections.append((date, story['id']))
+        
+        with self._lock:
+            # 저장된 스토리의 필드에 새 필드를 덮어써서 저장
+            existing = self._existing_data([row[0] for row in rows])
+            for row in rows:
+                story = row[-1]
+                if row[0] in existing:
+                    story = {**json.loads(existing[row[0]]), **story}
+                row[-1] = json.dumps(story, ensure_ascii=False)
+            
+            self._conn.executemany(
+                """
+                INSERT INTO stories (id, time, score, descendants, by, domain, title, url, collected_at, data)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(id) DO UPDATE SET
+                    time = excluded.time, score = excluded.score, descendants = excluded.descendants,
+                    by = excluded.by, domain = excluded.domain, title = excluded.title, url = excluded.url,
+                    collected_at = excluded.collected_at, data = excluded.data
+                """,
+                rows
+            )
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO story_collections (date, story_id) VALUES (?, ?)", collections
+            )
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO story_snapshots (story_id, ts, score, descendants) VALUES (?, ?, ?, ?)",
+                snapshots
+            )
+            self._conn.commit()
+        
+        return len(rows)
+    
+    def _existing_data(self, story_ids):
+        """
+        이미 저장된 스토리의 JSON을 조회합니다. (잠금을 잡은 상태에서 호출)
+        
+        Returns:
+            dict: 스토리 ID -> 저장된 JSON 문자열
+        """
+        existing = {}
+        for start in range(0, len(story_ids), 500):
+            batch = story_ids[start:start + 500]
+            placeholders = ','.join('?' * len(batch))
+            existing.update(self._conn.execute(
+                f"SELECT id, data FROM stories WHERE id IN ({placeholders})", batch
+            ).fetchall())
+        return existing
+    
+    def update_stories(self, items, now=None):
+        """
+        새로 가져온 아이템으로 저장된 스토리의 점수/댓글 수/댓글 목록만 갱신하고 스냅샷을 기록합니다.
+        수집 시 추가한 정보(매칭 키워드, 토론 통계 등)는 유지됩니다.
+        
+        Args:
+            items (iterable): 새로 가져온 아이템
+            now (int, optional): 스냅샷 시각 (기본값: 현재 시각)
+        
+        Returns:
+            int: 갱신한 스토리 수
+        """
+        now = int(now or time.time())
+        updated = 0
+        
+        with self._lock:
+            for item in items:
+                if not item or item.get('id') is None:
+                    continue
+                
+                row = self._conn.execute("SELECT data FROM stories WHERE id = ?", (item['id'],)).fetchone()
+                if row is None:
+                    continue
+                
+                story = json.loads(row[0])
+                for field in REFRESHED_FIELDS:
+                    if field in item:
+                        story[field] = item[field]
+                
+                self._conn.execute(
+                    "UPDATE stories SET score = ?, descendants = ?, data = ? WHERE id = ?",
+                    (story.get('score', 0), story.get('descendants', 0), json.dumps(story, ensure_ascii=False), item['id'])
+                )
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO story_snapshots (story_id, ts, score, descendants) VALUES (?, ?, ?, ?)",
+                    (item['id'], now, story.get('score', 0), story.get('descendants', 0))
+                )
+                updated += 1
+            
+            self._conn.commit()
+        
+        return updated
+    
+    def get_tracked_stories(self, since_time):
+        """
+        작성 시각이 since_time 이후인 스토리의 ID와 작성 시각을 조회합니다.
+        
+        Args:
+            since_time (int): 작성 시각 하한 (유닉스 타임스탬프)
+        
+        Returns:
+            list: (스토리 ID, 작성 시각) 튜플 목록
+        """
+        with self._lock:
+            return self._conn.execute("SELECT id, time FROM stories WHERE time >= ?", (since_time,)).fetchall()
+    
+    def add_snapshots(self, snapshots):
+        """
+        점수/댓글 수 스냅샷을 기록합니다. (스토리 본문은 갱신하지 않음)
+        
+        Args:
+            snapshots (iterable): (스토리 ID, 시각, 점수, 댓글 수) 튜플
+        
+        Returns:
+            int: 기록한 스냅샷 수
+        """
+        snapshots = list(snapshots)
+        
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO story_snapshots (story_id, ts, score, descendants) VALUES (?, ?, ?, ?)",
+                snapshots
+            )
+            self._conn.commit()
+        
+        return len(snapshots)
+    
+    def get_snapshots(self, story_ids=None, since=None):
+        """
+        점수/댓글 수 스냅샷을 스토리와 시각 순서로 조회합니다.
+        
+        Args:
+            story_ids (list, optional): 조회할 스토리 ID 목록 (기본값: 전체)
+            since (int, optional): 이 시각 이후의 스냅샷만 조회
+        
+        Returns:
+            list: (스토리 ID, 시각, 점수, 댓글 수) 튜플 목록
+        """
+        query = "SELECT story_id, ts, score, descendants FROM story_snapshots WHERE ts >= ?"
+        params = [since or 0]
+        
+        with self._lock:
+            if story_ids is None:
+                return self._conn.execute(query + " ORDER BY story_id, ts", params).fetchall()
+            
+            # SQLite 변수 개수 제한을 넘지 않도록 나눠서 조회
+            story_ids = list(story_ids)
+            rows = []
+            for start in range(0, len(story_ids), 500):
+                chunk = story_ids[start:start + 500]
+                placeholders = ','.join('?' * len(chunk))
+                rows.extend(self._conn.execute(
+                    query + f" AND story_id IN ({placeholders}) ORDER BY story_id, ts", params + chunk
+                ))
+            return rows
+    
+    def downsample_snapshots(self, now=None):
+        """
+        오래된 스냅샷을 다운샘플링합니다. 규칙마다 기준보다 오래된 샘플은 스토리별로 간격당 마지막 샘플만 남깁니다.
+        
+        Args:
+            now (int, optional): 기준 시각 (기본값: 현재 시각)
+        
+        Returns:
+            int: 삭제한 스냅샷 수
+        """
+        now = int(now or time.time())
+        deleted = 0
+        
+        with self._lock:
+            for age, interval in SNAPSHOT_DOWNSAMPLING:
+                cutoff = now - age
+                cursor = self._conn.execute(
+                    """
+                    DELETE FROM story_snapshots
+                    WHERE ts < :cutoff AND (story_id, ts) NOT IN (
+                        SELECT story_id, MAX(ts) FROM story_snapshots
+                        WHERE ts < :cutoff
+                        GROUP BY story_id, ts / :interval
+                    )
+                    """,
+                    {'cutoff': cutoff, 'interval': interval}
+                )
+                deleted += cursor.rowcount
+            self._conn.commit()
+        
+        return deleted
+    
+    def latest_date(self):
+        """
+        스토리가 수집된 가장 최근 날짜를 반환합니다.
+        
+        Returns:
+            str: 날짜 (YYYY-MM-DD), 수집된 스토리가 없으면 None
+        """
+        with self._lock:
+            return self._conn.execute("SELECT MAX(date) FROM story_collections").fetchone()[0]
+    
+    def dates(self):
+        """
+        스토리가 수집된 날짜 목록을 반환합니다.
+        
+        Returns:
+            list: 날짜 목록 (오름차순)
+        """
+        with self._lock:
+            return [row[0] for row in self._conn.execute("SELECT DISTINCT date FROM story_collections ORDER BY date")]
+    
+    def get_stories(self, date=None, start_time=None, end_time=None, domain=None, by=None,
+                    order_by=None, limit=None):
+        """
+        조건에 맞는 스토리를 조회합니다.
+        
+        Args:
+            date (str, optional): 수집일 (YYYY-MM-DD)
+            start_time (int, optional): 작성 시각 하한 (유닉스 타임스탬프, 포함)
+            end_time (int, optional): 작성 시각 상한 (유닉스 타임스탬프, 미포함)
+            domain (str, optional): 도메인
+            by (str, optional): 작성자
+            order_by (str, optional): 내림차순 정렬 컬럼 (time, score, descendants, id)
+            limit (int, optional): 최대 개수
+        
+        Returns:
+            list: 스토리 목록
+        """
+        query, params = self._story_query(date, start_time, end_time, domain, by)
+        
+        if order_by is not None:
+            if order_by not in SORTABLE_COLUMNS:
+                raise ValueError(f"Cannot order by {order_by}")
+            query += f" ORDER BY s.{order_by} DESC"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+        
+        with self._lock:
+            return [json.loads(row[1]) for row in self._conn.execute(query, params)]
+    
+    def iter_stories(self, date=None, start_time=None, end_time=None, domain=None, by=None, batch_size=1000):
+        """
+        조건에 맞는 스토리를 ID 순서로 batch_size개씩 나눠 조회하며 하나씩 반환합니다.
+        마지막으로 반환한 ID 다음부터 다시 조회하므로 한 번에 메모리에 올리는 스토리는 batch_size개 이하이며,
+        배치 사이에는 잠금을 잡고 있지 않습니다.
+        
+        Args:
+            date (str, optional): 수집일 (YYYY-MM-DD)
+            start_time (int, optional): 작성 시각 하한 (유닉스 타임스탬프, 포함)
+            end_time (int, optional): 작성 시각 상한 (유닉스 타임스탬프, 미포함)
+            domain (str, optional): 도메인
+            by (str, optional): 작성자
+            batch_size (int): 한 번에 조회할 스토리 수
+        
+        Yields:
+            dict: 스토리
+        """
+        query, params = self._story_query(date, start_time, end_time, domain, by)
+        query += (" AND" if params else " WHERE") + " s.id > ? ORDER BY s.id LIMIT ?"
+        last_id = -1
+        
+        while True:
+            with self._lock:
+                rows = self._conn.execute(query, params + [last_id, batch_size]).fetchall()
+            
+            for story_id, data in rows:
+                yield json.loads(data)
+            
+            if len(rows) < batch_size:
+                return
+            last_id = rows[-1][0]
+    
+    def _story_query(self, date=None, start_time=None, end_time=None, domain=None, by=None):
+        """
+        조건에 맞는 스토리를 조회하는 SELECT 문을 만듭니다.
+        
+        Returns:
+            tuple: (ID와 JSON을 조회하는 SQL, 매개변수 목록)
+        """
+        query = "SELECT s.id, s.data FROM stories s"
+        conditions = []
+        params = []
+        
+        if date is not None:
+            query += " JOIN story_collections c ON c.story_id = s.id"
+            conditions.append("c.date = ?")
+            params.append(date)
+        if start_time is not None:
+            conditions.append("s.time >= ?")
+            params.append(start_time)
+        if end_time is not None:
+            conditions.append("s.time < ?")
+            params.append(end_time)
+        if domain is not None:
+            conditions.append("s.domain = ?")
+            params.append(domain)
+        if by is not None:
+            conditions.append("s.by = ?")
+            params.append(by)
+        
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        return query, params
+    
+    def count(self, date=None):
+        """
+        저장된 스토리 수를 반환합니다.
+        
+        Args:
+            date (str, optional): 이 날짜(YYYY-MM-DD)에 수집된 스토리만 셈
+        """
+        with self._lock:
+            if date is not None:
+                return self._conn.execute("SELECT COUNT(*) FROM story_collections WHERE date = ?", (date,)).fetchone()[0]
+            return self._conn.execute("SELECT COUNT(*) FROM stories").fetchone()[0]
+    
+    def close(self):
+        """
+        데이터베이스 연결을 닫습니다.
+        """
+        with self._lock:
+            self._conn.close()
+
+def import_daily_files(store, data_dir=DATA_DIR):
+    """
+    예전 일별 JSON/NDJSON 파일을 저장소로 가져옵니다. 파일 이름의 날짜를 수집일로 기록합니다.
+    
+    Args:
+        store (StoryStore): 스토리 저장소
+        data_dir (Path): 일별 파일 디렉토리
+    
+    Returns:
+        int: 가져온 스토리 수
+    """
+    total = 0
+    
+    for path in sorted(Path(data_dir).glob('hn_ai_startup_stories_*')):
+        match = DAILY_FILE_PATTERN.search(path.name)
+        if not match:
+            continue
+        
+        try:
+            if path.suffix == '.ndjson':
+                stories = list(iter_ndjson(path))
+            else:
+                with open(path, 'r', encoding='utf-8') as f:
+                    stories = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Error reading {path}: {e}")
+            continue
+        
+        count = store.upsert(stories, collected_date=match.group(1))
+        print(f"Imported {count} stories from {path}")
+        total += count
+    
+    return total
+
+def main():
+    """
+    메인 함수: 예전 일별 파일을 저장소로 가져오거나 저장소 현황을 출력합니다.
+    """
+    parser = argparse.ArgumentParser(description="스토리 저장소 관리")
+    parser.add_argument("--import-files", action="store_true", help="data/의 예전 일별 파일을 저장소로 가져오기")
+    args = parser.parse_args()
+    
+    with StoryStore() as store:
+        if args.import_files:
+            total = import_daily_files(store)
+            print(f"Imported {total} stories")
+        
+        dates = store.dates()
+        print(f"{store.count()} stories in {store.path}, "
+              f"collected on {len(dates)} days ({dates[0] if dates else '-'} ~ {dates[-1] if dates else '-'})")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+스토리 속도 모듈
+점수/댓글 수 스냅샷으로 스토리별 최근 증가 속도와 가속도를 계산합니다.
+처리 단계와 수집기의 새로 고침 큐가 함께 사용하므로 불러올 때 파일이나 디렉토리를 만들지 않습니다.
+"""
+
+import pandas as pd
+
+# 속도 구간의 최소 길이(초): 각 샘플은 이만큼 이상 앞선 가장 최근 샘플과 비교 (잡음 방지)
+MIN_VELOCITY_INTERVAL = 60
+
+def compute_velocity(snapshots, stories):
+    """
+    스토리별 점수/댓글 수 스냅샷으로 최근 증가 속도와 가속도를 계산합니다.
+    스토리 작성 시각을 점수 0, 댓글 0인 첫 샘플로 간주하므로 스냅샷이 하나뿐인 스토리도 속도를 구할 수 있습니다.
+    속도는 최신 샘플과 MIN_VELOCITY_INTERVAL 이상 앞선 가장 최근 샘플 사이 구간으로, 가속도는 그 구간과
+    바로 앞 구간(같은 방식으로 고른 기준 샘플)의 속도 변화로 계산합니다.
+    
+    Args:
+        snapshots (list): (스토리 ID, 시각, 점수, 댓글 수) 튜플 목록
+        stories (list): 스토리 목록 ('id', 'time' 사용)
+    
+    Returns:
+        pandas.DataFrame: 스토리 ID를 인덱스로 하는 score_velocity(점수/시간), comment_velocity(댓글/시간),
+                          score_acceleration(점수/시간²) 컬럼
+    """
+    columns = ['story_id', 'ts', 'score', 'descendants']
+    origins = pd.DataFrame(
+        [(story['id'], story.get('time', 0), 0, 0) for story in stories if story.get('id') is not None],
+        columns=columns
+    )
+    samples = pd.concat([origins, pd.DataFrame(snapshots, columns=columns)], ignore_index=True).apply(pd.to_numeric)
+    samples = samples.dropna(subset=['ts']).drop_duplicates(['story_id', 'ts'], keep='last').sort_values('ts', kind='stable')
+    if samples.empty:
+        return pd.DataFrame(columns=['score_velocity', 'comment_velocity', 'score_acceleration'], dtype='float64')
+    
+    # 샘플마다 MIN_VELOCITY_INTERVAL 이상 앞선 가장 최근 샘플을 기준으로 구간 속도 계산
+    # (간격이 짧은 최근 샘플이 있어도 그보다 앞선 샘플과 비교하므로 속도가 0이 되지 않음)
+    earlier = samples.rename(columns={'ts': 'base_ts', 'score': 'base_score', 'descendants': 'base_descendants'})
+    rates = pd.merge_asof(samples.assign(target=samples['ts'] - MIN_VELOCITY_INTERVAL), earlier,
+                          left_on='target', right_on='base_ts', by='story_id')
+    hours = (rates['ts'] - rates['base_ts']) / 3600
+    rates['score_velocity'] = (rates['score'] - rates['base_score']) / hours
+    rates['comment_velocity'] = (rates['descendants'] - rates['base_descendants']) / hours
+    
+    # 가속도: 최신 샘플의 구간 속도와 그 기준 샘플의 구간 속도 차이를 두 구간 중점 사이 시간으로 나눔
+    latest = rates.groupby('story_id').tail(1)
+    previous = rates[['story_id', 'ts', 'base_ts', 'score_velocity']].rename(
+        columns={'ts': 'base_ts', 'base_ts': 'previous_ts', 'score_velocity': 'previous_velocity'}
+    )
+    latest = latest.merge(previous, on=['story_id', 'base_ts'], how='left')
+    midpoint_hours = (latest['ts'] - latest['previous_ts']) / 2 / 3600
+    latest['score_acceleration'] = (latest['score_velocity'] - latest['previous_velocity']) / midpoint_hours
+    
+    velocity = latest.set_index('story_id').sort_index()
+    return velocity[['score_velocity', 'comment_velocity', 'score_acceleration']].fillna(0.0)
@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""
+제목 용어 행렬 모듈
+스토리 제목을 한꺼번에 토큰화해 단어(유니그램)와 두 단어 문구(바이그램)의 희소 문서-용어 행렬을 만듭니다.
+상위 용어와 스토리별 용어는 행렬 연산으로 계산하며, 행렬은 파일로 저장해 리포트에서 다시 사용합니다.
+"""
+
+import json
+import os
+import re
+import sys
+from collections import Counter
+from itertools import chain
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+from keyword_matcher import TOKEN_PATTERN
+
+# 영어 불용어 목록 (관사, 대명사, 전치사, 접속사, 조동사, 흔한 부사와 축약형 조각)
+STOPWORDS = frozenset("""
+a about above after again against all almost also am an and any are aren as at be because been before being
+below between both but by can cannot could couldn did didn do does doesn doing don down during each either else
+ever every few for from further get gets got had hadn has hasn have haven having he her here hers herself him
+himself his how however i if in into is isn it its itself just least less let like ll made make makes many may
+me might more most much must my myself neither no nor not now of off often on once one only or other our ours
+ourselves out over own per quite rather re really s same say says shall she should shouldn since so some still
+such t than that the their theirs them themselves then there these they this those though through thus to too
+under until up upon us ve very via was wasn way we were weren what when where whether which while who whom whose
+why will with within without won would wouldn yet you your yours yourself yourselves
+""".split())
+
+# Hacker News 제목 머리말 (Show HN, Ask HN 등은 주제가 아니라 글 종류)
+TITLE_NOISE_WORDS = frozenset({'hn', 'show', 'ask', 'tell', 'launch'})
+
+# 뒤따르는 한 글자가 의미를 만드는 단어 (series a, plan b 등은 바이그램으로 유지)
+LETTER_QUALIFIED_WORDS = frozenset({'series', 'round', 'plan', 'tier', 'type', 'class'})
+
+# 제목을 이어 붙일 때 쓰는 구분자와, 구분자도 토큰으로 찾는 패턴
+DOCUMENT_SEPARATOR = '\n'
+SEPARATED_TOKEN_PATTERN = re.compile(TOKEN_PATTERN.pattern + r'|\n')
+
+# 용어로 인정할 최소 토큰 길이
+MIN_TOKEN_LENGTH = 2
+
+def is_term_token(token):
+    """
+    토큰이 단독 용어가 될 수 있는지 확인합니다. (불용어, 제목 머리말, 숫자, 한 글자 제외)
+    
+    Args:
+        token (str): 소문자 토큰
+    
+    Returns:
+        bool: 용어 여부
+    """
+    return (len(token) >= MIN_TOKEN_LENGTH and not token.isdigit()
+            and token not in STOPWORDS and token not in TITLE_NOISE_WORDS)
+
+def tokenize_titles(titles):
+    """
+    제목 목록을 한꺼번에 토큰화합니다.
+    제목을 줄바꿈으로 이어 붙여 정규식을 한 번만 실행하고, 줄바꿈 토큰 위치로 토큰별 문서 번호를 계산합니다.
+    
+    Args:
+        titles (iterable): 제목 목록 (문자열이 아닌 값은 빈 제목)
+    
+    Returns:
+        tuple: (전체 토큰 배열, 토큰별 문서 번호 배열, 문서 수)
+    """
+    titles = [title if isinstance(title, str) else '' for title in titles]
+    text = DOCUMENT_SEPARATOR.join(titles).lower()
+    
+    if text.count(DOCUMENT_SEPARATOR) != max(len(titles) - 1, 0):
+        # 줄바꿈이 들어간 제목이 있으면 제목마다 따로 토큰화
+        token_lists = [TOKEN_PATTERN.findall(title.lower()) for title in titles]
+        lengths = np.fromiter(map(len, token_lists), dtype=np.int64, count=len(titles))
+        tokens = np.array(list(chain.from_iterable(token_lists)), dtype=object)
+        return tokens, np.repeat(np.arange(len(titles)), lengths), len(titles)
+    
+    tokens = np.array(SEPARATED_TOKEN_PATTERN.findall(text), dtype=object)
+    separators = tokens == DOCUMENT_SEPARATOR
+    docs = np.cumsum(separators)[~separators]
+    return tokens[~separators], docs, len(titles)
+
+class TermMatrix:
+    """
+    스토리 x 용어 희소 행렬(CSR)과 용어 목록입니다. 행 순서는 스토리 ID 순서와 같습니다.
+    
+    Args:
+        matrix (scipy.sparse.csr_matrix): 스토리별 용어 등장 횟수
+        terms (numpy.ndarray): 열 순서의 용어 (바이그램은 공백으로 연결)
+        ids (numpy.ndarray): 행 순서의 스토리 ID
+    """
+    
+    def __init__(self, matrix, terms, ids):
+        self.matrix = matrix
+        self.terms = terms
+        self.ids = ids
+        self.ngram_sizes = np.char.count(terms.astype(str), ' ') + 1 if len(terms) else np.zeros(0, dtype=np.int64)
+        self._rows = None
+        self._document_frequency = None
+    
+    @classmethod
+    def from_titles(cls, titles, ids):
+        """
+        제목에서 유니그램/바이그램 행렬을 만듭니다.
+        토큰은 한 번에 인코딩하고 불용어 판별은 고유 토큰마다 한 번만 하며, 바이그램은 인접 토큰 배열을 비교해 만듭니다.
+        
+        Args:
+            titles (iterable): 제목 목록
+            ids (iterable): 스토리 ID 목록 (제목과 같은 순서)
+        
+        Returns:
+            TermMatrix: 용어 행렬
+        """
+        tokens, docs, num_docs = tokenize_titles(titles)
+        ids = np.asarray(ids)
+        
+        if not len(tokens):
+            return cls(sparse.csr_matrix((num_docs, 0), dtype=np.int32), np.array([], dtype=object), ids)
+        
+        codes, uniques = pd.factorize(tokens)
+        uniques = np.asarray(uniques, dtype=object)
+        
+        # 고유 토큰별 성질
+        is_term = np.fromiter((is_term_token(token) for token in uniques), dtype=bool, count=len(uniques))
+        is_digit = np.fromiter((token.isdigit() for token in uniques), dtype=bool, count=len(uniques))
+        is_letter = np.fromiter((len(token) == 1 and token.isalpha() for token in uniques), dtype=bool, count=len(uniques))
+        is_qualified = np.fromiter((token in LETTER_QUALIFIED_WORDS for token in uniques), dtype=bool, count=len(uniques))
+        
+        # 유니그램: 용어 토큰
+        valid = is_term[codes]
+        unigram_docs = docs[valid]
+        unigram_codes = codes[valid]
+        
+        # 바이그램: 같은 제목 안의 인접 토큰 중 앞이 용어이고 뒤가 용어, 숫자(gpt 4) 또는 한정 문자(series a)인 쌍
+        first, second = codes[:-1], codes[1:]
+        keep = (docs[1:] == docs[:-1]) & valid[:-1] & (
+            valid[1:] | is_digit[second] | (is_letter[second] & is_qualified[first]))
+        pair_codes, pair_index = np.unique(first[keep] * len(uniques) + second[keep], return_inverse=True)
+        bigrams = [f"{uniques[code // len(uniques)]} {uniques[code % len(uniques)]}" for code in pair_codes]
+        
+        # 유니그램 열 뒤에 바이그램 열을 붙이고, 등장하지 않은 열은 제거
+        unigram_columns, unigram_index = np.unique(unigram_codes, return_inverse=True)
+        terms = np.concatenate([uniques[unigram_columns], np.array(bigrams, dtype=object)])
+        rows = np.concatenate([unigram_docs, docs[:-1][keep]])
+        columns = np.concatenate([unigram_index, pair_index + len(unigram_columns)])
+        
+        matrix = sparse.csr_matrix((np.ones(len(rows), dtype=np.int32), (rows, columns)),
+                                   shape=(num_docs, len(terms)))
+        matrix.sum_duplicates()
+        return cls(matrix, terms, ids)
+    
+    def term_counts(self, ngram=None):
+        """
+        용어별 전체 등장 횟수를 셉니다.
+        
+        Args:
+            ngram (int, optional): 1이면 단어만, 2면 두 단어 문구만 (기본값: 모두)
+        
+        Returns:
+            Counter: 용어 -> 등장 횟수
+        """
+        counts = np.asarray(self.matrix.sum(axis=0)).ravel()
+        mask = counts > 0
+        if ngram is not None:
+            mask &= self.ngram_sizes == ngram
+        return Counter(dict(zip(self.terms[mask].tolist(), counts[mask].tolist())))
+    
+    def document_frequency(self):
+        """
+        용어별로 등장한 스토리 수를 셉니다.
+        
+        Returns:
+            numpy.ndarray: 열 순서의 스토리 수
+        """
+        return np.diff(self.matrix.tocsc().indptr)
+    
+    def top_terms(self, count, ngram=None):
+        """
+        등장 횟수 상위 용어를 반환합니다.
+        
+        Args:
+            count (int): 반환할 용어 수
+            ngram (int, optional): 1이면 단어만, 2면 두 단어 문구만
+        
+        Returns:
+            dict: 용어 -> 등장 횟수 (많은 순)
+        """
+        return dict(self.term_counts(ngram).most_common(count))
+    
+    def story_terms(self, story_id, count=5):
+        """
+        스토리 제목의 주요 용어를 반환합니다. 여러 스토리에 걸쳐 등장하는 용어를 먼저, 두 단어 문구를 단어보다 먼저 둡니다.
+        
+        Args:
+            story_id (int): 스토리 ID
+            count (int): 반환할 용어 수
+        
+        Returns:
+            list: 용어 목록 (행렬에 없는 스토리는 빈 목록)
+        """
+        if self._rows is None:
+            self._rows = {int(story_id): row for row, story_id in enumerate(self.ids.tolist())}
+            self._document_frequency = self.document_frequency()
+        
+        row = self._rows.get(int(story_id))
+        if row is None:
+            return []
+        
+        columns = self.matrix.indices[self.matrix.indptr[row]:self.matrix.indptr[row + 1]]
+        order = np.lexsort((-self.ngram_sizes[columns], -self._document_frequency[columns]))
+        return self.terms[columns[order[:count]]].tolist()
+    
+    def save(self, path):
+        """
+        행렬과 용어 목록을 압축된 .npz 파일 하나에 원자적으로 저장합니다.
+        
+        Args:
+            path (str | Path): 저장할 파일 경로
+        """
+        tmp_path = Path(f"{path}.tmp")
+        
+        with open(tmp_path, 'wb') as f:
+            np.savez_compressed(
+                f,
+                data=self.matrix.data, indices=self.matrix.indices, indptr=self.matrix.indptr,
+                shape=np.array(self.matrix.shape), terms=self.terms.astype(str), ids=self.ids
+            )
+        os.replace(tmp_path, path)
+    
+    @classmethod
+    def load(cls, path):
+        """
+        저장된 행렬을 로드합니다.
+        
+        Args:
+            path (str | Path): 행렬 파일 경로
+        
+        Returns:
+            TermMatrix: 용어 행렬 (파일이 없거나 읽을 수 없으면 None)
+        """
+        try:
+            with np.load(path, allow_pickle=False) as saved:
+                matrix = sparse.csr_matrix((saved['data'], saved['indices'], saved['indptr']),
+                                           shape=tuple(saved['shape']))
+                return cls(matrix, saved['terms'].astype(object), saved['ids'])
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError) as e:
+            print(f"Error loading term matrix from {path}: {e}")
+            return None
+
+def main():
+    """
+    메인 함수: 저장된 용어 행렬의 상위 용어를 출력합니다.
+    """
+    if len(sys.argv) < 2:
+        print("Usage: term_matrix.py <terms_YYYY-MM-DD.npz> [count]")
+        return
+    
+    term_matrix = TermMatrix.load(sys.argv[1])
+    if term_matrix is None:
+        return
+    
+    count = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    print(f"{term_matrix.matrix.shape[0]} stories, {term_matrix.matrix.shape[1]} terms, {term_matrix.matrix.nnz} entries")
+    for ngram, label in ((1, "Words"), (2, "Phrases")):
+        print(f"{label}: {json.dumps(term_matrix.top_terms(count, ngram), ensure_ascii=False)}")
+
+if __name__ == "__main__":
+    main()